@@ -0,0 +1,21 @@
+"""Benchmarks of the Reverso APIs, which are run from the repository root (e.g. python -m benchmarks.bench_context)"""
+
+import importlib.util
+import os
+import sys
+
+TESTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests")
+
+
+def import_test_helper(name):
+    """Imports a helper module from tests/ (e.g. mock_server) without importing the tests package,
+    which would import all the test modules, including the online ones.
+    """
+
+    module = sys.modules.get("tests." + name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location("tests." + name, os.path.join(TESTS_DIR, name + ".py"))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+    return module
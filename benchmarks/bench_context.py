@@ -0,0 +1,95 @@
+"""Measures the Reverso Context API against a local mock server: the construction time, the cost of parsing a page,
+the end-to-end get_examples() throughput with different prefetching, the time to the first example
+with and without streaming, and the throughput of many queries parsed in the fetching threads or in a ParsePool.
+
+Usage:
+    python -m benchmarks.bench_context [latency in seconds] [number of pages]
+"""
+
+import json
+import sys
+import time
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+
+from reverso_api.catalog import CatalogCache
+from reverso_api.context import ContextClient, Query, ReversoContextAPI, _parse_examples
+from reverso_api.pipeline import ParsePool
+
+from . import import_test_helper
+
+mock_server = import_test_helper("mock_server")
+MockReversoServer, _read = mock_server.MockReversoServer, mock_server._read
+
+
+def bench_construction(server, number=20):
+    transport = server.transport()
+
+    def construct(catalog):
+        return ReversoContextAPI("GitHub", "", "en", "ru", transport=transport, catalog=catalog)
+
+    cold = min(timeit.repeat(lambda: construct(CatalogCache()), number=number, repeat=3)) / number
+    catalog = CatalogCache()
+    warm = min(timeit.repeat(lambda: construct(catalog), number=number, repeat=3)) / number
+    print("{:>24}: {:8.2f} ms (cold catalog), {:8.3f} ms (warm catalog)".format("construction", cold * 1e3, warm * 1e3))
+
+
+def bench_parse(number=200):
+    page = json.loads(_read("context", "github_en_ru_1.json"))
+    seconds = min(timeit.repeat(lambda: list(_parse_examples(page)), number=number, repeat=3)) / number
+    print("{:>24}: {:8.2f} us per page ({} examples)".format("page parsing", seconds * 1e6, len(page["list"])))
+
+
+def bench_get_examples(server, prefetches=(0, 2, 4, 8)):
+    catalog = CatalogCache()
+    for prefetch in prefetches:
+        api = ReversoContextAPI("GitHub", "", "en", "ru", transport=server.transport(pool_size=max(prefetch, 1)),
+                                catalog=catalog)
+        started_at = time.perf_counter()
+        nexamples = sum(1 for _ in api.get_examples(prefetch=prefetch))
+        seconds = time.perf_counter() - started_at
+        print("{:>24}: {:8.1f} examples/s, {:8.1f} pages/s".format(
+            "get_examples(prefetch={})".format(prefetch), nexamples / seconds, server.npages / seconds))
+
+
+def bench_first_example(server, number=20):
+    catalog = CatalogCache()
+    transport = server.transport()
+    for stream in (False, True):
+        def first_example():
+            api = ReversoContextAPI("GitHub", "", "en", "ru", transport=transport, catalog=catalog)
+            return next(api.get_examples(stream=stream))
+
+        seconds = min(timeit.repeat(first_example, number=number, repeat=3)) / number
+        print("{:>24}: {:8.2f} ms to the first example".format("get_examples(stream={})".format(stream), seconds * 1e3))
+
+
+def bench_parse_pool(server, nqueries=16, max_workers=8):
+    client = ContextClient(server.transport(pool_size=max_workers), CatalogCache())
+    queries = [Query("word{}".format(i), "", "en", "ru") for i in range(nqueries)]
+
+    with ParsePool() as pool:
+        for parse_pool in (None, pool):
+            def crawl(query):
+                return sum(map(len, client.get_example_batches(query, prefetch=2, parse_pool=parse_pool)))
+
+            started_at = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                nexamples = sum(executor.map(crawl, queries))
+            seconds = time.perf_counter() - started_at
+            print("{:>24}: {:8.1f} examples/s".format("parse_pool={}".format(parse_pool is not None),
+                                                       nexamples / seconds))
+
+
+def main(latency=0.02, npages=20):
+    with MockReversoServer(latency=latency, npages=npages) as server:
+        print("latency: {} s, pages: {}".format(latency, npages))
+        bench_construction(server)
+        bench_parse()
+        bench_get_examples(server)
+        bench_first_example(server)
+        bench_parse_pool(server)
+
+
+if __name__ == "__main__":
+    main(*(float(arg) if i == 0 else int(arg) for i, arg in enumerate(sys.argv[1:])))
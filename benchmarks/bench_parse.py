@@ -0,0 +1,39 @@
+"""Compares the speed of parsing the recorded example pages with the fast <em> extractor and with BeautifulSoup.
+
+Usage:
+    python -m benchmarks.bench_parse
+"""
+
+import glob
+import json
+import os
+import timeit
+
+from reverso_api.context import _parse_context, _parse_context_soup
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "data", "context")
+
+
+def load_markups():
+    markups = []
+    for filename in sorted(glob.glob(os.path.join(DATA_DIR, "*.json"))):
+        with open(filename, "rb") as fp:
+            for example in json.load(fp)["list"]:
+                markups.extend((example["s_text"], example["t_text"]))
+    return markups
+
+
+def main(number=200):
+    markups = load_markups()
+
+    results = {}
+    for name, parse in (("BeautifulSoup", _parse_context_soup), ("fast extractor", _parse_context)):
+        seconds = min(timeit.repeat(lambda: [parse(markup) for markup in markups], number=number, repeat=3))
+        results[name] = seconds / (number * len(markups))
+        print("{:>16}: {:8.2f} us per example".format(name, results[name] * 1e6))
+
+    print("{:>16}: {:8.1f}x".format("speedup", results["BeautifulSoup"] / results["fast extractor"]))
+
+
+if __name__ == "__main__":
+    main()
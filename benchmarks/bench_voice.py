@@ -0,0 +1,39 @@
+"""Measures the latency of fetching phrases from a local mock Reverso Voice server under different concurrency.
+
+Usage:
+    python -m benchmarks.bench_voice [latency in seconds] [number of phrases]
+"""
+
+import statistics
+import sys
+import time
+
+from reverso_api.catalog import CatalogCache
+from reverso_api.voice import synthesize_many
+
+from . import import_test_helper
+
+MockReversoServer = import_test_helper("mock_server").MockReversoServer
+
+
+def bench_synthesize_many(server, nphrases, concurrencies=(1, 4, 16)):
+    catalog = CatalogCache()
+    for max_workers in concurrencies:
+        jobs = [("Phrase number {}".format(i), "Heather22k", 100, lambda mp3_data: None) for i in range(nphrases)]
+        started_at = time.perf_counter()
+        latencies = [result.latency for result in synthesize_many(jobs, max_workers=max_workers, catalog=catalog,
+                                                                   transport=server.transport(pool_size=max_workers))]
+        seconds = time.perf_counter() - started_at
+        print("{:>24}: {:8.1f} phrases/s, latency {:6.1f} ms (median), {:6.1f} ms (max)".format(
+            "max_workers={}".format(max_workers), nphrases / seconds,
+            statistics.median(latencies) * 1e3, max(latencies) * 1e3))
+
+
+def main(latency=0.05, nphrases=48):
+    with MockReversoServer(latency=latency) as server:
+        print("latency: {} s, phrases: {}".format(latency, nphrases))
+        bench_synthesize_many(server, nphrases)
+
+
+if __name__ == "__main__":
+    main(*(float(arg) if i == 0 else int(arg) for i, arg in enumerate(sys.argv[1:])))
@@ -2,7 +2,8 @@
 
 Note: pygame is required for this example to work."""
 
-from reverso_api.voice import ReversoVoiceAPI
+from reverso_api.playback import PlaybackQueue
+from reverso_api.voice import get_voices
 from pprint import pprint
 import random
 
@@ -10,9 +11,8 @@ import random
 print("Reverso.voice API usage example")
 
 print()
-api = ReversoVoiceAPI()
 print("Available Voices:")
-voices = api.voices
+voices = get_voices()
 pprint(voices)
 print()
 
@@ -24,10 +24,12 @@ chinese_voice = random.choice(voices[random.choice(("Mandarin Chinese",))])
 
 print("And now let's say something. English voice is {} and Chinese voice is {}".format(english_voice,
                                                                                           chinese_voice))
-for data in [("The phrase", english_voice),
-             ("能让我来照顾你的小猫咪吗？", chinese_voice, 85),
-             ("is translated from Chinese like", english_voice),
-             ("Can I adopt your little kitten?", english_voice)
-             ]:
-    print(data[0])
-    api.say(*data, wait=True)
\ No newline at end of file
+# the next phrases are downloaded while the current one is being played, so they are spoken without pauses
+with PlaybackQueue() as playback:
+    for data in [("The phrase", english_voice),
+                 ("能让我来照顾你的小猫咪吗？", chinese_voice, 85),
+                 ("is translated from Chinese like", english_voice),
+                 ("Can I adopt your little kitten?", english_voice)
+                 ]:
+        print(data[0])
+        playback.put(*data)
@@ -1,7 +1,47 @@
-"""Reverso.net API for Python"""
+"""Reverso.net API for Python
 
-from .context import *
-from .voice import *
+The submodules (and their dependencies) are imported only when one of their names is accessed for the first time,
+so e.g. the users of the Voice API never import the HTML parsers of the Context API.
+"""
+
+import importlib
+
+_SUBMODULES = {
+    "context": ("ReversoContextAPI", "ContextClient", "Query", "ExampleView", "WordUsageContext", "Translation",
+                "InflectedForm", "LanguageIndex", "get_supported_langs", "get_language_index", "translate_many"),
+    "voice": ("ReversoVoiceAPI", "Voice", "VoiceIndex", "SynthesisJob", "SynthesisResult", "get_voices",
+              "get_voice_index", "synthesize_many"),
+    "transport": ("Transport", "RateLimiter", "AdaptiveConcurrency", "get_default_transport", "set_default_transport"),
+    "catalog": ("CatalogCache", "get_default_catalog", "set_default_catalog"),
+    "cache": ("MemoryCache", "SQLiteCache", "AudioCache", "CacheStats"),
+    "columnar": ("ContextColumn", "ExampleBatch", "TranslationBatch"),
+    "crawler": ("CrawlQuery", "CrawlStats", "CrawlCheckpoint", "JSONLWriter", "ParquetWriter", "Crawler"),
+    "instrumentation": ("Event", "add_hook", "remove_hook", "PrometheusHook", "OpenTelemetryHook"),
+    "singleflight": ("SingleFlight", "AsyncSingleFlight"),
+    "pipeline": ("ParsePool",),
+    "playback": ("PlaybackQueue", "PygameSink", "NullSink"),
+}
+
+_NAMES = {name: submodule for submodule, names in _SUBMODULES.items() for name in names}
+
+__all__ = list(_NAMES)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES or name == "aio":
+        return importlib.import_module("." + name, __name__)  # binds the submodule to the package as well
+
+    submodule = _NAMES.get(name)
+    if submodule is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+    value = getattr(importlib.import_module("." + submodule, __name__), name)
+    globals()[name] = value  # the next lookups don't get here
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES))
 
 
 __author__ = "Demian Volkov"
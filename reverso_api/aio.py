@@ -0,0 +1,430 @@
+"""asyncio counterparts of the Reverso Context and Reverso Voice APIs
+
+Note:
+    aiohttp is necessary for this module to work! You should install it first, otherwise ImportError will be raised.
+"""
+
+import json
+from typing import AsyncGenerator
+
+try:
+    import aiohttp
+except ImportError:
+    raise ImportError("aiohttp is required for the asyncio API, so you should install it first")
+
+from .catalog import get_default_catalog
+from .singleflight import AsyncSingleFlight
+from .context import BASE_URL as CONTEXT_BASE_URL, HEADERS, Translation, LanguageIndex, \
+    _parse_total_pages, _parse_translations, _parse_page_examples, _parse_supported_langs
+from .voice import BASE_URL as VOICE_BASE_URL, Voice, VoiceIndex, _get_voice_stream_url, _parse_voices
+
+__all__ = ["AsyncTransport", "AsyncReversoContextAPI", "AsyncReversoVoiceAPI",
+           "get_supported_langs", "get_voices"]
+
+# concurrent requests for the same page or phrase (from any tasks and API instances) are sent only once
+_page_flights = AsyncSingleFlight()
+_phrase_flights = AsyncSingleFlight()
+
+
+class AsyncTransport(object):
+    """Pooled keep-alive HTTP transport for the asyncio APIs, built on aiohttp.ClientSession.
+
+    Share one AsyncTransport between all the API instances of an event loop, so they all use the same connection pool.
+    The session is created lazily, so the transport must be used from a running event loop.
+
+    Unlike Transport, it has no rate limiting or adaptive concurrency (the pool size is the only limit
+    of the concurrent requests).
+
+    Attributes:
+        session
+
+    Methods:
+        request(method, url, **kwargs)
+        get(url, **kwargs)
+        post(url, **kwargs)
+        close()
+    """
+
+    def __init__(self, pool_size=100, timeout=30, session=None) -> None:
+        """
+        Args:
+            pool_size: The maximum number of simultaneously open connections.
+            timeout: The total timeout of every request in seconds.
+            session: A custom aiohttp.ClientSession. If it is passed, it is used for all the requests as is
+                (so the pool size and timeout settings are ignored).
+        """
+
+        self.__pool_size = pool_size
+        self.__timeout = timeout
+        self.__session = session
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self.__session is None or self.__session.closed:
+            self.__session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.__pool_size),
+                                                   timeout=aiohttp.ClientTimeout(total=self.__timeout))
+        return self.__session
+
+    async def request(self, method, url, **kwargs) -> bytes:
+        """Makes an HTTP request and returns the response body.
+
+        Raises:
+            aiohttp.ClientResponseError: if the response status is 400 or higher.
+        """
+
+        async with self.session.request(method, url, **kwargs) as response:
+            response.raise_for_status()
+            return await response.read()
+
+    async def get(self, url, **kwargs) -> bytes:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url, **kwargs) -> bytes:
+        return await self.request("POST", url, **kwargs)
+
+    async def close(self) -> None:
+        if self.__session is not None:
+            await self.__session.close()
+
+
+async def get_supported_langs(transport, catalog=None) -> dict:
+    """The asyncio counterpart of reverso_api.context.get_supported_langs()."""
+
+    catalog = catalog if catalog is not None else get_default_catalog()
+
+    async def fetch():
+        return _parse_supported_langs(await transport.get(CONTEXT_BASE_URL + "translation/", headers=HEADERS))
+
+    supported_langs = await catalog.aget("supported_langs", fetch)
+    return {attribute: tuple(langs) for attribute, langs in supported_langs.items()}
+
+
+async def get_voices(transport, catalog=None) -> dict:
+    """The asyncio counterpart of reverso_api.voice.get_voices()."""
+
+    catalog = catalog if catalog is not None else get_default_catalog()
+
+    async def fetch():
+        return json.loads(await transport.get(VOICE_BASE_URL + "GetAvailableVoices"))["Voices"]
+
+    return _parse_voices(await catalog.aget("voices", fetch))
+
+
+class AsyncReversoContextAPI(object):
+    """asyncio counterpart of ReversoContextAPI.
+
+    Use the create() coroutine instead of calling the constructor directly, so the supported languages are fetched
+    without blocking the event loop:
+
+        async with AsyncTransport() as transport:
+            api = await AsyncReversoContextAPI.create("hello", "", "en", "ru", transport=transport)
+            async for source, target in api.get_examples():
+                ...
+
+    If no transport is passed, the API creates its own one, which is closed by aclose() (or by `async with api:`).
+
+    Attributes:
+        supported_langs
+        source_text
+        target_text
+        source_lang
+        target_lang
+        transport
+
+    Methods:
+        create(...)
+        total_pages()
+        get_translations()
+        get_examples()
+        swap_langs()
+        aclose()
+    """
+
+    def __init__(self,
+                 source_text="пример",
+                 target_text="",
+                 source_lang="ru",
+                 target_lang="en",
+                 transport=None,
+                 supported_langs=None) -> None:
+        if supported_langs is None:
+            raise ValueError("supported_langs are required; use 'await AsyncReversoContextAPI.create(...)' instead")
+
+        self.__owns_transport = transport is None
+        self.__transport = transport if transport is not None else AsyncTransport()
+
+        self.__data = dict.fromkeys(("source_text", "target_text", "source_lang", "target_lang"))
+        self.__langs = LanguageIndex(supported_langs)
+        self.supported_langs = supported_langs
+
+        self.source_text, self.target_text = source_text, target_text
+        self.source_lang, self.target_lang = source_lang, target_lang
+
+    @classmethod
+    async def create(cls,
+                     source_text="пример",
+                     target_text="",
+                     source_lang="ru",
+                     target_lang="en",
+                     transport=None,
+                     catalog=None):
+        owns_transport, transport = transport is None, transport if transport is not None else AsyncTransport()
+        try:
+            supported_langs = await get_supported_langs(transport, catalog)
+            api = cls(source_text, target_text, source_lang, target_lang, transport, supported_langs)
+        except BaseException:
+            if owns_transport:
+                await transport.close()
+            raise
+        api.__owns_transport = owns_transport
+        return api
+
+    def __repr__(self) -> str:
+        return ("AsyncReversoContextAPI({0.source_text!r}, {0.target_text!r}, "
+                "{0.source_lang!r}, {0.target_lang!r})").format(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the transport if it was created by the API (a passed transport is left open for its owner)."""
+
+        if self.__owns_transport:
+            await self.__transport.close()
+
+    @property
+    def source_text(self) -> str:
+        return self.__data["source_text"]
+
+    @property
+    def target_text(self) -> str:
+        return self.__data["target_text"]
+
+    @property
+    def source_lang(self) -> str:
+        return self.__data["source_lang"]
+
+    @property
+    def target_lang(self) -> str:
+        return self.__data["target_lang"]
+
+    @property
+    def transport(self):
+        return self.__transport
+
+    async def __fetch_page(self, data, npage) -> dict:
+        async def fetch():
+            body = await self.__transport.post(CONTEXT_BASE_URL + "bst-query-service",
+                                               headers=HEADERS,
+                                               data=json.dumps(dict(data, npage=npage)))
+            return json.loads(body)
+
+        key = (id(self.__transport), data["source_text"], data["target_text"], data["source_lang"],
+               data["target_lang"], npage)
+        return await _page_flights.do(key, fetch)
+
+    async def total_pages(self) -> int:
+        return _parse_total_pages(await self.__fetch_page(self.__data, 1))
+
+    async def get_translations(self) -> AsyncGenerator[Translation, None]:
+        """The asyncio counterpart of ReversoContextAPI.get_translations() (use it with async for)."""
+
+        data = dict(self.__data)
+        for translation in _parse_translations(await self.__fetch_page(data, 1), data["source_text"]):
+            yield translation
+
+    async def get_examples(self) -> AsyncGenerator[tuple, None]:
+        """The asyncio counterpart of ReversoContextAPI.get_examples() (use it with async for).
+
+        The query is copied when the iteration starts, so changing the attributes during it has no effect.
+        """
+
+        data = dict(self.__data)
+
+        page_json = await self.__fetch_page(data, 1)
+        total_pages = _parse_total_pages(page_json)
+
+        npage = 1
+        while npage <= total_pages:
+            for example in _parse_page_examples(page_json):
+                yield example
+
+            npage += 1
+            if npage <= total_pages:
+                page_json = await self.__fetch_page(data, npage)
+
+    @source_text.setter
+    def source_text(self, value) -> None:
+        self.__data["source_text"] = str(value)
+
+    @target_text.setter
+    def target_text(self, value) -> None:
+        self.__data["target_text"] = str(value)
+
+    @source_lang.setter
+    def source_lang(self, value) -> None:
+        value = str(value)
+
+        if value not in self.__langs.source_langs:
+            raise ValueError(f"{value!r} source language is not supported")
+
+        if value == self.target_lang:
+            raise ValueError(f"source language cannot be equal to the target language")
+
+        self.__data["source_lang"] = value
+
+    @target_lang.setter
+    def target_lang(self, value) -> None:
+        value = str(value)
+
+        if value not in self.__langs.target_langs:
+            raise ValueError(f"{value!r} target language is not supported")
+
+        if value == self.source_lang:
+            raise ValueError(f"target language cannot be equal to the source language")
+
+        self.__data["target_lang"] = value
+
+    def swap_langs(self) -> None:
+        self.__data["source_lang"], self.__data["target_lang"] = self.__data["target_lang"], \
+                                                                 self.__data["source_lang"]
+
+
+class AsyncReversoVoiceAPI:
+    """asyncio counterpart of ReversoVoiceAPI.
+
+    Use the create() coroutine instead of calling the constructor directly, so the available voices are fetched
+    without blocking the event loop. If no transport is passed, the API creates its own one, which is closed
+    by aclose() (or by `async with api:`).
+
+    Attributes:
+        text
+        voice
+        speed
+        voices
+        transport
+
+    Methods:
+        create(...)
+        mp3_data()
+        write_to_file(file)
+        aclose()
+    """
+
+    def __init__(self, text, voice, speed=100, transport=None, voices=None):
+        if voices is None:
+            raise ValueError("voices are required; use 'await AsyncReversoVoiceAPI.create(...)' instead")
+
+        self.__owns_transport = transport is None
+        self.__transport = transport if transport is not None else AsyncTransport()
+
+        self.__voices = voices
+        self.__voice_index = VoiceIndex(voices)
+
+        self.__text, self.__voice, self.__speed = None, None, None
+        self.__mp3_data = None
+        self.text, self.voice, self.speed = text, voice, speed
+
+    @classmethod
+    async def create(cls, text, voice, speed=100, transport=None, catalog=None):
+        owns_transport, transport = transport is None, transport if transport is not None else AsyncTransport()
+        try:
+            voices = await get_voices(transport, catalog)
+            api = cls(text, voice, speed, transport, voices)
+        except BaseException:
+            if owns_transport:
+                await transport.close()
+            raise
+        api.__owns_transport = owns_transport
+        return api
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the transport if it was created by the API (a passed transport is left open for its owner)."""
+
+        if self.__owns_transport:
+            await self.__transport.close()
+
+    @property
+    def text(self):
+        return self.__text
+
+    @property
+    def voice(self):
+        return self.__voice
+
+    @property
+    def speed(self):
+        return self.__speed
+
+    @property
+    def voices(self):
+        return self.__voices
+
+    @property
+    def transport(self):
+        return self.__transport
+
+    async def mp3_data(self):
+        """The asyncio counterpart of ReversoVoiceAPI.mp3_data (the result is memoized in the same way)."""
+
+        if self.__mp3_data is not None:
+            return self.__mp3_data
+
+        phrase = (self.voice, self.speed, self.text)
+        url = _get_voice_stream_url(*phrase)
+        mp3_data = await _phrase_flights.do((id(self.__transport), url), lambda: self.__transport.get(url))
+        if phrase == (self.voice, self.speed, self.text):  # the setters may run while the phrase is being fetched
+            self.__mp3_data = mp3_data
+        return mp3_data
+
+    @text.setter
+    def text(self, value):
+        assert isinstance(value, str), "text must be a string"
+        self.__text = value
+        self.__mp3_data = None
+
+    @voice.setter
+    def voice(self, value):
+        if isinstance(value, Voice):
+            value = value.name
+        assert value in self.__voice_index, "invalid voice"
+        self.__voice = value
+        self.__mp3_data = None
+
+    @speed.setter
+    def speed(self, value):
+        assert isinstance(value, int), "speed must be an integer"
+        assert 30 <= value <= 300, "speed must be 30 <= speed <= 300"
+        self.__speed = value
+        self.__mp3_data = None
+
+    async def write_to_file(self, file):
+        """The asyncio counterpart of ReversoVoiceAPI.write_to_file().
+
+        Raises:
+            TypeError: if not filename (string) or a file-like object is passed as a file argument.
+        """
+
+        if isinstance(file, str):
+            with open(file, "wb") as fp:
+                fp.write(await self.mp3_data())
+            return
+        if hasattr(file, "write"):
+            file.write(await self.mp3_data())
+            return
+        raise TypeError("string or file-like object is required instead of {}".format(type(file)))
@@ -0,0 +1,318 @@
+"""Response caches for the Reverso APIs
+
+Any object with get(key) and set(key, value) methods can be used as a cache. The keys are tuples of strings
+and integers, the values are strings (the raw responses).
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+__all__ = ["MemoryCache", "SQLiteCache", "AudioCache", "CacheStats"]
+
+# size is the number of entries in every cache; bytes is their total size (None if the cache does not track it)
+CacheStats = namedtuple("CacheStats", ("hits", "misses", "size", "bytes"), defaults=(None,))
+
+
+class MemoryCache(object):
+    """In-memory LRU cache with a TTL.
+
+    Attributes:
+        maxsize
+        ttl
+        stats
+
+    Methods:
+        get(key)
+        set(key, value)
+        clear()
+    """
+
+    def __init__(self, maxsize=1024, ttl=None) -> None:
+        """
+        Args:
+            maxsize: The maximum number of entries; the least recently used ones are evicted first.
+            ttl: How many seconds an entry stays valid (None means forever).
+        """
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        self.__entries = OrderedDict()
+        self.__hits = self.__misses = 0
+        self.__lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return "{}(maxsize={!r}, ttl={!r})".format(type(self).__name__, self.maxsize, self.ttl)
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(self.__hits, self.__misses, len(self.__entries))
+
+    def get(self, key):
+        """Returns the cached value or None if there is no such (valid) entry."""
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and self.ttl is not None and time.time() - entry[0] >= self.ttl:
+                del self.__entries[key]
+                entry = None
+
+            if entry is None:
+                self.__misses += 1
+                return None
+
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return entry[1]
+
+    def set(self, key, value) -> None:
+        with self.__lock:
+            self.__entries[key] = (time.time(), value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.__hits = self.__misses = 0
+
+
+class SQLiteCache(object):
+    """On-disk LRU cache with a TTL, stored in an SQLite database, so it survives restarts
+    and can be shared by several processes.
+
+    Attributes:
+        path
+        maxsize
+        ttl
+        stats
+
+    Methods:
+        get(key)
+        set(key, value)
+        clear()
+        close()
+    """
+
+    def __init__(self, path, maxsize=100000, ttl=7 * 24 * 60 * 60) -> None:
+        """
+        Args:
+            path: The database filename.
+            maxsize: The maximum number of entries; the least recently used ones are evicted first
+                (the cache may temporarily exceed it by 1%).
+            ttl: How many seconds an entry stays valid (None means forever).
+        """
+
+        self.path = path
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        self.__hits = self.__misses = 0
+        self.__insertions = 0
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.__connection.execute("CREATE TABLE IF NOT EXISTS responses "
+                                  "(key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                                  "created REAL NOT NULL, accessed REAL NOT NULL)")
+        self.__connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+
+    def __repr__(self) -> str:
+        return "{}({!r}, maxsize={!r}, ttl={!r})".format(type(self).__name__, self.path, self.maxsize, self.ttl)
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return self.__connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @property
+    def stats(self) -> CacheStats:
+        with self.__lock:
+            size, nbytes = self.__connection.execute("SELECT COUNT(*), TOTAL(LENGTH(CAST(value AS BLOB))) "
+                                                     "FROM responses").fetchone()
+        return CacheStats(self.__hits, self.__misses, size, int(nbytes))
+
+    def get(self, key):
+        """Returns the cached value or None if there is no such (valid) entry."""
+
+        key, now = json.dumps(key, ensure_ascii=False), time.time()
+
+        with self.__lock:
+            row = self.__connection.execute("SELECT value, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None and self.ttl is not None and now - row[1] >= self.ttl:
+                self.__connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                row = None
+
+            if row is None:
+                self.__misses += 1
+                return None
+
+            self.__connection.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self.__hits += 1
+            return row[0]
+
+    def set(self, key, value) -> None:
+        key, now = json.dumps(key, ensure_ascii=False), time.time()
+
+        with self.__lock:
+            self.__connection.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)", (key, value, now, now))
+
+            # the eviction query scans the index, so it is run once per 1% of maxsize insertions
+            self.__insertions += 1
+            if self.__insertions < max(1, self.maxsize // 100):
+                return
+            self.__insertions = 0
+            self.__connection.execute("DELETE FROM responses WHERE key IN "
+                                      "(SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                                      (self.maxsize,))
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__connection.execute("DELETE FROM responses")
+            self.__hits = self.__misses = 0
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__connection.close()
+
+
+class AudioCache(object):
+    """On-disk content-addressed cache of the spoken phrases with a size cap and LRU eviction.
+
+    Every phrase is stored in its own MP3 file named after the SHA-256 hash of (voice, speed, text),
+    so the cached files can be served (e.g. played or copied) right from the disk.
+
+    Attributes:
+        directory
+        maxsize
+        stats
+
+    Methods:
+        get_path(voice, speed, text)
+        open(voice, speed, text)
+        set(voice, speed, text, mp3_data)
+        writer(voice, speed, text)
+        clear()
+    """
+
+    def __init__(self, directory, maxsize=512 * 1024 * 1024) -> None:
+        """
+        Args:
+            directory: The directory to store the MP3 files in (it is created if it does not exist).
+            maxsize: The maximum total size of the files in bytes; the least recently used ones are evicted first.
+        """
+
+        self.directory = directory
+        self.maxsize = maxsize
+
+        os.makedirs(directory, exist_ok=True)
+
+        self.__hits = self.__misses = 0
+        self.__lock = threading.Lock()
+        sizes = [entry.stat().st_size for entry in self.__scan()]
+        self.__count, self.__size = len(sizes), sum(sizes)
+
+    def __repr__(self) -> str:
+        return "{}({!r}, maxsize={!r})".format(type(self).__name__, self.directory, self.maxsize)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.__scan())
+
+    def __scan(self):
+        with os.scandir(self.directory) as entries:
+            yield from (entry for entry in entries if entry.name.endswith(".mp3") and entry.is_file())
+
+    def __filename(self, voice, speed, text) -> str:
+        digest = hashlib.sha256("{}\0{}\0{}".format(voice, speed, text).encode()).hexdigest()
+        return os.path.join(self.directory, digest + ".mp3")
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(self.__hits, self.__misses, self.__count, self.__size)
+
+    def get_path(self, voice, speed, text):
+        """Returns the filename of the cached phrase or None if it is not cached."""
+
+        filename = self.__filename(voice, speed, text)
+        try:
+            os.utime(filename)  # the modification time is used as the access time for the LRU eviction
+        except FileNotFoundError:
+            self.__misses += 1
+            return None
+        self.__hits += 1
+        return filename
+
+    def open(self, voice, speed, text):
+        """Returns the cached phrase opened as a binary file or None if it is not cached."""
+
+        filename = self.get_path(voice, speed, text)
+        if filename is None:
+            return None
+        try:
+            return open(filename, "rb")
+        except FileNotFoundError:  # evicted by another process in the meantime
+            return None
+
+    def set(self, voice, speed, text, mp3_data) -> None:
+        with self.writer(voice, speed, text) as fp:
+            fp.write(mp3_data)
+
+    @contextlib.contextmanager
+    def writer(self, voice, speed, text):
+        """A context manager, which yields a binary file to write the phrase to chunk by chunk.
+
+        The phrase appears in the cache only when the context manager exits without an exception,
+        so incomplete downloads are never served.
+        """
+
+        filename = self.__filename(voice, speed, text)
+        tmp_filename = "{}.{}.{}.tmp".format(filename, os.getpid(), threading.get_ident())
+        try:
+            with open(tmp_filename, "wb") as fp:
+                yield fp
+        except BaseException:
+            os.remove(tmp_filename)
+            raise
+        self.__commit(tmp_filename, filename)
+
+    def __commit(self, tmp_filename, filename) -> None:
+        with self.__lock:
+            try:
+                self.__size -= os.path.getsize(filename)
+            except FileNotFoundError:
+                self.__count += 1
+            os.replace(tmp_filename, filename)
+            self.__size += os.path.getsize(filename)
+
+            if self.__size > self.maxsize:
+                self.__evict()
+
+    def __evict(self) -> None:
+        for entry in sorted(self.__scan(), key=lambda entry: entry.stat().st_mtime):
+            if self.__size <= self.maxsize:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+            except FileNotFoundError:
+                continue
+            self.__count -= 1
+            self.__size -= size
+
+    def clear(self) -> None:
+        with self.__lock:
+            for entry in self.__scan():
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+            self.__count = self.__size = 0
+            self.__hits = self.__misses = 0
@@ -0,0 +1,175 @@
+"""Process-wide cache of the Reverso catalogs (supported languages, available voices)"""
+
+import json
+import os
+import threading
+import time
+
+__all__ = ["CatalogCache", "get_default_catalog", "set_default_catalog"]
+
+
+class CatalogCache(object):
+    """Cache for the catalogs, which are the same for all the API instances, but are expensive to fetch.
+
+    A catalog is looked up in the following order:
+        1. the in-memory cache (if the entry is not older than ttl seconds);
+        2. the JSON file at path (if the path is specified and the entry is not older than ttl seconds);
+        3. the static snapshot (if specified; snapshot entries never expire);
+        4. the network (the fetched value is stored both in memory and in the file).
+
+    All the cached values must be JSON-serializable.
+
+    Attributes:
+        ttl
+        path
+
+    Methods:
+        get(name, fetch)
+        aget(name, fetch)
+        save_snapshot(path)
+        clear()
+    """
+
+    def __init__(self, ttl=24 * 60 * 60, path=None, snapshot=None) -> None:
+        """
+        Args:
+            ttl: How many seconds the fetched catalogs stay valid (None means forever).
+            path: The JSON file, which the fetched catalogs are persisted to.
+            snapshot: Either a filename of a static snapshot (see save_snapshot()) or a dict of catalogs.
+                If a catalog is in the snapshot, it is never fetched from the network.
+        """
+
+        self.ttl = ttl
+        self.path = path
+
+        if isinstance(snapshot, str):
+            with open(snapshot, "r", encoding="utf-8") as fp:
+                snapshot = json.load(fp)
+        self.__snapshot = dict(snapshot or {})
+
+        self.__entries = {}
+        self.__disk_loaded = False
+        self.__lock = threading.RLock()
+
+    def __repr__(self) -> str:
+        return "{}(ttl={!r}, path={!r})".format(type(self).__name__, self.ttl, self.path)
+
+    def __is_fresh(self, entry) -> bool:
+        return self.ttl is None or time.time() - entry["fetched_at"] < self.ttl
+
+    def __load_disk(self) -> None:
+        self.__disk_loaded = True
+        if self.path is None or not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as fp:
+                entries = json.load(fp)
+        except (OSError, ValueError):
+            return  # a corrupted cache file is just ignored and overwritten later
+
+        for name, entry in entries.items():
+            if name not in self.__entries and self.__is_fresh(entry):
+                self.__entries[name] = entry
+
+    def __save_disk(self) -> None:
+        if self.path is None:
+            return
+
+        tmp_path = "{}.{}.tmp".format(self.path, os.getpid())
+        with open(tmp_path, "w", encoding="utf-8") as fp:
+            json.dump(self.__entries, fp, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def __lookup(self, name) -> tuple:
+        with self.__lock:
+            if not self.__disk_loaded:
+                self.__load_disk()
+
+            entry = self.__entries.get(name)
+            if entry is not None and self.__is_fresh(entry):
+                return True, entry["value"]
+
+            if name in self.__snapshot:
+                return True, self.__snapshot[name]
+
+            return False, None
+
+    def __store(self, name, value) -> None:
+        with self.__lock:
+            self.__entries[name] = {"fetched_at": time.time(), "value": value}
+            self.__save_disk()
+
+    def get(self, name, fetch):
+        """Returns the catalog with the given name.
+
+        Args:
+            name: The name of the catalog (e.g. "supported_langs" or "voices").
+            fetch: A callable without arguments, which downloads the catalog if it is not cached.
+
+        Returns:
+            The cached or freshly fetched catalog.
+        """
+
+        with self.__lock:  # concurrent threads wait for the first fetch instead of repeating it
+            found, value = self.__lookup(name)
+            if not found:
+                value = fetch()
+                self.__store(name, value)
+            return value
+
+    async def aget(self, name, fetch):
+        """The same as get(), but fetch is a coroutine function.
+
+        The lock is not held while fetching, so the event loop is never blocked.
+        """
+
+        found, value = self.__lookup(name)
+        if not found:
+            value = await fetch()
+            self.__store(name, value)
+        return value
+
+    def save_snapshot(self, path) -> None:
+        """Writes all the currently cached catalogs to a JSON file, which can be passed as a snapshot later."""
+
+        with self.__lock:
+            catalogs = dict(self.__snapshot)
+            catalogs.update((name, entry["value"]) for name, entry in self.__entries.items())
+
+        with open(path, "w", encoding="utf-8") as fp:
+            json.dump(catalogs, fp, ensure_ascii=False, indent=2)
+
+    def clear(self) -> None:
+        """Drops the in-memory entries (the file and the snapshot are left untouched)."""
+
+        with self.__lock:
+            self.__entries.clear()
+            self.__disk_loaded = True
+
+
+_default_catalog = None
+_default_catalog_lock = threading.Lock()
+
+
+def get_default_catalog() -> CatalogCache:
+    """Returns the process-wide CatalogCache, which is used when no catalog is passed to an API constructor."""
+
+    global _default_catalog
+
+    with _default_catalog_lock:
+        if _default_catalog is None:
+            _default_catalog = CatalogCache()
+        return _default_catalog
+
+
+def set_default_catalog(catalog) -> None:
+    """Replaces the process-wide CatalogCache (e.g. to persist it to disk or to use a static snapshot)."""
+
+    global _default_catalog
+
+    if not isinstance(catalog, CatalogCache):
+        raise TypeError("CatalogCache is required instead of {}".format(type(catalog)))
+
+    with _default_catalog_lock:
+        _default_catalog = catalog
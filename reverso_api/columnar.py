@@ -0,0 +1,307 @@
+"""Compact columnar containers for the Reverso Context results
+
+A batch keeps all the texts of a column in one string buffer and all the offsets in arrays of unsigned integers,
+instead of a namedtuple with nested tuples per example, so it takes a fraction of the memory and can be exported
+to NumPy or Arrow for vectorized analysis.
+
+Example:
+    examples = ExampleBatch(api.get_examples())  # or api.get_example_batches() for a batch per page
+    translations = TranslationBatch(api.get_translations())
+
+Note:
+    NumPy and pyarrow are optional: they are only imported by to_numpy() and to_arrow() respectively.
+"""
+
+from array import array
+
+from .context import WordUsageContext, Translation, InflectedForm
+
+__all__ = ["ContextColumn", "ExampleBatch", "TranslationBatch"]
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("numpy is required for exporting to NumPy arrays, so you should install it first")
+    return numpy
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("pyarrow is required for exporting to Arrow, so you should install it first")
+    return pyarrow
+
+
+class ContextColumn(object):
+    """A column of WordUsageContext namedtuples.
+
+    The text of the i-th context is text[text_offsets[i]:text_offsets[i + 1]], and its highlighted parts are
+    (highlight_starts[j], highlight_ends[j]) for j in range(highlight_offsets[i], highlight_offsets[i + 1])
+    (relatively to the context text, the same as in WordUsageContext).
+
+    Attributes:
+        text
+        text_offsets
+        highlight_offsets
+        highlight_starts
+        highlight_ends
+        nbytes
+
+    Methods:
+        append(context)
+        to_numpy()
+        to_arrow()
+    """
+
+    def __init__(self, contexts=()) -> None:
+        self.__texts = []
+        self.__text = None
+
+        self.text_offsets = array("I", (0,))
+        self.highlight_offsets = array("I", (0,))
+        self.highlight_starts = array("I")
+        self.highlight_ends = array("I")
+
+        for context in contexts:
+            self.append(context)
+
+    def __repr__(self) -> str:
+        return "{}(<{} contexts>)".format(type(self).__name__, len(self))
+
+    def __len__(self) -> int:
+        return len(self.text_offsets) - 1
+
+    def __getitem__(self, i) -> WordUsageContext:
+        i = range(len(self))[i]
+        text = self.text[self.text_offsets[i]:self.text_offsets[i + 1]]
+        highlighted = tuple(zip(self.highlight_starts[self.highlight_offsets[i]:self.highlight_offsets[i + 1]],
+                                self.highlight_ends[self.highlight_offsets[i]:self.highlight_offsets[i + 1]]))
+        return WordUsageContext(text, highlighted)
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def __getstate__(self) -> dict:
+        self.__join_texts()  # the column is pickled as one string and four arrays
+        return self.__dict__
+
+    @property
+    def text(self) -> str:
+        """The texts of all the contexts joined into one string."""
+
+        self.__join_texts()
+        return self.__text or ""
+
+    def __join_texts(self) -> None:
+        if self.__texts:
+            self.__text = (self.__text or "") + "".join(self.__texts)
+            self.__texts.clear()
+
+    @property
+    def nbytes(self) -> int:
+        """The approximate memory footprint of the column in bytes."""
+
+        arrays = (self.text_offsets, self.highlight_offsets, self.highlight_starts, self.highlight_ends)
+        return len(self.text.encode()) + sum(len(a) * a.itemsize for a in arrays)
+
+    def append(self, context) -> None:
+        text, highlighted = context
+        self.__texts.append(text)
+        self.text_offsets.append(self.text_offsets[-1] + len(text))
+        for start, end in highlighted:
+            self.highlight_starts.append(start)
+            self.highlight_ends.append(end)
+        self.highlight_offsets.append(len(self.highlight_starts))
+
+    def to_numpy(self) -> dict:
+        """Returns the column as a dict of NumPy arrays: "text" (a unicode array with a context per element)
+        and the offsets arrays, which are named the same as the attributes of the column.
+        """
+
+        numpy = _import_numpy()
+
+        text = self.text
+        return {
+            "text": numpy.array([text[start:end] for start, end in zip(self.text_offsets, self.text_offsets[1:])],
+                                dtype=str),
+            **{name: numpy.frombuffer(getattr(self, name), dtype=numpy.uintc).copy()
+               for name in ("text_offsets", "highlight_offsets", "highlight_starts", "highlight_ends")},
+        }
+
+    def to_arrow(self) -> tuple:
+        """Returns the column as a (texts, highlighted) tuple of Arrow arrays: a string array and a list array
+        of {"start", "end"} structs.
+        """
+
+        pyarrow = _import_pyarrow()
+
+        text = self.text
+        texts = pyarrow.array([text[start:end] for start, end in zip(self.text_offsets, self.text_offsets[1:])],
+                              type=pyarrow.string())
+        highlights = pyarrow.StructArray.from_arrays(
+            [pyarrow.array(self.highlight_starts, type=pyarrow.uint32()),
+             pyarrow.array(self.highlight_ends, type=pyarrow.uint32())],
+            names=["start", "end"])
+        highlighted = pyarrow.ListArray.from_arrays(pyarrow.array(self.highlight_offsets, type=pyarrow.int32()),
+                                                    highlights)
+        return texts, highlighted
+
+
+class ExampleBatch(object):
+    """A batch of usage examples (pairs of WordUsageContext namedtuples), stored as two ContextColumns.
+
+    Iterating and indexing a batch gives the same pairs as ReversoContextAPI.get_examples() does.
+
+    Attributes:
+        source
+        target
+        nbytes
+
+    Methods:
+        append(example)
+        to_numpy()
+        to_arrow()
+    """
+
+    def __init__(self, examples=()) -> None:
+        self.source = ContextColumn()
+        self.target = ContextColumn()
+
+        for example in examples:
+            self.append(example)
+
+    def __repr__(self) -> str:
+        return "{}(<{} examples>)".format(type(self).__name__, len(self))
+
+    def __len__(self) -> int:
+        return len(self.source)
+
+    def __getitem__(self, i) -> tuple:
+        return self.source[i], self.target[i]
+
+    def __iter__(self):
+        return zip(self.source, self.target)
+
+    @property
+    def nbytes(self) -> int:
+        return self.source.nbytes + self.target.nbytes
+
+    def append(self, example) -> None:
+        source, target = example
+        self.source.append(source)
+        self.target.append(target)
+
+    def to_numpy(self) -> dict:
+        """Returns the batch as a dict of NumPy arrays, prefixed with "source_" and "target_" (see ContextColumn)."""
+
+        return {"{}_{}".format(side, name): values
+                for side, column in (("source", self.source), ("target", self.target))
+                for name, values in column.to_numpy().items()}
+
+    def to_arrow(self):
+        """Returns the batch as a pyarrow.RecordBatch with the "source_text", "source_highlighted",
+        "target_text" and "target_highlighted" columns.
+        """
+
+        pyarrow = _import_pyarrow()
+
+        source_texts, source_highlighted = self.source.to_arrow()
+        target_texts, target_highlighted = self.target.to_arrow()
+        return pyarrow.RecordBatch.from_arrays(
+            [source_texts, source_highlighted, target_texts, target_highlighted],
+            names=["source_text", "source_highlighted", "target_text", "target_highlighted"])
+
+
+class TranslationBatch(object):
+    """A batch of Translation namedtuples, stored column by column.
+
+    The inflected forms of the i-th translation are the ones in range(inflected_offsets[i], inflected_offsets[i + 1])
+    of the inflected_translations and inflected_frequencies columns.
+
+    Attributes:
+        source_words
+        translations
+        frequencies
+        parts_of_speech
+        inflected_offsets
+        inflected_translations
+        inflected_frequencies
+
+    Methods:
+        append(translation)
+        to_numpy()
+        to_arrow()
+    """
+
+    def __init__(self, translations=()) -> None:
+        self.source_words = []
+        self.translations = []
+        self.frequencies = array("I")
+        self.parts_of_speech = []
+        self.inflected_offsets = array("I", (0,))
+        self.inflected_translations = []
+        self.inflected_frequencies = array("I")
+
+        for translation in translations:
+            self.append(translation)
+
+    def __repr__(self) -> str:
+        return "{}(<{} translations>)".format(type(self).__name__, len(self))
+
+    def __len__(self) -> int:
+        return len(self.translations)
+
+    def __getitem__(self, i) -> Translation:
+        i = range(len(self))[i]
+        forms = range(self.inflected_offsets[i], self.inflected_offsets[i + 1])
+        return Translation(self.source_words[i], self.translations[i], self.frequencies[i], self.parts_of_speech[i],
+                           tuple(InflectedForm(self.inflected_translations[j], self.inflected_frequencies[j])
+                                 for j in forms))
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def append(self, translation) -> None:
+        source_word, translation, frequency, part_of_speech, inflected_forms = translation
+        self.source_words.append(source_word)
+        self.translations.append(translation)
+        self.frequencies.append(frequency)
+        self.parts_of_speech.append(part_of_speech)
+        for form in inflected_forms:
+            self.inflected_translations.append(form.translation)
+            self.inflected_frequencies.append(form.frequency)
+        self.inflected_offsets.append(len(self.inflected_translations))
+
+    def to_numpy(self):
+        """Returns the batch as a NumPy structured array with the "source_word", "translation", "frequency"
+        and "part_of_speech" fields (the inflected forms are not exported).
+        """
+
+        numpy = _import_numpy()
+
+        return numpy.array(list(zip(self.source_words, self.translations, self.frequencies, self.parts_of_speech)),
+                           dtype=[("source_word", object), ("translation", object),
+                                  ("frequency", numpy.uint32), ("part_of_speech", object)])
+
+    def to_arrow(self):
+        """Returns the batch as a pyarrow.RecordBatch with the "source_word", "translation", "frequency",
+        "part_of_speech" and "inflected_forms" (a list of {"translation", "frequency"} structs) columns.
+        """
+
+        pyarrow = _import_pyarrow()
+
+        inflected_forms = pyarrow.ListArray.from_arrays(
+            pyarrow.array(self.inflected_offsets, type=pyarrow.int32()),
+            pyarrow.StructArray.from_arrays([pyarrow.array(self.inflected_translations, type=pyarrow.string()),
+                                             pyarrow.array(self.inflected_frequencies, type=pyarrow.uint32())],
+                                            names=["translation", "frequency"]))
+        return pyarrow.RecordBatch.from_arrays(
+            [pyarrow.array(self.source_words, type=pyarrow.string()),
+             pyarrow.array(self.translations, type=pyarrow.string()),
+             pyarrow.array(self.frequencies, type=pyarrow.uint32()),
+             pyarrow.array(self.parts_of_speech, type=pyarrow.string()),
+             inflected_forms],
+            names=["source_word", "translation", "frequency", "part_of_speech", "inflected_forms"])
@@ -1,18 +1,31 @@
 """Reverso Context (context.reverso.net) API for Python"""
 
+import codecs
+import html
+import itertools
 import json
-from collections import namedtuple
+import re
+import time
+from collections import deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Generator
 
-import requests
-from bs4 import BeautifulSoup
+from . import instrumentation
+from .catalog import get_default_catalog
+from .singleflight import SingleFlight
+from .transport import get_default_transport
 
-__all__ = ["ReversoContextAPI", "WordUsageContext", "Translation", "InflectedForm"]
+__all__ = ["ReversoContextAPI", "ContextClient", "Query", "ExampleView", "WordUsageContext", "Translation",
+           "InflectedForm", "LanguageIndex", "get_supported_langs", "get_language_index", "translate_many"]
+
+BASE_URL = "https://context.reverso.net/"
 
 HEADERS = {"User-Agent": "Mozilla/5.0",
            "Content-Type": "application/json; charset=UTF-8"
            }
 
+STREAM_CHUNK_SIZE = 16 * 1024  # the bytes read at a time from a streamed page
+
 WordUsageContext = namedtuple("WordUsageContext",
                               ("text", "highlighted"))
 
@@ -22,21 +35,842 @@ Translation = namedtuple("Translation",
 InflectedForm = namedtuple("InflectedForm",
                            ("translation", "frequency"))
 
+# concurrent requests for the same page (from any threads and API instances) are sent only once
+_page_flights = SingleFlight()
+
+_EM_TAGS_RE = re.compile("<(/?)em>")
+_ENTITY_RE = re.compile("&(?:[a-zA-Z][a-zA-Z0-9]*|#[0-9]+|#[xX][0-9a-fA-F]+);")
+
+
+def _find_highlighted_idxs(soup, tag="em") -> tuple:
+    """Finds indexes of the parts of the soup surrounded by a particular HTML tag
+    relatively to the soup without the tag.
+
+    Example:
+        soup = BeautifulSoup("<em>This</em> is <em>a sample</em> string")
+        tag = "em"
+        Returns: [(0, 4), (8, 16)]
+
+    Args:
+        soup: The BeautifulSoup's soup.
+        tag: The HTML tag, which surrounds the parts of the soup.
+
+    Returns:
+          A list of the tuples, which contain start and end indexes of the soup parts,
+          surrounded by tags.
+
+    """
+
+    # source: https://stackoverflow.com/a/62027247/8661764
+
+    cur, idxs = 0, []
+    for t in soup.find_all(text=True):
+        if t.parent.name == tag:
+            idxs.append((cur, cur + len(t)))
+        cur += len(t)
+    return tuple(idxs)
+
+
+def _parse_context(markup, tag="em") -> WordUsageContext:
+    """Parses a word usage example with highlighted parts into a WordUsageContext.
+
+    Reverso marks the highlighted parts with plain <em>...</em> tags, so they are extracted with a single regex split
+    instead of building a BeautifulSoup document. The result is the same as the one of BeautifulSoup with lxml.
+    Any other markup (unknown or nested tags, malformed entities etc.) is parsed with BeautifulSoup.
+
+    Example:
+        markup = "<em>This</em> is <em>a sample</em> string"
+        Returns: WordUsageContext("This is a sample string", ((0, 4), (8, 16)))
+
+    Args:
+        markup: The HTML markup of the example.
+        tag: The HTML tag, which surrounds the highlighted parts.
+
+    Returns:
+        A WordUsageContext namedtuple.
+    """
+
+    parts = (_EM_TAGS_RE if tag == "em" else re.compile("<(/?){}>".format(re.escape(tag)))).split(markup)
+    texts, slashes = parts[0::2], parts[1::2]
+
+    if (len(slashes) % 2 or any(slashes[0::2]) or not all(slashes[1::2])
+            or "<" in markup.replace("<" + tag + ">", "").replace("</" + tag + ">", "")
+            or markup.count("&") != len(_ENTITY_RE.findall(markup))):
+        return _parse_context_soup(markup, tag)
+
+    texts[0] = texts[0].lstrip(" \t\n\f")  # lxml drops the leading whitespace of a document
+
+    cur, idxs = 0, []
+    for i, raw_text in enumerate(texts):
+        text = html.unescape(raw_text) if "&" in raw_text else raw_text
+
+        # lxml normalizes blank text nodes (except for single spaces between the tags) in its own way
+        if text and not text.strip(" \t\n\f") and (raw_text != " " or i == len(texts) - 1):
+            return _parse_context_soup(markup, tag)
+
+        if i % 2 and text:
+            idxs.append((cur, cur + len(text)))
+        texts[i] = text
+        cur += len(text)
+
+    # ...and so it does with some characters and the whitespace at the edges of a document
+    text = "".join(texts)
+    if ("\r" in text or "\0" in text or markup[:1] == "\ufeff"
+            or texts[0][:1] in (" ", "\t", "\n", "\f") or text[-1:] in (" ", "\t", "\n", "\f")):
+        return _parse_context_soup(markup, tag)
+
+    return WordUsageContext(text, tuple(idxs))
+
+
+def _make_soup(markup):
+    from bs4 import BeautifulSoup  # BeautifulSoup and lxml take long to import, but are rarely needed
+
+    return BeautifulSoup(markup, features="lxml")
+
+
+def _parse_context_soup(markup, tag="em") -> WordUsageContext:
+    soup = _make_soup(markup)
+    return WordUsageContext(soup.text, _find_highlighted_idxs(soup, tag))
+
+
+def _parse_total_pages(page_json) -> int:
+    """Extracts the number of pages from a decoded bst-query-service response."""
+
+    total_pages = page_json["npages"]
+
+    if not isinstance(total_pages, int):
+        try:
+            total_pages = int(total_pages)
+        except ValueError:
+            raise ValueError('"npages" in the response cannot be interpreted as an integer')
+    if total_pages < 0:
+        raise ValueError('"npages" in the response is a negative number')
+
+    return total_pages
+
+
+def _parse_translations(page_json, source_text) -> Generator[Translation, None, None]:
+    """Yields Translation namedtuples from a decoded bst-query-service response."""
+
+    for translation_json in page_json["dictionary_entry_list"]:
+        translation = translation_json["term"]
+        frequency = translation_json["alignFreq"]
+        part_of_speech = translation_json["pos"]
+
+        inflected_forms = tuple(InflectedForm(form["term"], form["alignFreq"])
+                                for form in translation_json["inflectedForms"])
+
+        yield Translation(source_text,
+                          translation, frequency, part_of_speech,
+                          inflected_forms)
+
+
+def _parse_examples(page_json) -> Generator[tuple, None, None]:
+    """Yields pairs of WordUsageContext namedtuples from a decoded bst-query-service response."""
+
+    for example in page_json["list"]:
+        yield _parse_context(example["s_text"]), _parse_context(example["t_text"])
+
+
+def _parse_page_examples(page_json) -> list:
+    """Parses all the examples of a decoded bst-query-service response at once, emitting the "parse.examples" event."""
+
+    with instrumentation.timer("parse.examples") as attributes:
+        examples = list(_parse_examples(page_json))
+        attributes["examples"] = len(examples)
+    return examples
+
+
+class _JSONStream(object):
+    """Incremental reader of JSON tokens and values from an iterable of bytes chunks (UTF-8)."""
+
+    __slots__ = ("chunks", "buffer", "pos", "decoder", "text_decoder")
+
+    def __init__(self, chunks) -> None:
+        self.chunks = iter(chunks)
+        self.buffer, self.pos = "", 0
+        self.decoder = json.JSONDecoder()
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+
+    def fill(self) -> bool:
+        """Appends the next chunk to the buffer, dropping the consumed part. Returns False at the end of the stream."""
+
+        for chunk in self.chunks:
+            if chunk:
+                self.buffer = self.buffer[self.pos:] + self.text_decoder.decode(chunk)
+                self.pos = 0
+                return True
+        return False
+
+    def peek(self) -> str:
+        """Returns the next non-whitespace character without consuming it."""
+
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                raise ValueError("unexpected end of JSON")
+
+    def expect(self, chars) -> str:
+        """Consumes and returns the next non-whitespace character, which must be one of chars."""
+
+        char = self.peek()
+        if char not in chars:
+            raise ValueError("expected one of {!r}, got {!r}".format(chars, char))
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Consumes and returns the next complete JSON value."""
+
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # a number at the end of the buffer (e.g. "22" or "22." of "22.5") may be continued in the next chunk
+            if isinstance(value, (int, float)) and not self.buffer[end:].strip("0123456789.eE+-") and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def _iter_json_array(chunks, key, members) -> Generator:
+    """Yields the items of the key array of a JSON object one by one, as soon as the chunks with them are received.
+
+    The other members of the object are put to the members dict.
+    """
+
+    stream = _JSONStream(chunks)
+
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+
+    while True:
+        name = stream.value()
+        stream.expect(":")
+        if name == key:
+            stream.expect("[")
+            if stream.peek() == "]":
+                stream.expect("]")
+            else:
+                while True:
+                    yield stream.value()
+                    if stream.expect(",]") == "]":
+                        break
+        else:
+            members[name] = stream.value()
+
+        if stream.expect(",}") == "}":
+            return
+
+
+def _fetch_supported_langs(transport) -> dict:
+    response = transport.get(BASE_URL + "translation/",
+                             headers=HEADERS)
+
+    with instrumentation.timer("parse.langs"):
+        return _parse_supported_langs(response.content)
+
+
+def _parse_supported_langs(html) -> dict:
+    supported_langs = {}
+
+    soup = _make_soup(html)
+
+    src_selector = soup.find("div", id="src-selector")
+    trg_selector = soup.find("div", id="trg-selector")
+
+    for selector, attribute in ((src_selector, "source_lang"),
+                                (trg_selector, "target_lang")):
+        dd_spans = selector.find(class_="drop-down").find_all("span")
+        langs = [span.get("data-value") for span in dd_spans]
+        langs = [lang for lang in langs
+                 if isinstance(lang, str) and len(lang) == 2]
+
+        supported_langs[attribute] = langs
+
+    return supported_langs
+
+
+class LanguageIndex(object):
+    """Frozen index of the languages supported by Reverso Context, which validates language pairs in O(1).
+
+    Attributes:
+        source_langs
+        target_langs
+        pairs
+
+    Methods:
+        validate(source_lang, target_lang)
+        as_dict()
+    """
+
+    __slots__ = ("source_langs", "target_langs", "pairs", "__langs")
+
+    def __init__(self, supported_langs) -> None:
+        """
+        Args:
+            supported_langs: A dict with iterables of the source ("source_lang" key) and target ("target_lang" key)
+                language codes.
+        """
+
+        self.__langs = {attribute: tuple(langs) for attribute, langs in supported_langs.items()}
+        self.source_langs = frozenset(self.__langs["source_lang"])
+        self.target_langs = frozenset(self.__langs["target_lang"])
+        self.pairs = frozenset((source_lang, target_lang)
+                               for source_lang in self.source_langs
+                               for target_lang in self.target_langs
+                               if source_lang != target_lang)
+
+    def __repr__(self) -> str:
+        return "{}(<{} pairs>)".format(type(self).__name__, len(self.pairs))
+
+    def __contains__(self, pair) -> bool:
+        return pair in self.pairs
+
+    def validate(self, source_lang, target_lang) -> None:
+        """Raises ValueError if the language pair is not supported."""
+
+        if source_lang not in self.source_langs:
+            raise ValueError(f"{source_lang!r} source language is not supported")
+        if target_lang not in self.target_langs:
+            raise ValueError(f"{target_lang!r} target language is not supported")
+        if source_lang == target_lang:
+            raise ValueError(f"source language cannot be equal to the target language")
+
+    def as_dict(self) -> dict:
+        """Returns the dict with the tuples of the language codes (see get_supported_langs())."""
+
+        return dict(self.__langs)
+
+
+_language_index = (None, None)  # (the catalog value, its index)
+
+
+def get_language_index(transport=None, catalog=None) -> LanguageIndex:
+    """Returns the LanguageIndex of the languages supported by Reverso Context.
+
+    The index is built only once per catalog value, so it is shared by all the API instances,
+    and it doesn't need the network if the languages are in the catalog (e.g. in its snapshot or file).
+
+    Args:
+        transport: The Transport to download the languages with (the default one is used if not specified).
+        catalog: The CatalogCache to look the languages up in (the default one is used if not specified).
+    """
+
+    global _language_index
+
+    transport = transport if transport is not None else get_default_transport()
+    catalog = catalog if catalog is not None else get_default_catalog()
+
+    supported_langs = catalog.get("supported_langs", lambda: _fetch_supported_langs(transport))
+    cached_langs, index = _language_index
+    if cached_langs is not supported_langs:
+        index = LanguageIndex(supported_langs)
+        _language_index = (supported_langs, index)
+    return index
+
+
+def get_supported_langs(transport=None, catalog=None) -> dict:
+    """Returns the languages supported by Reverso Context.
+
+    The languages are scraped from the https://context.reverso.net/translation/ page only once
+    and are then served from the catalog cache (see reverso_api.catalog.CatalogCache).
+
+    Args:
+        transport: The Transport to download the page with (the default one is used if not specified).
+        catalog: The CatalogCache to look the languages up in (the default one is used if not specified).
+
+    Returns:
+        A dict with tuples of the source ("source_lang" key) and target ("target_lang" key) language codes.
+    """
+
+    return get_language_index(transport, catalog).as_dict()
+
+
+Query = namedtuple("Query", ("source_text", "target_text", "source_lang", "target_lang"))
+
+
+def _take_examples(pages, max_examples) -> Generator[tuple, None, None]:
+    """Yields the parsed examples of the decoded pages, but no more than max_examples of them (if specified)."""
+
+    nexamples = 0
+    for page_json in pages:
+        for example in _parse_page_examples(page_json):
+            if max_examples is not None and nexamples >= max_examples:
+                return
+            yield example
+            nexamples += 1
+
+
+class ContextClient(object):
+    """Stateless client for Reverso Context API (https://context.reverso.net/), every method of which takes a Query.
+
+    Since a client holds no query state, a single client (and so a single catalog lookup and connection pool)
+    can serve any number of threads at once without locks.
+
+    For the same reason the client does not remember the first page of a query, which holds the translations
+    and the number of pages: without a response cache every call of total_pages(), get_translations(), etc.
+    fetches it again. Either pass a cache or fetch the page once and pass it as first_page:
+
+        client = ContextClient()
+        query = Query("hello", "", "en", "ru")
+        first_page = client.get_page(query, 1)
+        translations = list(client.get_translations(query, first_page=first_page))
+        for source, target in client.get_examples(query, first_page=first_page):
+            ...
+
+    Attributes:
+        language_index
+        transport
+        cache
+
+    Methods:
+        validate(query)
+        get_page(query, npage)
+        get_raw_page(query, npage)
+        total_pages(query, first_page=None)
+        get_translations(query, first_page=None)
+        get_examples(query, prefetch=0, max_pages=None, max_examples=None, stream=False, first_page=None)
+        get_example_batches(query, prefetch=0, max_pages=None, start_page=1, parse_pool=None, first_page=None)
+        get_example_view(query, prefetch=0, first_page=None)
+    """
+
+    def __init__(self, transport=None, catalog=None, cache=None) -> None:
+        """
+        Args:
+            transport: The Transport to send the requests with (the default one is used if not specified).
+            catalog: The CatalogCache to look the supported languages up in (the default one is used if not specified).
+            cache: The response cache (see reverso_api.cache).
+        """
+
+        self.__transport = transport if transport is not None else get_default_transport()
+        self.__cache = cache
+        self.__langs = get_language_index(self.__transport, catalog)
+
+    def __repr__(self) -> str:
+        return "{}(transport={!r}, cache={!r})".format(type(self).__name__, self.__transport, self.__cache)
+
+    @property
+    def language_index(self) -> LanguageIndex:
+        return self.__langs
+
+    @property
+    def transport(self):
+        return self.__transport
+
+    @property
+    def cache(self):
+        return self.__cache
+
+    def validate(self, query) -> Query:
+        """Returns the query as a Query namedtuple.
+
+        Raises:
+            ValueError: if the language pair of the query is not supported.
+        """
+
+        query = Query._make(query)
+        self.__langs.validate(query.source_lang, query.target_lang)
+        return query
+
+    def get_page(self, query, npage) -> dict:
+        """Returns the decoded bst-query-service response with the npage-th page of the query."""
+
+        page = self.get_raw_page(query, npage)
+        with instrumentation.timer("parse.json"):
+            return json.loads(page)
+
+    def get_raw_page(self, query, npage) -> str:
+        """Returns the bst-query-service response with the npage-th page of the query as it is (a JSON string)."""
+
+        query = self.validate(query)
+        key = tuple(query) + (npage,)
+
+        if self.__cache is not None:
+            with instrumentation.timer("cache.get", cache=type(self.__cache).__name__) as attributes:
+                page = self.__cache.get(key)
+                attributes["hit"] = page is not None
+            if page is not None:
+                return page
+
+        return _page_flights.do((id(self.__transport),) + key, lambda: self.__post_page(query, npage, key))
+
+    def __post_page(self, query, npage, key) -> str:
+        response = self.__transport.post(BASE_URL + "bst-query-service",
+                                         headers=HEADERS,
+                                         data=json.dumps(dict(query._asdict(), npage=npage)))
+        page = response.text
+
+        if self.__cache is not None:
+            self.__cache.set(key, page)
+        return page
+
+    def total_pages(self, query, first_page=None) -> int:
+        """Returns the number of pages of the query.
+
+        Args:
+            first_page: The decoded first page of the query, if it has been fetched already (see get_page()).
+        """
+
+        return _parse_total_pages(first_page if first_page is not None else self.get_page(query, 1))
+
+    def get_translations(self, query, first_page=None) -> Generator[Translation, None, None]:
+        """Yields all available translations for the word of the query (see ReversoContextAPI.get_translations()).
+
+        Args:
+            first_page: The decoded first page of the query, if it has been fetched already (see get_page()).
+        """
+
+        if first_page is None:
+            first_page = self.get_page(query, 1)
+        yield from _parse_translations(first_page, self.validate(query).source_text)
+
+    def get_examples(self,
+                     query,
+                     prefetch=0,
+                     max_pages=None,
+                     max_examples=None,
+                     stream=False,
+                     first_page=None) -> Generator[tuple, None, None]:
+        """Yields the usage examples of the query pair by pair (see ReversoContextAPI.get_examples()).
+
+        Args:
+            first_page: The decoded first page of the query, if it has been fetched already (see get_page()).
+        """
+
+        if not stream:
+            yield from _take_examples(self._iter_pages(query, prefetch, max_pages, first_page=first_page),
+                                      max_examples)
+            return
+
+        if prefetch:
+            raise ValueError("the pages cannot be prefetched when they are streamed")
+
+        query = self.validate(query)
+        npage, nexamples = 1, 0
+        total_pages = 1 if max_pages is None else min(1, max_pages)  # the real number is known after the first page
+        if first_page is not None and total_pages:
+            for example in _take_examples((first_page,), max_examples):
+                yield example
+                nexamples += 1
+            if max_examples is not None and nexamples >= max_examples:
+                return
+            npage, total_pages = 2, self.__count_pages(first_page, max_pages)
+        while npage <= total_pages:
+            members = {}
+            examples = self.__stream_page(query, npage, members)
+            try:
+                for example in examples:
+                    if max_examples is not None and nexamples >= max_examples:
+                        return
+                    yield example
+                    nexamples += 1
+            finally:
+                examples.close()
+
+            total_pages = _parse_total_pages(members)
+            if max_pages is not None:
+                total_pages = min(total_pages, max_pages)
+            npage += 1
+
+    def __stream_page(self, query, npage, members) -> Generator[tuple, None, None]:
+        """Yields the examples of the npage-th page as the response body arrives, parsing every example as soon as
+        it's decoded, and puts the other members of the page (e.g. "npages") to the members dict.
+
+        Unlike get_page(), a streamed request is never shared with the concurrent callers (see SingleFlight),
+        and with a response cache the body is also kept in memory until the page ends, to be cached as a whole.
+        The "parse.examples" event is emitted for every complete page: its time includes the JSON decoding,
+        but not the waiting for the body.
+        """
+
+        key = tuple(query) + (npage,)
+
+        if self.__cache is not None:
+            with instrumentation.timer("cache.get", cache=type(self.__cache).__name__) as attributes:
+                page = self.__cache.get(key)
+                attributes["hit"] = page is not None
+            if page is not None:
+                with instrumentation.timer("parse.json"):
+                    page_json = json.loads(page)
+                members.update(page_json)
+                yield from _parse_page_examples(page_json)
+                return
+
+        response = self.__transport.post(BASE_URL + "bst-query-service",
+                                         headers=HEADERS,
+                                         data=json.dumps(dict(query._asdict(), npage=npage)),
+                                         stream=True)
+        received = [] if self.__cache is not None else None
+        busy, nexamples = 0.0, 0
+
+        def receive(chunks):
+            nonlocal busy
+            chunks = iter(chunks)
+            while True:
+                started_at = time.perf_counter()
+                chunk = next(chunks, None)
+                busy -= time.perf_counter() - started_at  # waiting for the body is not parsing
+                if chunk is None:
+                    return
+                if received is not None:
+                    received.append(chunk)
+                yield chunk
+
+        try:
+            resumed_at = time.perf_counter()
+            for example in _iter_json_array(receive(response.iter_content(STREAM_CHUNK_SIZE)), "list", members):
+                example = _parse_context(example["s_text"]), _parse_context(example["t_text"])
+                busy += time.perf_counter() - resumed_at
+                nexamples += 1
+                yield example
+                resumed_at = time.perf_counter()
+            busy += time.perf_counter() - resumed_at
+
+            if instrumentation.is_enabled():
+                instrumentation.emit("parse.examples", max(busy, 0.0), examples=nexamples)
+            if received is not None:
+                self.__cache.set(key, b"".join(received).decode())
+        finally:
+            response.close()
+
+    def get_example_batches(self, query, prefetch=0, max_pages=None, start_page=1, parse_pool=None, first_page=None):
+        """Yields the usage examples of the query page by page as ExampleBatch objects
+        (see ReversoContextAPI.get_example_batches()).
+
+        Args:
+            first_page: The decoded first page of the query, if it has been fetched already (see get_page()).
+        """
+
+        yield from self._iter_batches(query, prefetch, max_pages, start_page, parse_pool, first_page)
+
+    def get_example_view(self, query, prefetch=0, first_page=None) -> "ExampleView":
+        """Returns a lazy random-access ExampleView of the usage examples of the query
+        (nothing is fetched yet unless first_page is None and the view is used).
+
+        Args:
+            first_page: The decoded first page of the query, if it has been fetched already (see get_page()).
+        """
+
+        return ExampleView(self, query, prefetch, first_page)
+
+    def _iter_batches(self, query, prefetch, max_pages, start_page=1, parse_pool=None, first_page=None):
+        """Yields ExampleBatch objects of the pages of the query from start_page on, parsing them in this thread
+        or, except for the first page, in the ParsePool.
+        """
+
+        from .columnar import ExampleBatch  # columnar depends on this module
+
+        if parse_pool is None:
+            for page_json in self._iter_pages(query, prefetch, max_pages, start_page, first_page):
+                yield ExampleBatch(_parse_page_examples(page_json))
+            return
+
+        # the first page is decoded here anyway to get the number of pages, so only the next ones are sent to the pool
+        query = self.validate(query)
+        if first_page is None:
+            first_page = self.get_page(query, 1)
+
+        total_pages = self.__count_pages(first_page, max_pages)
+        if total_pages < start_page:
+            return
+
+        if start_page <= 1:
+            yield ExampleBatch(_parse_page_examples(first_page))
+        npages = range(max(start_page, 2), total_pages + 1)
+        yield from parse_pool.map(self.__prefetch_pages(query, npages, prefetch, self.get_raw_page))
+
+    def _iter_pages(self, query, prefetch, max_pages, start_page=1, first_page=None) -> Generator[dict, None, None]:
+        """Yields the decoded pages of the query from start_page on (the first page is requested unless passed)."""
+
+        query = self.validate(query)
+        if first_page is None:
+            first_page = self.get_page(query, 1)
+
+        total_pages = self.__count_pages(first_page, max_pages)
+        if total_pages < start_page:
+            return
+
+        if start_page <= 1:
+            yield first_page
+        yield from self.__prefetch_pages(query, range(max(start_page, 2), total_pages + 1), prefetch, self.get_page)
+
+    @staticmethod
+    def __count_pages(first_page, max_pages) -> int:
+        total_pages = _parse_total_pages(first_page)
+        return min(total_pages, max_pages) if max_pages is not None else total_pages
+
+    def __prefetch_pages(self, query, npages, prefetch, fetch) -> Generator:
+        """Yields fetch(query, npage) for the pages in order, fetching up to prefetch pages ahead concurrently."""
+
+        if not prefetch:
+            for npage in npages:
+                yield fetch(query, npage)
+            return
+
+        npages = iter(npages)
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            futures = deque(executor.submit(fetch, query, npage)
+                            for npage in itertools.islice(npages, prefetch))
+            try:
+                while futures:
+                    page = futures.popleft().result()
+                    futures.extend(executor.submit(fetch, query, npage)
+                                   for npage in itertools.islice(npages, 1))
+                    yield page
+            finally:
+                for future in futures:
+                    future.cancel()
+
+
+class ExampleView(object):
+    """A lazy, read-only sequence of the usage examples of a query, which supports len(), indexing and slicing.
+
+    Only the pages covering the requested examples are fetched (the page of an example is known from the page size
+    reported by the first page), and every page is parsed only once, so e.g. view[120:140] costs at most two requests
+    no matter how many pages precede it.
+
+    Example:
+        view = ContextClient().get_example_view(Query("hello", "", "en", "ru"))
+        source, target = view[0]
+        examples = view[120:140]
+        page = view.page(7)
+
+    Attributes:
+        query
+        prefetch
+        total_pages
+        page_size
+
+    Methods:
+        page(npage)
+        cached_pages()
+    """
+
+    def __init__(self, client, query, prefetch=0, first_page=None) -> None:
+        """
+        Args:
+            client: The ContextClient to request the pages with.
+            query: The Query (or a tuple of its fields).
+            prefetch: How many of the pages needed for a slice are fetched concurrently (0 fetches them one by one).
+            first_page: The decoded first page of the query, if it has been fetched already.
+        """
+
+        self.__client = client
+        self.query = client.validate(query)
+        self.prefetch = prefetch
+
+        self.__first_page = first_page
+        self.__pages = {}  # npage -> the tuple of the parsed examples
+
+    def __repr__(self) -> str:
+        return "{}({!r}, <{} pages cached>)".format(type(self).__name__, self.query, len(self.__pages))
+
+    def __get_first_page(self) -> dict:
+        if self.__first_page is None:
+            self.__first_page = self.__client.get_page(self.query, 1)
+        return self.__first_page
+
+    @property
+    def total_pages(self) -> int:
+        return _parse_total_pages(self.__get_first_page())
+
+    @property
+    def page_size(self) -> int:
+        """The number of examples per page (all the pages but the last one are full)."""
+
+        first_page = self.__get_first_page()
+        return first_page.get("pagesize") or len(first_page["list"]) or 1
+
+    def __len__(self) -> int:
+        first_page = self.__get_first_page()
+        nrows = first_page.get("nrows_exact", first_page.get("nrows"))
+        max_rows = self.total_pages * self.page_size
+        return min(nrows, max_rows) if isinstance(nrows, int) else max_rows
+
+    def page(self, npage) -> tuple:
+        """Returns the examples of the npage-th page (starting from 1) as a tuple of (source, target) pairs."""
+
+        examples = self.__pages.get(npage)
+        if examples is None:
+            if not 1 <= npage <= self.total_pages:
+                raise IndexError("page number out of range")
+            page_json = self.__get_first_page() if npage == 1 else self.__client.get_page(self.query, npage)
+            examples = self.__pages[npage] = tuple(_parse_page_examples(page_json))
+        return examples
+
+    def cached_pages(self) -> list:
+        """Returns the sorted numbers of the pages, which have been fetched and parsed already."""
+
+        return sorted(self.__pages)
+
+    def __getitem__(self, i):
+        page_size = self.page_size
+        if isinstance(i, slice):
+            indexes = range(len(self))[i]
+            if not indexes:
+                return []
+            npages = sorted({index // page_size + 1 for index in indexes})
+            self.__fetch_pages([npage for npage in npages if npage not in self.__pages])
+            return [example for example in (self.__example(index, page_size) for index in indexes)
+                    if example is not None]
+
+        index = range(len(self))[i]
+        example = self.__example(index, page_size)
+        if example is None:
+            raise IndexError("the page of the example is shorter than expected")
+        return example
+
+    def __example(self, index, page_size):
+        """Returns the index-th example or None if its page is shorter than page_size."""
+
+        examples = self.page(index // page_size + 1)
+        offset = index % page_size
+        return examples[offset] if offset < len(examples) else None
+
+    def __fetch_pages(self, npages) -> None:
+        if self.prefetch and len(npages) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.prefetch, len(npages))) as executor:
+                list(executor.map(self.page, npages))
+        else:
+            for npage in npages:
+                self.page(npage)
+
+    def __iter__(self):
+        for npage in range(1, self.total_pages + 1):
+            yield from self.page(npage)
+
 
 class ReversoContextAPI(object):
     """Class for Reverso Context API (https://context.reverso.net/)
 
+    An instance keeps the current query and is not meant to be used from several threads at once
+    (use a ContextClient with Query values instead).
+
     Attributes:
         supported_langs
         source_text
         target_text
         source_lang
         target_lang
+        query
         total_pages
+        client
+        transport
+        cache
 
     Methods:
         get_translations()
         get_examples()
+        get_example_batches()
+        get_example_view()
         swap_langs()
     """
 
@@ -44,14 +878,20 @@ class ReversoContextAPI(object):
                  source_text="пример",
                  target_text="",
                  source_lang="ru",
-                 target_lang="en") -> None:
+                 target_lang="en",
+                 transport=None,
+                 catalog=None,
+                 cache=None) -> None:
+
+        self.__client = ContextClient(transport, catalog, cache)
 
         self.__data = dict.fromkeys(("source_text", "target_text", "source_lang", "target_lang"))
-        self.__total_pages = None
+        self.__first_page = None
         self.__data_ismodified = True
 
         # FIXME: make self.supported_langs read-only
-        self.supported_langs = self.__get_supported_langs()
+        self.__langs = self.__client.language_index
+        self.supported_langs = self.__langs.as_dict()
 
         self.source_text, self.target_text = source_text, target_text
         self.source_lang, self.target_lang = source_lang, target_lang
@@ -69,29 +909,6 @@ class ReversoContextAPI(object):
                 return False
         return True
 
-    @staticmethod
-    def __get_supported_langs() -> dict:
-        supported_langs = {}
-
-        response = requests.get("https://context.reverso.net/translation/",
-                                headers=HEADERS)
-
-        soup = BeautifulSoup(response.content, features="lxml")
-
-        src_selector = soup.find("div", id="src-selector")
-        trg_selector = soup.find("div", id="trg-selector")
-
-        for selector, attribute in ((src_selector, "source_lang"),
-                                    (trg_selector, "target_lang")):
-            dd_spans = selector.find(class_="drop-down").find_all("span")
-            langs = [span.get("data-value") for span in dd_spans]
-            langs = [lang for lang in langs
-                     if isinstance(lang, str) and len(lang) == 2]
-
-            supported_langs[attribute] = tuple(langs)
-
-        return supported_langs
-
     @property
     def source_text(self) -> str:
         return self.__data["source_text"]
@@ -108,27 +925,39 @@ class ReversoContextAPI(object):
     def target_lang(self) -> str:
         return self.__data["target_lang"]
 
+    @property
+    def query(self) -> Query:
+        """The current query as an immutable Query namedtuple (e.g. to pass it to a ContextClient)."""
+
+        return Query(self.source_text, self.target_text, self.source_lang, self.target_lang)
+
+    @property
+    def client(self) -> ContextClient:
+        return self.__client
+
+    @property
+    def transport(self):
+        return self.__client.transport
+
+    @property
+    def cache(self):
+        return self.__client.cache
+
     @property
     def total_pages(self) -> int:
-        if self.__data_ismodified:
-            response = requests.post("https://context.reverso.net/bst-query-service",
-                                     headers=HEADERS,
-                                     data=json.dumps(self.__data))
+        return _parse_total_pages(self.__get_first_page())
 
-            total_pages = response.json()["npages"]
+    def __get_first_page(self) -> dict:
+        """Returns the decoded first page of the current query.
 
-            if not isinstance(total_pages, int):
-                try:
-                    total_pages = int(total_pages)
-                except ValueError:
-                    raise ValueError('"npages" in the response cannot be interpreted as an integer')
-            if total_pages < 0:
-                raise ValueError('"npages" in the response is a negative number')
+        The page is requested only once per query and is shared by total_pages, get_translations() and get_examples().
+        """
 
-            self.__total_pages = total_pages
+        if self.__data_ismodified:
+            self.__first_page = self.__client.get_page(self.query, 1)
             self.__data_ismodified = False
 
-        return self.__total_pages
+        return self.__first_page
 
     def get_translations(self) -> Generator[Translation, None, None]:
         """
@@ -140,76 +969,79 @@ class ReversoContextAPI(object):
              Translation namedtuples.
         """
 
-        response = requests.post("https://context.reverso.net/bst-query-service",
-                                 headers=HEADERS,
-                                 data=json.dumps(self.__data))
-        translations_json = response.json()["dictionary_entry_list"]
+        yield from _parse_translations(self.__get_first_page(), self.__data["source_text"])
 
-        for translation_json in translations_json:
-            translation = translation_json["term"]
-            frequency = translation_json["alignFreq"]
-            part_of_speech = translation_json["pos"]
-
-            inflected_forms = tuple(InflectedForm(form["term"], form["alignFreq"])
-                                    for form in translation_json["inflectedForms"])
-
-            yield Translation(self.__data["source_text"],
-                              translation, frequency, part_of_speech,
-                              inflected_forms)
-
-    def get_examples(self) -> Generator[tuple, None, None]:
+    def get_examples(self, prefetch=0, max_pages=None, max_examples=None, stream=False) -> Generator[tuple, None, None]:
         """A generator that gets words' usage examples pairs from server pair by pair.
 
         Note:
-            Don't try to get all usage examples at one time if there are more than 5 pages (see the total_pages attribute). It
-            may take a long time to complete because it will be necessary to connect to the server as many times as there are pages exist.
-            Just get the usage examples one by one as they are being fetched.
+            Don't try to get all usage examples at one time if there are more than 5 pages (see the total_pages attribute)
+            without prefetching. It may take a long time to complete because it will be necessary to connect to the server
+            as many times as there are pages exist. Just get the usage examples one by one as they are being fetched,
+            or let the next pages be fetched concurrently with the prefetch argument.
+
+        Args:
+            prefetch: How many of the next pages are fetched concurrently in the background (0 disables prefetching).
+                The examples are yielded in the page order anyway.
+            max_pages: The maximum number of pages to fetch (all the pages are fetched if not specified).
+            max_examples: The maximum number of examples to yield (all the examples are yielded if not specified).
+            stream: Decode every page incrementally as its body arrives and yield the examples as soon as they are
+                decoded, instead of reading and decoding whole pages (lowers the time to the first example and
+                the memory per page). The pages are fetched one by one then, so it can't be used with prefetch.
+                With a response cache, the body of every page is still kept in memory to be cached, and streamed
+                requests are not shared with the concurrent identical ones.
 
         Yields:
             Tuples with two WordUsageContext namedtuples (for source and target text and highlighted indexes)
         """
 
-        def find_highlighted_idxs(soup, tag="em") -> tuple:
-            """Finds indexes of the parts of the soup surrounded by a particular HTML tag
-            relatively to the soup without the tag.
+        if stream:
+            yield from self.__client.get_examples(self.query, prefetch, max_pages, max_examples, stream=True,
+                                                  first_page=self.__first_page if not self.__data_ismodified else None)
+            return
+
+        yield from _take_examples(self.__iter_pages(prefetch, max_pages), max_examples)
 
-            Example:
-                soup = BeautifulSoup("<em>This</em> is <em>a sample</em> string")
-                tag = "em"
-                Returns: [(0, 4), (8, 16)]
+    def get_example_batches(self, prefetch=0, max_pages=None, start_page=1, parse_pool=None):
+        """A generator that gets words' usage examples from server page by page as compact columnar batches.
 
-            Args:
-                soup: The BeautifulSoup's soup.
-                tag: The HTML tag, which surrounds the parts of the soup.
+        An ExampleBatch takes a fraction of the memory of the WordUsageContext namedtuples it holds,
+        and can be exported to NumPy or Arrow (see reverso_api.columnar).
 
-            Returns:
-                  A list of the tuples, which contain start and end indexes of the soup parts,
-                  surrounded by tags.
+        Args:
+            prefetch: How many of the next pages are fetched concurrently in the background (0 disables prefetching).
+            max_pages: The maximum number of pages to fetch (all the pages are fetched if not specified).
+            start_page: The number of the first page to fetch (e.g. to resume an interrupted crawl).
+            parse_pool: A ParsePool (see reverso_api.pipeline) to parse the pages in other processes,
+                while this thread and the prefetching threads only fetch them. The batches are yielded in order anyway.
 
-            """
+        Yields:
+            ExampleBatch objects (one per page).
+        """
 
-            # source: https://stackoverflow.com/a/62027247/8661764
+        first_page, query = self.__get_first_page(), self.query
+        yield from self.__client._iter_batches(query, prefetch, max_pages, start_page, parse_pool, first_page)
 
-            cur, idxs = 0, []
-            for t in soup.find_all(text=True):
-                if t.parent.name == tag:
-                    idxs.append((cur, cur + len(t)))
-                cur += len(t)
-            return tuple(idxs)
+    def get_example_view(self, prefetch=0) -> ExampleView:
+        """Returns a lazy random-access view of the usage examples of the current query.
 
-        for npage in range(1, self.total_pages + 1):
-            self.__data["npage"] = npage
+        Unlike get_examples(), the view fetches only the pages needed for the requested examples
+        (e.g. view[120:140] or view.page(7)) and keeps the parsed pages, so they are fetched only once.
+        The view is bound to the query at the time of the call.
 
-            response = requests.post("https://context.reverso.net/bst-query-service",
-                                     headers=HEADERS,
-                                     data=json.dumps(self.__data))
-            examples_json = response.json()["list"]
+        Args:
+            prefetch: How many of the pages needed for a slice are fetched concurrently (0 disables prefetching).
 
-            for example in examples_json:
-                source = BeautifulSoup(example["s_text"], features="lxml")
-                target = BeautifulSoup(example["t_text"], features="lxml")
-                yield (WordUsageContext(source.text, find_highlighted_idxs(source)),
-                       WordUsageContext(target.text, find_highlighted_idxs(target)))
+        Returns:
+            An ExampleView.
+        """
+
+        return ExampleView(self.__client, self.query, prefetch, first_page=self.__get_first_page())
+
+    def __iter_pages(self, prefetch, max_pages, start_page=1) -> Generator[dict, None, None]:
+        # the query is copied when the iteration starts, so changing the attributes during it has no effect
+        first_page, query = self.__get_first_page(), self.query
+        yield from self.__client._iter_pages(query, prefetch, max_pages, start_page, first_page)
 
     @source_text.setter
     def source_text(self, value) -> None:
@@ -225,10 +1057,10 @@ class ReversoContextAPI(object):
     def source_lang(self, value) -> None:
         value = str(value)
 
-        if value not in self.supported_langs["source_lang"]:
+        if value not in self.__langs.source_langs:
             raise ValueError(f"{value!r} source language is not supported")
 
-        if value == self.source_lang:
+        if value == self.target_lang:
             raise ValueError(f"source language cannot be equal to the target language")
 
         self.__data["source_lang"] = value
@@ -238,7 +1070,7 @@ class ReversoContextAPI(object):
     def target_lang(self, value) -> None:
         value = str(value)
 
-        if value not in self.supported_langs["target_lang"]:
+        if value not in self.__langs.target_langs:
             raise ValueError(f"{value!r} target language is not supported")
 
         if value == self.source_lang:
@@ -251,3 +1083,60 @@ class ReversoContextAPI(object):
         self.__data["source_lang"], self.__data["target_lang"] = self.__data["target_lang"], \
                                                                  self.__data["source_lang"]
         self.__data_ismodified = True
+
+
+def translate_many(words,
+                   source_lang="ru",
+                   target_lang="en",
+                   max_workers=8,
+                   transport=None,
+                   catalog=None,
+                   cache=None) -> Generator[tuple, None, None]:
+    """A generator that translates many words concurrently and yields the results as soon as they are ready.
+
+    All the queries share one ContextClient, and so one transport (one connection pool) and one response cache.
+    No more than max_workers queries are in flight at a time, so words can be an arbitrarily long (or lazy) iterable.
+
+    A failed query doesn't affect the others: the exception it raised is yielded instead of its translations
+    (the same as asyncio.gather(..., return_exceptions=True) does).
+
+    Example:
+        for word, translations in translate_many(["cat", ("chien", "fr", "en")], "en", "ru"):
+            if isinstance(translations, Exception):
+                ...
+
+    Args:
+        words: An iterable of words (strings) or (word, source_lang, target_lang) tuples.
+        source_lang: The source language of the words passed as plain strings.
+        target_lang: The target language of the words passed as plain strings.
+        max_workers: The maximum number of concurrent queries.
+        transport: The Transport to send the queries with (the default one is used if not specified).
+        catalog: The CatalogCache to look the supported languages up in (the default one is used if not specified).
+        cache: The response cache (see reverso_api.cache) shared by all the queries.
+
+    Yields:
+        (word, translations) tuples in the completion order, where word is an item of words as it was passed, and
+        translations is a list of Translation namedtuples or an exception.
+    """
+
+    client = ContextClient(transport, catalog, cache)
+
+    def translate(word):
+        text, langs = (word, (source_lang, target_lang)) if isinstance(word, str) else (word[0], word[1:])
+        return list(client.get_translations(Query(str(text), "", *map(str, langs))))
+
+    words = iter(words)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(translate, word): word for word in itertools.islice(words, max_workers)}
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    word = pending.pop(future)
+                    pending.update((executor.submit(translate, next_word), next_word)
+                                   for next_word in itertools.islice(words, 1))
+                    error = future.exception()
+                    yield word, (error if error is not None else future.result())
+        finally:
+            for future in pending:
+                future.cancel()
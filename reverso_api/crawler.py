@@ -0,0 +1,346 @@
+"""Resumable bulk crawler of the Reverso Context usage examples
+
+The crawler fetches all the example pages of many queries concurrently and streams them page by page to a writer
+(JSON Lines or Parquet), while a checkpoint keeps the last written page of every query. If a crawl is interrupted,
+running it again with the same checkpoint continues every query from the page after the last written one.
+
+Example:
+    transport = Transport(rate_limiter=RateLimiter(5))  # at most 5 requests per second for all the workers
+    with JSONLWriter("examples.jsonl") as writer, CrawlCheckpoint("examples.checkpoint") as checkpoint:
+        Crawler([("cat", "en", "ru"), ("dog", "en", "fr")], writer, checkpoint, transport=transport).run()
+
+Note:
+    The pages are written at least once: if the process dies after a page is written, but before the checkpoint
+    is updated, the page is written again on resume (every record has the page number to deduplicate them).
+"""
+
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from .context import ReversoContextAPI, Query
+
+__all__ = ["CrawlQuery", "CrawlStats", "CrawlCheckpoint", "JSONLWriter", "ParquetWriter", "Crawler"]
+
+CrawlQuery = namedtuple("CrawlQuery", ("source_text", "source_lang", "target_lang", "target_text"),
+                        defaults=("",))
+
+CrawlStats = namedtuple("CrawlStats", ("queries", "pages", "examples", "errors"))
+
+
+def _crawl_query(query) -> CrawlQuery:
+    """Returns the query as a CrawlQuery (a Query orders its fields differently, so it's converted by the names)."""
+
+    if isinstance(query, Query):
+        return CrawlQuery(query.source_text, query.source_lang, query.target_lang, query.target_text)
+    return CrawlQuery(*query)
+
+
+class CrawlCheckpoint(object):
+    """Progress of a crawl, stored in an SQLite database: the last written page and the total number of pages
+    of every query, and the last error of the failed ones.
+
+    Attributes:
+        path
+
+    Methods:
+        get(query)
+        update(query, last_page, total_pages)
+        fail(query, error)
+        is_done(query)
+        errors()
+        close()
+    """
+
+    def __init__(self, path) -> None:
+        """
+        Args:
+            path: The database filename.
+        """
+
+        self.path = path
+
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.__connection.execute("CREATE TABLE IF NOT EXISTS progress "
+                                  "(query TEXT PRIMARY KEY, last_page INTEGER NOT NULL, total_pages INTEGER, "
+                                  "error TEXT, updated REAL NOT NULL)")
+
+    def __repr__(self) -> str:
+        return "{}({!r})".format(type(self).__name__, self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return self.__connection.execute("SELECT COUNT(*) FROM progress").fetchone()[0]
+
+    @staticmethod
+    def __key(query) -> str:
+        return json.dumps(list(_crawl_query(query)), ensure_ascii=False)
+
+    def get(self, query) -> tuple:
+        """Returns the (last_page, total_pages) tuple of the query ((0, None) if it hasn't been started yet)."""
+
+        with self.__lock:
+            row = self.__connection.execute("SELECT last_page, total_pages FROM progress WHERE query = ?",
+                                            (self.__key(query),)).fetchone()
+        return tuple(row) if row is not None else (0, None)
+
+    def update(self, query, last_page, total_pages) -> None:
+        with self.__lock:
+            self.__connection.execute("INSERT OR REPLACE INTO progress VALUES (?, ?, ?, NULL, ?)",
+                                      (self.__key(query), last_page, total_pages, time.time()))
+
+    def fail(self, query, error) -> None:
+        """Saves the error of the query, keeping its progress (so it's resumed on the next run)."""
+
+        key, error = self.__key(query), "{}: {}".format(type(error).__name__, error)
+        with self.__lock:
+            self.__connection.execute("INSERT OR IGNORE INTO progress VALUES (?, 0, NULL, NULL, ?)", (key, time.time()))
+            self.__connection.execute("UPDATE progress SET error = ?, updated = ? WHERE query = ?",
+                                      (error, time.time(), key))
+
+    def is_done(self, query) -> bool:
+        last_page, total_pages = self.get(query)
+        return total_pages is not None and last_page >= total_pages
+
+    def errors(self) -> dict:
+        """Returns the errors of the failed queries as a dict, where keys are CrawlQuery namedtuples."""
+
+        with self.__lock:
+            rows = self.__connection.execute("SELECT query, error FROM progress WHERE error IS NOT NULL").fetchall()
+        return {CrawlQuery(*json.loads(query)): error for query, error in rows}
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__connection.close()
+
+
+class JSONLWriter(object):
+    """Appends the examples to a JSON Lines file, an example per line.
+
+    Every line is a JSON object with the query fields, the page number, and the "source" and "target" contexts
+    ({"text": ..., "highlighted": [[start, end], ...]}).
+
+    Methods:
+        write(query, npage, batch)
+        close()
+    """
+
+    def __init__(self, path) -> None:
+        self.path = path
+        self.__fp = open(path, "a", encoding="utf-8")
+
+    def __repr__(self) -> str:
+        return "{}({!r})".format(type(self).__name__, self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, query, npage, batch) -> None:
+        """Writes an ExampleBatch of the query page and flushes it to the disk."""
+
+        record = dict(_crawl_query(query)._asdict(), page=npage)
+        for source, target in batch:
+            record["source"] = {"text": source.text, "highlighted": source.highlighted}
+            record["target"] = {"text": target.text, "highlighted": target.highlighted}
+            self.__fp.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.__fp.flush()
+
+    def close(self) -> None:
+        self.__fp.close()
+
+
+class ParquetWriter(object):
+    """Writes the examples to a new Parquet file in the directory (a file per run, so the previous runs are kept).
+
+    The columns are the query fields prefixed with "query_" (e.g. "query_source_text"), "page",
+    and the columns of ExampleBatch.to_arrow().
+
+    Note:
+        pyarrow is necessary for this writer to work! You should install it first, otherwise ImportError is raised.
+
+    Methods:
+        write(query, npage, batch)
+        close()
+    """
+
+    def __init__(self, directory) -> None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("pyarrow is required for writing Parquet files, so you should install it first")
+
+        self.__pyarrow = pyarrow
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, "part-{}-{}.parquet".format(time.strftime("%Y%m%d%H%M%S"), os.getpid()))
+        self.__writer = None
+
+    def __repr__(self) -> str:
+        return "{}({!r})".format(type(self).__name__, self.directory)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, query, npage, batch) -> None:
+        """Writes an ExampleBatch of the query page as a Parquet row group."""
+
+        pyarrow = self.__pyarrow
+
+        record_batch = batch.to_arrow()
+        columns = {"query_" + name: pyarrow.array([value] * len(batch), type=pyarrow.string())
+                   for name, value in _crawl_query(query)._asdict().items()}
+        columns["page"] = pyarrow.array([npage] * len(batch), type=pyarrow.uint32())
+        columns.update(zip(record_batch.schema.names, record_batch.columns))
+        table = pyarrow.Table.from_pydict(columns)
+
+        if self.__writer is None:
+            self.__writer = pyarrow.parquet.ParquetWriter(self.path, table.schema)
+        self.__writer.write_table(table)
+
+    def close(self) -> None:
+        if self.__writer is not None:
+            self.__writer.close()
+
+
+class Crawler(object):
+    """Crawls all the usage examples of many queries concurrently and resumably.
+
+    Every worker thread crawls its own query page by page, and the pages are passed to the calling thread through
+    a bounded queue, so that the writer and the checkpoint are used from one thread only and the memory usage
+    doesn't depend on the number of queries. The request rate of all the workers can be limited with
+    the RateLimiter of the transport (see reverso_api.transport.RateLimiter).
+
+    A failed query doesn't stop the crawl: its error is saved to the checkpoint and it's retried on the next run.
+
+    Attributes:
+        queries
+        writer
+        checkpoint
+        max_workers
+        prefetch
+        parse_pool
+
+    Methods:
+        run()
+    """
+
+    def __init__(self,
+                 queries,
+                 writer,
+                 checkpoint,
+                 max_workers=4,
+                 prefetch=0,
+                 transport=None,
+                 catalog=None,
+                 cache=None,
+                 parse_pool=None) -> None:
+        """
+        Args:
+            queries: An iterable of CrawlQuery or Query namedtuples, or (source_text, source_lang, target_lang) tuples.
+            writer: A JSONLWriter, a ParquetWriter or any object with a write(query, npage, batch) method.
+            checkpoint: The CrawlCheckpoint to resume the crawl from and to save the progress to.
+            max_workers: The maximum number of queries crawled concurrently.
+            prefetch: How many of the next pages of a query are fetched concurrently (see get_examples()).
+            transport: The Transport to send the requests with (the default one is used if not specified).
+            catalog: The CatalogCache to look the supported languages up in (the default one is used if not specified).
+            cache: The response cache (see reverso_api.cache) shared by all the queries.
+            parse_pool: A ParsePool (see reverso_api.pipeline) to parse the pages in other processes, so that
+                the workers only fetch them (the pages are parsed in the worker threads if not specified).
+        """
+
+        self.queries = queries
+        self.writer = writer
+        self.checkpoint = checkpoint
+        self.max_workers = max_workers
+        self.prefetch = prefetch
+        self.parse_pool = parse_pool
+
+        self.__transport = transport
+        self.__catalog = catalog
+        self.__cache = cache
+
+    def __repr__(self) -> str:
+        return "{}(max_workers={!r}, prefetch={!r})".format(type(self).__name__, self.max_workers, self.prefetch)
+
+    def __crawl(self, query, pages, stopped) -> None:
+        """Puts (query, npage, total_pages, batch) tuples of the query pages to the queue,
+        followed by (query, None, total_pages, None) or (query, None, None, exception).
+        """
+
+        def put(item):
+            while not stopped.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+            raise InterruptedError("the crawl is stopped")
+
+        try:
+            last_page, _ = self.checkpoint.get(query)
+            api = ReversoContextAPI(query.source_text, query.target_text, query.source_lang, query.target_lang,
+                                    transport=self.__transport, catalog=self.__catalog, cache=self.__cache)
+            total_pages = api.total_pages
+            batches = api.get_example_batches(self.prefetch, start_page=last_page + 1, parse_pool=self.parse_pool)
+            for npage, batch in enumerate(batches, last_page + 1):
+                put((query, npage, total_pages, batch))
+        except Exception as e:
+            if not stopped.is_set():
+                put((query, None, None, e))
+        else:
+            put((query, None, total_pages, None))
+
+    def run(self) -> CrawlStats:
+        """Crawls the queries, which are not done yet according to the checkpoint, and returns the statistics
+        of this run (the queries crawled, the pages and examples written, and the number of failed queries).
+        """
+
+        queries = [query for query in (_crawl_query(query) for query in self.queries)
+                   if not self.checkpoint.is_done(query)]
+        pages, stopped = queue.Queue(maxsize=2 * self.max_workers), threading.Event()
+        npages = nexamples = nerrors = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self.__crawl, query, pages, stopped) for query in queries]
+
+            try:
+                nfinished = 0
+                while nfinished < len(queries):
+                    query, npage, total_pages, batch = pages.get()
+                    if npage is not None:
+                        self.writer.write(query, npage, batch)
+                        self.checkpoint.update(query, npage, total_pages)
+                        npages, nexamples = npages + 1, nexamples + len(batch)
+                        continue
+
+                    nfinished += 1
+                    if isinstance(batch, Exception):
+                        self.checkpoint.fail(query, batch)
+                        nerrors += 1
+                    else:
+                        self.checkpoint.update(query, total_pages, total_pages)
+            finally:
+                stopped.set()
+                for future in futures:
+                    future.cancel()
+
+        return CrawlStats(len(queries), npages, nexamples, nerrors)
@@ -0,0 +1,166 @@
+"""Timing and instrumentation hooks for the hot paths of the Reverso APIs
+
+A hook is a callable, which is called with an Event after every instrumented operation:
+    "http.request"   an HTTP request (method, url, status_code, bytes, retries);
+    "parse.json"     decoding of a bst-query-service page;
+    "parse.examples" parsing of the examples of a page (examples);
+    "parse.langs"    scraping of the supported languages from the /translation/ page;
+    "cache.get"      a lookup in a response or audio cache (cache, hit).
+
+When no hooks are added, the instrumentation costs a single check per operation.
+
+Example:
+    add_hook(lambda event: print(event.name, event.seconds, event.attributes))
+"""
+
+import threading
+import time
+from collections import namedtuple
+
+__all__ = ["Event", "add_hook", "remove_hook", "PrometheusHook", "OpenTelemetryHook"]
+
+Event = namedtuple("Event", ("name", "seconds", "attributes"))
+
+_hooks = ()
+_hooks_lock = threading.Lock()
+
+
+def add_hook(hook) -> None:
+    """Adds a callable, which is called with an Event after every instrumented operation (in the calling thread)."""
+
+    global _hooks
+
+    with _hooks_lock:
+        _hooks = _hooks + (hook,)
+
+
+def remove_hook(hook) -> None:
+    global _hooks
+
+    with _hooks_lock:
+        _hooks = tuple(h for h in _hooks if h != hook)  # bound methods are equal, but not identical
+
+
+def is_enabled() -> bool:
+    return bool(_hooks)
+
+
+def emit(name, seconds=0.0, **attributes) -> None:
+    """Calls the hooks with an Event. The exceptions raised by the hooks are ignored."""
+
+    event = Event(name, seconds, attributes)
+    for hook in _hooks:
+        try:
+            hook(event)
+        except Exception:
+            pass
+
+
+class _Timer(object):
+    """A context manager, which emits an event with the time spent inside it.
+
+    The attributes dict (yielded by the context manager) can be updated inside, e.g. with the results.
+    """
+
+    __slots__ = ("name", "attributes", "started_at")
+
+    def __init__(self, name, attributes) -> None:
+        self.name = name
+        self.attributes = attributes
+
+    def __enter__(self) -> dict:
+        self.started_at = time.perf_counter()
+        return self.attributes
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        emit(self.name, time.perf_counter() - self.started_at, **self.attributes)
+
+
+class _NullTimer(object):
+    __slots__ = ()
+
+    def __enter__(self) -> dict:
+        return {}
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+
+_null_timer = _NullTimer()
+
+
+def timer(name, **attributes):
+    """Returns a context manager, which emits the name event with the time spent inside it (if there are hooks)."""
+
+    return _Timer(name, attributes) if _hooks else _null_timer
+
+
+class PrometheusHook(object):
+    """A hook, which exports the events as Prometheus metrics:
+        reverso_operation_seconds (a histogram by the event name),
+        reverso_http_bytes_total, reverso_http_retries_total (counters by the method),
+        reverso_cache_lookups_total (a counter by the cache and the result).
+
+    Note:
+        prometheus_client is necessary for this hook to work! You should install it first,
+        otherwise ImportError will be raised.
+    """
+
+    def __init__(self, registry=None) -> None:
+        """
+        Args:
+            registry: The prometheus_client.CollectorRegistry to register the metrics in (the default one if None).
+        """
+
+        try:
+            import prometheus_client
+        except ImportError:
+            raise ImportError("prometheus_client is required for exporting Prometheus metrics, "
+                              "so you should install it first")
+
+        kwargs = {"registry": registry} if registry is not None else {}
+        self.seconds = prometheus_client.Histogram("reverso_operation_seconds", "Time spent in Reverso API operations",
+                                                   ("operation",), **kwargs)
+        self.bytes = prometheus_client.Counter("reverso_http_bytes", "Bytes received from Reverso",
+                                               ("method",), **kwargs)
+        self.retries = prometheus_client.Counter("reverso_http_retries", "Retried requests to Reverso",
+                                                 ("method",), **kwargs)
+        self.cache_lookups = prometheus_client.Counter("reverso_cache_lookups", "Reverso API cache lookups",
+                                                       ("cache", "result"), **kwargs)
+
+    def __call__(self, event) -> None:
+        self.seconds.labels(event.name).observe(event.seconds)
+        attributes = event.attributes
+        if event.name == "http.request":
+            self.bytes.labels(attributes["method"]).inc(attributes.get("bytes") or 0)
+            self.retries.labels(attributes["method"]).inc(attributes.get("retries") or 0)
+        elif event.name == "cache.get":
+            self.cache_lookups.labels(attributes["cache"], "hit" if attributes["hit"] else "miss").inc()
+
+
+class OpenTelemetryHook(object):
+    """A hook, which records the events with OpenTelemetry instruments of the meter: the reverso.operation.duration
+    histogram and the reverso.http.bytes, reverso.http.retries and reverso.cache.lookups counters
+    (the low-cardinality event attributes, such as method and status_code, are used as the metric attributes).
+
+    Example:
+        add_hook(OpenTelemetryHook(opentelemetry.metrics.get_meter("reverso_api")))
+    """
+
+    def __init__(self, meter) -> None:
+        self.duration = meter.create_histogram("reverso.operation.duration", unit="s")
+        self.bytes = meter.create_counter("reverso.http.bytes", unit="By")
+        self.retries = meter.create_counter("reverso.http.retries")
+        self.cache_lookups = meter.create_counter("reverso.cache.lookups")
+
+    def __call__(self, event) -> None:
+        attributes = {key: value for key, value in event.attributes.items()
+                      if key in ("method", "status_code", "cache", "hit", "error")}
+        self.duration.record(event.seconds, dict(attributes, operation=event.name))
+        if event.name == "http.request":
+            self.bytes.add(event.attributes.get("bytes") or 0, attributes)
+            self.retries.add(event.attributes.get("retries") or 0, attributes)
+        elif event.name == "cache.get":
+            self.cache_lookups.add(1, attributes)
@@ -0,0 +1,120 @@
+"""Parsing of the Reverso Context pages in a process pool
+
+Parsing the markup of the examples is CPU-bound, so with many queries crawled at once a single process is limited
+by the GIL while the network is idle. A ParsePool moves the parsing to other processes: the fetching threads pass
+the raw pages (JSON strings) to it in batches, and it returns the examples as ExampleBatch objects, which are
+pickled as a few strings and arrays instead of a namedtuple per example.
+
+Example:
+    with ParsePool(max_workers=4) as pool:
+        for batch in api.get_example_batches(prefetch=8, parse_pool=pool):
+            ...
+
+    # or for a whole crawl (see reverso_api.crawler)
+    with ParsePool() as pool:
+        Crawler(queries, writer, checkpoint, max_workers=16, parse_pool=pool).run()
+"""
+
+import itertools
+import json
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Generator
+
+from .columnar import ExampleBatch
+from .context import _parse_examples
+
+__all__ = ["ParsePool"]
+
+
+def _parse_raw_pages(raw_pages) -> list:
+    """Parses the raw bst-query-service pages into ExampleBatch objects (runs in a worker process)."""
+
+    return [ExampleBatch(_parse_examples(json.loads(page))) for page in raw_pages]
+
+
+class ParsePool(object):
+    """A process pool, which parses raw bst-query-service pages into ExampleBatch objects.
+
+    The pool is thread-safe, so it can be shared by all the fetching threads (e.g. the workers of a Crawler).
+    With asyncio, the futures of parse() can be awaited with asyncio.wrap_future().
+
+    Attributes:
+        max_workers
+        batch_size
+        max_pending
+        mp_context
+
+    Methods:
+        parse(raw_pages)
+        map(raw_pages)
+        close()
+    """
+
+    def __init__(self, max_workers=None, batch_size=4, max_pending=2, mp_context=None) -> None:
+        """
+        Args:
+            max_workers: The number of the worker processes (the number of CPUs if not specified).
+            batch_size: How many pages are sent to a worker process at a time by map().
+            max_pending: How many batches of a map() call are parsed at a time, while the next pages are fetched.
+            mp_context: The multiprocessing context to start the processes with. If not specified, "forkserver"
+                is used where it's available and "spawn" elsewhere, but never "fork": the pool is usually created
+                in a process, which already runs the fetching threads, and forking it may deadlock the workers.
+        """
+
+        if mp_context is None:
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            mp_context = multiprocessing.get_context(start_method)
+
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.mp_context = mp_context
+
+        self.__executor = ProcessPoolExecutor(self.max_workers, mp_context)
+
+    def __repr__(self) -> str:
+        return "{}(max_workers={!r}, batch_size={!r})".format(type(self).__name__, self.max_workers, self.batch_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def parse(self, raw_pages):
+        """Returns a concurrent.futures.Future of the list of ExampleBatch objects of the raw pages (JSON strings)."""
+
+        return self.__executor.submit(_parse_raw_pages, list(raw_pages))
+
+    def map(self, raw_pages) -> Generator[ExampleBatch, None, None]:
+        """Yields the ExampleBatch objects of the raw pages (JSON strings) in order.
+
+        The pages are taken from the iterable (e.g. a generator, which fetches them) in batches of batch_size
+        and parsed in the worker processes, up to max_pending batches at a time.
+        """
+
+        raw_pages = iter(raw_pages)
+        pending = deque()
+
+        def submit() -> bool:
+            batch = list(itertools.islice(raw_pages, self.batch_size))
+            if batch:
+                pending.append(self.parse(batch))
+            return bool(batch)
+
+        try:
+            while len(pending) < self.max_pending and submit():
+                pass
+            while pending:
+                batches = pending.popleft().result()
+                submit()
+                yield from batches
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def close(self) -> None:
+        self.__executor.shutdown()
@@ -0,0 +1,225 @@
+"""Playback of the spoken phrases of the Reverso Voice API
+
+A PlaybackQueue plays many phrases one after another in a background thread, while the next phrases are downloaded
+in the meantime, so a dialogue plays back-to-back instead of stalling between the phrases while each one is fetched.
+
+The phrases are played with an audio sink: PygameSink plays them aloud (the pygame mixer is initialized only once
+per process), and NullSink only keeps them (e.g. for tests and headless machines). Any object with the play(source)
+and wait() methods can be used as a sink, where source is either the MP3 data (bytes) or the filename (str)
+of the phrase in an AudioCache (ReversoVoiceAPI.say() plays the cached phrases right from their files).
+
+Example:
+    with PlaybackQueue() as playback:
+        playback.put("Can I adopt your little kitten?", "Heather22k")
+        playback.put("能让我来照顾你的小猫咪吗？", "Lulu22k", 85)
+    # all the phrases have been played here
+"""
+
+import contextlib
+import io
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from .voice import ReversoVoiceAPI
+
+__all__ = ["PlaybackQueue", "PygameSink", "NullSink"]
+
+
+class PygameSink(object):
+    """An audio sink, which plays the MP3 data with the pygame mixer.
+
+    The mixer is initialized by the first sink only, and then reused by all the others.
+
+    Note:
+        pygame is necessary for this sink to work! You should install it first, otherwise ImportError is raised.
+
+    Methods:
+        play(source)
+        wait()
+    """
+
+    def __init__(self, poll_interval=0.01) -> None:
+        """
+        Args:
+            poll_interval: How often (in seconds) wait() checks if the phrase is still playing.
+        """
+
+        try:
+            with contextlib.redirect_stdout(None):  # to remove the "Hello from the pygame community..." message
+                import pygame
+        except ImportError:
+            raise ImportError("pygame is required for playing mp3 files, so you should install it first")
+
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+
+        self.__music = pygame.mixer.music
+        self.poll_interval = poll_interval
+
+    def __repr__(self) -> str:
+        return "{}()".format(type(self).__name__)
+
+    def play(self, source) -> None:
+        """Starts playing the source (the MP3 data or a filename) and returns immediately."""
+
+        self.__music.load(source if isinstance(source, str) else io.BytesIO(source))
+        self.__music.play()
+
+    def wait(self) -> None:
+        """Returns as soon as the current phrase has been played."""
+
+        while self.__music.get_busy():
+            time.sleep(self.poll_interval)
+
+
+class NullSink(object):
+    """An audio sink, which plays nothing, but keeps the played sources (bytes or filenames, as they are passed)
+    and can pretend to play every phrase for the given number of seconds.
+
+    Attributes:
+        played
+        duration
+
+    Methods:
+        play(source)
+        wait()
+    """
+
+    def __init__(self, duration=0.0) -> None:
+        self.played = []
+        self.duration = duration
+        self.__ends_at = 0.0
+
+    def __repr__(self) -> str:
+        return "{}(<{} played>)".format(type(self).__name__, len(self.played))
+
+    def play(self, source) -> None:
+        self.played.append(source)
+        self.__ends_at = time.monotonic() + self.duration
+
+    def wait(self) -> None:
+        delay = self.__ends_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class PlaybackQueue(object):
+    """A queue of phrases, which are played in order in a background thread.
+
+    Every phrase starts being downloaded as soon as it's put to the queue (up to prefetch phrases at a time),
+    so the next phrases are usually ready by the time the current one ends. The voices are looked up
+    in the download threads as well, so put() doesn't block even if they are not in the catalog yet.
+
+    Attributes:
+        sink
+        prefetch
+
+    Methods:
+        put(text, voice, speed=100)
+        extend(phrases)
+        join()
+        close()
+    """
+
+    def __init__(self, sink=None, prefetch=2, transport=None, catalog=None, audio_cache=None) -> None:
+        """
+        Args:
+            sink: The audio sink to play the phrases with (a PygameSink if not specified).
+            prefetch: The maximum number of phrases downloaded concurrently.
+            transport: The Transport to fetch the phrases with (the default one is used if not specified).
+            catalog: The CatalogCache to look the voices up in (the default one is used if not specified).
+            audio_cache: The AudioCache to keep the spoken phrases in.
+        """
+
+        self.sink = sink if sink is not None else PygameSink()
+        self.prefetch = prefetch
+
+        self.__transport = transport
+        self.__catalog = catalog
+        self.__audio_cache = audio_cache
+
+        self.__queue = queue.Queue()
+        self.__executor = ThreadPoolExecutor(max_workers=prefetch)
+        self.__thread = threading.Thread(target=self.__play, daemon=True)
+        self.__lock = threading.Lock()
+        self.__closed = False
+
+    def __repr__(self) -> str:
+        return "{}(sink={!r}, prefetch={!r})".format(type(self).__name__, self.sink, self.prefetch)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def put(self, text, voice, speed=100) -> Future:
+        """Puts the phrase to the queue and returns immediately.
+
+        Returns:
+            A concurrent.futures.Future, which is done when the phrase has been played (or has failed to).
+            If the voice or the speed is invalid, it fails with AssertionError (the same as ReversoVoiceAPI does).
+        """
+
+        with self.__lock:
+            if self.__closed:
+                raise RuntimeError("cannot put phrases to a closed PlaybackQueue")
+            if not self.__thread.is_alive():
+                self.__thread.start()
+
+            played = Future()
+            self.__queue.put((self.__executor.submit(self.__download, text, voice, speed), played))
+        return played
+
+    def __download(self, text, voice, speed) -> bytes:
+        return ReversoVoiceAPI(text, voice, speed, transport=self.__transport, catalog=self.__catalog,
+                               audio_cache=self.__audio_cache).mp3_data
+
+    def extend(self, phrases) -> list:
+        """Puts many (text, voice) or (text, voice, speed) tuples to the queue and returns the list of their futures."""
+
+        return [self.put(*phrase) for phrase in phrases]
+
+    def join(self) -> None:
+        """Returns as soon as all the phrases put to the queue have been played."""
+
+        self.__queue.join()
+
+    def close(self) -> None:
+        """Waits until all the phrases have been played and stops the background thread."""
+
+        with self.__lock:
+            if self.__closed:
+                return
+            self.__closed = True
+            started = self.__thread.ident is not None
+            if started:
+                self.__queue.put(None)
+
+        if started:
+            self.__thread.join()
+        self.__executor.shutdown()
+
+    def __play(self) -> None:
+        while True:
+            item = self.__queue.get()
+            try:
+                if item is None:
+                    return
+
+                download, played = item
+                if not played.set_running_or_notify_cancel():
+                    download.cancel()
+                    continue
+
+                try:
+                    self.sink.play(download.result())
+                    self.sink.wait()
+                except Exception as e:
+                    played.set_exception(e)
+                else:
+                    played.set_result(None)
+            finally:
+                self.__queue.task_done()
@@ -0,0 +1,84 @@
+"""In-flight request coalescing ("single flight") for the threaded and the asyncio APIs
+
+When several callers ask for the same key at the same time, only the first one (the leader) actually calls
+the function, and the others wait for it and get the same result (or the same exception). As soon as the call
+completes, the key is forgotten, so it's not a cache: the next call for the key calls the function again.
+"""
+
+import threading
+from concurrent.futures import Future
+
+__all__ = ["SingleFlight", "AsyncSingleFlight"]
+
+
+class SingleFlight(object):
+    """Thread-safe coalescing of concurrent calls with the same key.
+
+    Methods:
+        do(key, fn)
+    """
+
+    def __init__(self) -> None:
+        self.__calls = {}
+        self.__lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return "{}(<{} calls in flight>)".format(type(self).__name__, len(self.__calls))
+
+    def __len__(self) -> int:
+        return len(self.__calls)
+
+    def do(self, key, fn):
+        """Returns the result of fn() (a callable without arguments), sharing it with the concurrent calls
+        for the same key (key must be hashable).
+        """
+
+        with self.__lock:
+            future = self.__calls.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = self.__calls[key] = Future()
+
+        if is_leader:
+            try:
+                future.set_result(fn())
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                with self.__lock:
+                    del self.__calls[key]
+
+        return future.result()
+
+
+class AsyncSingleFlight(object):
+    """Coalescing of concurrent coroutine calls with the same key within an event loop.
+
+    The call runs in its own task, so if one of the waiting callers is cancelled, the others still get the result.
+
+    Methods:
+        do(key, coro_fn)
+    """
+
+    def __init__(self) -> None:
+        self.__calls = {}
+
+    def __repr__(self) -> str:
+        return "{}(<{} calls in flight>)".format(type(self).__name__, len(self.__calls))
+
+    def __len__(self) -> int:
+        return len(self.__calls)
+
+    async def do(self, key, coro_fn):
+        """Returns the result of await coro_fn(), sharing it with the concurrent calls for the same key."""
+
+        import asyncio  # only the asyncio API needs it, so the threaded APIs don't pay for importing it
+
+        key = (id(asyncio.get_running_loop()), key)
+
+        task = self.__calls.get(key)
+        if task is None:
+            task = self.__calls[key] = asyncio.ensure_future(coro_fn())
+            task.add_done_callback(lambda _: self.__calls.pop(key, None))
+
+        return await asyncio.shield(task)
@@ -0,0 +1,310 @@
+"""Pooled HTTP transport shared by the Reverso APIs"""
+
+import threading
+import time
+import weakref
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import instrumentation
+
+__all__ = ["Transport", "RateLimiter", "AdaptiveConcurrency", "get_default_transport", "set_default_transport"]
+
+
+class RateLimiter(object):
+    """Thread-safe token bucket, which lets through at most rate requests per second on average
+    and at most burst requests at once.
+
+    Attributes:
+        rate
+        burst
+
+    Methods:
+        acquire()
+    """
+
+    def __init__(self, rate, burst=1) -> None:
+        """
+        Args:
+            rate: The number of requests per second.
+            burst: The bucket size (how many requests can be sent at once after being idle).
+        """
+
+        self.rate = rate
+        self.burst = burst
+
+        self.__tokens = burst
+        self.__updated_at = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return "{}({!r}, burst={!r})".format(type(self).__name__, self.rate, self.burst)
+
+    def acquire(self) -> None:
+        """Blocks until a request is allowed to be sent."""
+
+        with self.__lock:
+            now = time.monotonic()
+            self.__tokens = min(self.burst, self.__tokens + (now - self.__updated_at) * self.rate)
+            self.__updated_at = now
+            self.__tokens -= 1
+            delay = -self.__tokens / self.rate if self.__tokens < 0 else 0
+
+        # the token is reserved already, so the concurrent callers wait for their own turns
+        if delay:
+            time.sleep(delay)
+
+
+class AdaptiveConcurrency(object):
+    """Thread-safe limit of the concurrent requests, which is adjusted with AIMD (additive increase,
+    multiplicative decrease), the same way TCP finds the bandwidth of a connection.
+
+    Every successful request increases the limit by increase / limit (so by about increase per "round" of requests),
+    while every throttled (429), failed (5xx or a connection error) or too slow (longer than latency_target seconds)
+    one multiplies it by decrease. So the limit converges to the highest concurrency the server sustains.
+
+    Attributes:
+        limit
+        in_flight
+        minimum
+        maximum
+        latency_target
+
+    Methods:
+        acquire()
+        release(status_code, latency)
+    """
+
+    def __init__(self, initial=4, minimum=1, maximum=64, latency_target=None, increase=1.0, decrease=0.5) -> None:
+        """
+        Args:
+            initial: The initial limit.
+            minimum: The lowest limit.
+            maximum: The highest limit.
+            latency_target: If specified, slower requests (in seconds) decrease the limit the same as failed ones.
+            increase: How much the limit grows per a round of successful requests.
+            decrease: The factor the limit is multiplied by on a failure.
+        """
+
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_target = latency_target
+        self.increase = increase
+        self.decrease = decrease
+
+        self.__limit = float(initial)
+        self.__in_flight = 0
+        self.__condition = threading.Condition()
+
+    def __repr__(self) -> str:
+        return "{}(limit={!r}, in_flight={!r})".format(type(self).__name__, self.limit, self.in_flight)
+
+    @property
+    def limit(self) -> int:
+        return int(self.__limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self.__in_flight
+
+    def acquire(self) -> None:
+        """Blocks until there are less than limit requests in flight."""
+
+        with self.__condition:
+            self.__condition.wait_for(lambda: self.__in_flight < self.limit)
+            self.__in_flight += 1
+
+    def release(self, status_code, latency) -> None:
+        """Reports the result of a request (status_code is None for a connection error) and adjusts the limit."""
+
+        with self.__condition:
+            self.__in_flight -= 1
+            if (status_code is None or status_code == 429 or status_code >= 500
+                    or self.latency_target is not None and latency > self.latency_target):
+                self.__limit = max(self.minimum, self.__limit * self.decrease)
+            else:
+                self.__limit = min(self.maximum, self.__limit + self.increase / self.__limit)
+            self.__condition.notify_all()
+
+
+class Transport(object):
+    """Keep-alive HTTP transport with a bounded connection pool, timeouts and retries.
+
+    One Transport can be shared by any number of ReversoContextAPI/ReversoVoiceAPI instances and threads:
+    all the threads share a single connection pool, but each of them gets its own requests.Session,
+    so that cookies and other per-session state never leak between concurrent requests.
+
+    The requests, which still fail after the retries, raise requests.HTTPError instead of returning an error page.
+
+    Rate limiting and adaptive concurrency are opt-in: a transport uses them only if a RateLimiter
+    or an AdaptiveConcurrency is passed to it (the default transport uses neither).
+
+    Attributes:
+        timeout
+        rate_limiter
+        concurrency
+        session
+
+    Methods:
+        request(method, url, **kwargs)
+        get(url, **kwargs)
+        post(url, **kwargs)
+        close()
+    """
+
+    def __init__(self,
+                 pool_size=10,
+                 timeout=(5, 30),
+                 retries=3,
+                 backoff_factor=0.3,
+                 status_forcelist=(429, 500, 502, 503, 504),
+                 session=None,
+                 rate_limiter=None,
+                 concurrency=None) -> None:
+        """
+        Args:
+            pool_size: The maximum number of keep-alive connections per host.
+            timeout: The default timeout (either a number or a (connect, read) tuple) for every request.
+            retries: How many times a failed request is retried.
+            backoff_factor: The exponential backoff factor between the retries (see urllib3.util.retry.Retry).
+            status_forcelist: HTTP status codes which are retried.
+            session: A custom requests.Session. If it is passed, it is used for all the requests as is
+                (so the pool size and retries settings are ignored).
+            rate_limiter: A RateLimiter, which every request waits for (e.g. to share a request budget
+                between all the APIs and threads using the transport).
+            concurrency: An AdaptiveConcurrency, which limits the number of concurrent requests
+                (e.g. to back off when the server starts throttling).
+        """
+
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.concurrency = concurrency
+
+        self.__session = session
+        self.__local = threading.local()
+        self.__adapter = HTTPAdapter(pool_connections=pool_size,
+                                     pool_maxsize=pool_size,
+                                     max_retries=Retry(total=retries,
+                                                       backoff_factor=backoff_factor,
+                                                       status_forcelist=status_forcelist,
+                                                       allowed_methods=frozenset(("GET", "POST")),
+                                                       raise_on_status=False))
+
+    def __repr__(self) -> str:
+        return "{}(timeout={!r})".format(type(self).__name__, self.timeout)
+
+    @property
+    def session(self) -> requests.Session:
+        """The requests.Session used by the current thread."""
+
+        if self.__session is not None:
+            return self.__session
+
+        session = getattr(self.__local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", self.__adapter)
+            session.mount("http://", self.__adapter)
+            self.__local.session = session
+        return session
+
+    def request(self, method, url, **kwargs) -> requests.Response:
+        """Sends the request, waiting for the rate limiter and the concurrency limit (if any) first.
+
+        For a streamed request (stream=True), the concurrency slot is held, and the latency is measured, until
+        the response is closed, so the body must be read within a `with response:` block (or the like).
+        """
+
+        kwargs.setdefault("timeout", self.timeout)
+        stream = kwargs.get("stream", False)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+        with instrumentation.timer("http.request", method=method, url=url) as attributes:
+            if self.concurrency is None:
+                response = self.session.request(method, url, **kwargs)
+            else:
+                self.concurrency.acquire()
+                started_at, status_code = time.monotonic(), None
+                try:
+                    response = self.session.request(method, url, **kwargs)
+                    status_code = response.status_code
+                finally:
+                    if status_code is None or not stream:
+                        self.concurrency.release(status_code, time.monotonic() - started_at)
+                if stream:
+                    self.__release_on_close(response, started_at)
+
+            if attributes:
+                retries = getattr(response.raw, "retries", None)
+                attributes.update(status_code=response.status_code,
+                                  bytes=(int(response.headers.get("Content-Length", 0)) if stream
+                                         else len(response.content)),
+                                  retries=len(retries.history) if retries is not None else 0)
+            try:
+                response.raise_for_status()
+            except requests.HTTPError:
+                if stream:
+                    response.close()
+                raise
+        return response
+
+    def __release_on_close(self, response, started_at) -> None:
+        """Releases the concurrency slot of the streamed response when it's closed (or garbage collected)."""
+
+        concurrency, status_code, close = self.concurrency, response.status_code, response.close
+        release = weakref.finalize(response, lambda: concurrency.release(status_code, time.monotonic() - started_at))
+
+        def close_and_release():
+            try:
+                close()
+            finally:
+                release()  # a finalizer is called only once
+
+        response.close = close_and_release
+
+    def get(self, url, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        """Closes all the pooled connections."""
+
+        if self.__session is not None:
+            self.__session.close()
+        self.__adapter.close()
+
+
+_default_transport = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport() -> Transport:
+    """Returns the process-wide Transport, which is used when no transport is passed to an API constructor.
+
+    The default transport has neither a RateLimiter nor an AdaptiveConcurrency: both are opt-in, so pass them
+    to a Transport and make it the default one with set_default_transport() to limit all the requests.
+    """
+
+    global _default_transport
+
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = Transport()
+        return _default_transport
+
+
+def set_default_transport(transport) -> None:
+    """Replaces the process-wide Transport (e.g. to change the pool size or the timeouts)."""
+
+    global _default_transport
+
+    if not isinstance(transport, Transport):
+        raise TypeError("Transport is required instead of {}".format(type(transport)))
+
+    with _default_transport_lock:
+        _default_transport = transport
@@ -2,17 +2,197 @@
 
 import base64
 import contextlib
-import io
+import re
+import time
+import types
 from collections import namedtuple, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import requests
+from . import instrumentation
+from .catalog import get_default_catalog
+from .singleflight import SingleFlight
+from .transport import get_default_transport
 
-__all__ = ["ReversoVoiceAPI", "Voice"]
+__all__ = ["ReversoVoiceAPI", "Voice", "VoiceIndex", "SynthesisJob", "SynthesisResult",
+           "get_voices", "get_voice_index", "synthesize_many"]
 
 BASE_URL = "https://voice.reverso.net/RestPronunciation.svc/v1/output=json/"
 
+# concurrent requests for the same phrase (from any threads and API instances) are sent only once
+_phrase_flights = SingleFlight()
+
 Voice = namedtuple("Voice", ("name", "language", "gender"))
 
+SynthesisJob = namedtuple("SynthesisJob", ("text", "voice", "speed", "output"))
+
+SynthesisResult = namedtuple("SynthesisResult", ("job", "latency", "error"))
+
+
+def _get_voice_stream_url(voice, speed, text):
+    return BASE_URL + "GetVoiceStream/voiceName={}?voiceSpeed={}&inputText={}".format(
+        voice, speed, base64.b64encode(text.encode()).decode())
+
+
+_TEXT_SEPARATORS = (re.compile(r"(?<=[.!?\u2026])\s+"),  # sentences
+                    re.compile(r"(?<=[,;:\u2014])\s+"),  # clauses
+                    re.compile(r"\s+"))  # words
+
+
+def _split_text(text, max_length, separators=_TEXT_SEPARATORS) -> list:
+    """Splits the text into chunks of at most max_length characters on sentence boundaries,
+    falling back to clause and word boundaries (and cutting the words as the last resort) for too long sentences.
+
+    Example:
+        text = "Hello, World! How are you?"
+        max_length = 15
+        Returns: ["Hello, World!", "How are you?"]
+    """
+
+    if len(text) <= max_length:
+        return [text] if text.strip() else []
+    if not separators:
+        return [text[i:i + max_length] for i in range(0, len(text), max_length)]
+
+    chunks, current = [], ""
+    for part in separators[0].split(text):
+        if len(part) > max_length:
+            chunks.extend(_split_text(current, max_length, ()) if current else ())
+            chunks.extend(_split_text(part, max_length, separators[1:]))
+            current = ""
+        elif current and len(current) + 1 + len(part) <= max_length:
+            current += " " + part
+        else:
+            chunks.extend(_split_text(current, max_length, ()) if current else ())
+            current = part
+    chunks.extend(_split_text(current, max_length, ()) if current else ())
+    return chunks
+
+
+def _strip_id3(mp3_data) -> bytes:
+    """Removes the leading ID3v2 tag, so that the MP3 data can be appended to another MP3 stream."""
+
+    if len(mp3_data) < 10 or mp3_data[:3] != b"ID3":
+        return mp3_data
+    size = (mp3_data[6] & 0x7f) << 21 | (mp3_data[7] & 0x7f) << 14 | (mp3_data[8] & 0x7f) << 7 | mp3_data[9] & 0x7f
+    if mp3_data[5] & 0x10:  # footer present
+        size += 10
+    return mp3_data[10 + size:]
+
+
+def _parse_voices(voices_json):
+    """Groups the "Voices" list of a GetAvailableVoices response into Voice namedtuples by their language names."""
+
+    voices = defaultdict(list)
+
+    for voice_json in voices_json:
+        language_name = voice_json["Language"]
+        name, langcode, gender = voice_json["Name"], int(voice_json["LangCode"]), voice_json["Gender"]
+        voice = Voice(name, (langcode, language_name), gender)
+        voices[language_name].append(voice)
+
+    return dict(voices)
+
+
+class VoiceIndex(object):
+    """Frozen index of the voices available in Reverso Voice with O(1) lookups by name, language and gender.
+
+    Attributes:
+        by_name
+        by_language
+
+    Methods:
+        find(language=None, gender=None)
+        as_dict()
+    """
+
+    __slots__ = ("by_name", "by_language", "__by_language_gender")
+
+    def __init__(self, voices) -> None:
+        """
+        Args:
+            voices: A dict, where keys are language names and values are iterables of Voice namedtuples
+                (see get_voices()).
+        """
+
+        self.by_language = types.MappingProxyType({language: tuple(language_voices)
+                                                   for language, language_voices in voices.items()})
+        self.by_name = types.MappingProxyType({voice.name: voice
+                                               for language_voices in self.by_language.values()
+                                               for voice in language_voices})
+
+        by_language_gender = defaultdict(list)
+        for language, language_voices in self.by_language.items():
+            for voice in language_voices:
+                by_language_gender[language, voice.gender].append(voice)
+                by_language_gender[None, voice.gender].append(voice)
+        self.__by_language_gender = {key: tuple(key_voices) for key, key_voices in by_language_gender.items()}
+
+    def __repr__(self) -> str:
+        return "{}(<{} voices>)".format(type(self).__name__, len(self.by_name))
+
+    def __contains__(self, name) -> bool:
+        return name in self.by_name
+
+    def find(self, language=None, gender=None) -> tuple:
+        """Returns a tuple of the voices of the language (a language name, e.g. "US English") and/or the gender
+        ("M" or "F"). If neither of them is specified, all the voices are returned.
+        """
+
+        if gender is not None:
+            return self.__by_language_gender.get((language, gender), ())
+        if language is not None:
+            return self.by_language.get(language, ())
+        return tuple(self.by_name.values())
+
+    def as_dict(self) -> dict:
+        """Returns the dict with the lists of the voices (see get_voices())."""
+
+        return {language: list(language_voices) for language, language_voices in self.by_language.items()}
+
+
+_voice_index = (None, None)  # (the catalog value, its index)
+
+
+def get_voice_index(transport=None, catalog=None) -> VoiceIndex:
+    """Returns the VoiceIndex of the voices available in Reverso Voice.
+
+    The index is built only once per catalog value, so it is shared by all the API instances,
+    and it doesn't need the network if the voices are in the catalog (e.g. in its snapshot or file).
+
+    Args:
+        transport: The Transport to download the voices with (the default one is used if not specified).
+        catalog: The CatalogCache to look the voices up in (the default one is used if not specified).
+    """
+
+    global _voice_index
+
+    transport = transport if transport is not None else get_default_transport()
+    catalog = catalog if catalog is not None else get_default_catalog()
+
+    voices_json = catalog.get("voices", lambda: transport.get(BASE_URL + "GetAvailableVoices").json()["Voices"])
+    cached_json, index = _voice_index
+    if cached_json is not voices_json:
+        index = VoiceIndex(_parse_voices(voices_json))
+        _voice_index = (voices_json, index)
+    return index
+
+
+def get_voices(transport=None, catalog=None):
+    """Returns the voices available in Reverso Voice, grouped by their language names.
+
+    The voices are downloaded only once and are then served from the catalog cache
+    (see reverso_api.catalog.CatalogCache).
+
+    Args:
+        transport: The Transport to download the voices with (the default one is used if not specified).
+        catalog: The CatalogCache to look the voices up in (the default one is used if not specified).
+
+    Returns:
+        A dict, where keys are language names and values are lists of Voice namedtuples.
+    """
+
+    return get_voice_index(transport, catalog).as_dict()
+
 
 class ReversoVoiceAPI:
     """Class for Reverso Voice API (https://voice.reverso.net/)
@@ -22,36 +202,48 @@ class ReversoVoiceAPI:
         voice
         speed
         mp3_data
+        voices
+        voice_index
+        transport
+        audio_cache
+        chunk_length
+        chunks
 
     Methods:
+        iter_mp3(chunk_size=65536)
         write_to_file(file)
-        say(wait=False)
+        say(wait=False, sink=None)
 
     """
 
-    def __init__(self, text, voice, speed=100):
-        self.__voices = self.__get_voices()  # TODO: make a frozen dict
-        self.__voice_names = [voice.name
-                              for voices in self.__voices.values()
-                              for voice in voices]
-
-        self.__text, self.__voice, self.__speed = None, None, None
-        self.text, self.voice, self.speed = text, voice, speed
-
-    @staticmethod
-    def __get_voices():
-        voices = defaultdict(list)
+    def __init__(self, text, voice, speed=100, transport=None, catalog=None, audio_cache=None,
+                 chunk_length=None, max_workers=4):
+        """
+        Args:
+            text: The text to speak.
+            voice: The voice name or a Voice namedtuple.
+            speed: The speaking speed (30 <= speed <= 300).
+            transport: The Transport to fetch the phrase with (the default one is used if not specified).
+            catalog: The CatalogCache to look the voices up in (the default one is used if not specified).
+            audio_cache: The AudioCache to keep the spoken phrases in.
+            chunk_length: If specified, texts longer than chunk_length characters are split into chunks
+                on sentence (or clause) boundaries, which are fetched concurrently and kept one by one
+                (in the audio cache, or by the instance until all of them are fetched), and the MP3 data
+                is concatenated in order.
+            max_workers: The maximum number of chunks fetched concurrently.
+        """
 
-        response = requests.get(BASE_URL + "GetAvailableVoices")
+        self.__transport = transport if transport is not None else get_default_transport()
+        self.__audio_cache = audio_cache
+        self.chunk_length = chunk_length
+        self.max_workers = max_workers
 
-        voices_json = response.json()
-        for voice_json in voices_json["Voices"]:
-            language_name = voice_json["Language"]
-            name, langcode, gender = voice_json["Name"], int(voice_json["LangCode"]), voice_json["Gender"]
-            voice = Voice(name, (langcode, language_name), gender)
-            voices[language_name].append(voice)
+        self.__voice_index = get_voice_index(self.__transport, catalog)
+        self.__voices = self.__voice_index.as_dict()  # a copy of the shared read-only voice_index
+        self.__chunk_data = {}  # (voice, speed, text) -> the MP3 data of the chunks fetched without an audio cache
 
-        return dict(voices)
+        self.__text, self.__voice, self.__speed = None, None, None
+        self.text, self.voice, self.speed = text, voice, speed
 
     @property
     def text(self):
@@ -65,33 +257,186 @@ class ReversoVoiceAPI:
     def speed(self):
         return self.__speed
 
+    @property
+    def chunks(self):
+        """The parts of the text, which are fetched separately (the whole text unless chunk_length is exceeded)."""
+
+        if self.chunk_length is None or len(self.text) <= self.chunk_length:
+            return [self.text]
+        return _split_text(self.text, self.chunk_length)
+
     @property
     def mp3_data(self):
-        if self.__info_modified:
-            self.__mp3_data = requests.get(
-                BASE_URL + "GetVoiceStream/voiceName={}?voiceSpeed={}&inputText={}".format(self.voice, self.speed,
-                                                                                           base64.b64encode(
-                                                                                               self.text.encode()).decode())).content
+        if self.__info_modified and len(self.chunks) > 1:
+            self.__mp3_data = b"".join(self.__iter_chunks())
             self.__info_modified = False
+        elif self.__info_modified:
+            cached_fp = self.__open_cached()
+            if cached_fp is not None:
+                with cached_fp:
+                    self.__mp3_data = cached_fp.read()
+                self.__info_modified = False
+            else:
+                self.__download()
         return self.__mp3_data
 
+    def __download(self):
+        self.__mp3_data = self.__fetch_phrase(self.voice, self.speed, self.text)
+        self.__info_modified = False
+
+    def __fetch_phrase(self, voice, speed, text) -> bytes:
+        """Downloads the phrase and puts it to the audio cache, sharing the download with the concurrent callers."""
+
+        def fetch():
+            mp3_data = self.__transport.get(_get_voice_stream_url(voice, speed, text)).content
+            if self.__audio_cache is not None:
+                self.__audio_cache.set(voice, speed, text, mp3_data)
+            return mp3_data
+
+        return _phrase_flights.do((id(self.__transport), voice, speed, text), fetch)
+
+    def __fetch_chunk(self, text) -> bytes:
+        voice, speed = self.voice, self.speed
+        if self.__audio_cache is not None:
+            cached_fp = self.__open_audio_cache(voice, speed, text)
+            if cached_fp is not None:
+                with cached_fp:
+                    return cached_fp.read()
+            return self.__fetch_phrase(voice, speed, text)
+
+        key = (voice, speed, text)
+        mp3_data = self.__chunk_data.get(key)
+        if mp3_data is None:
+            mp3_data = self.__chunk_data[key] = self.__fetch_phrase(voice, speed, text)
+        return mp3_data
+
+    def __iter_chunks(self):
+        """Yields the MP3 data of the chunks in order, fetching up to max_workers of them concurrently.
+
+        Every chunk is kept on its own (in the audio cache or, without one, by the instance until all the chunks
+        are yielded), so if one of them fails, only the failed (and not yet fetched) ones are requested again
+        next time.
+        """
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self.__fetch_chunk, chunk) for chunk in self.chunks]
+            try:
+                for i, future in enumerate(futures):
+                    yield future.result() if i == 0 else _strip_id3(future.result())
+                self.__chunk_data.clear()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def __get_cached_path(self):
+        """Returns the filename of the phrase in the audio cache unless the phrase is already in memory."""
+
+        if self.__audio_cache is None or not self.__info_modified or len(self.chunks) > 1:
+            return None
+        return self.__audio_cache.get_path(self.voice, self.speed, self.text)
+
+    def __open_cached(self):
+        if self.__audio_cache is None or not self.__info_modified:
+            return None
+        return self.__open_audio_cache(self.voice, self.speed, self.text)
+
+    def __open_audio_cache(self, voice, speed, text):
+        with instrumentation.timer("cache.get", cache=type(self.__audio_cache).__name__) as attributes:
+            cached_fp = self.__audio_cache.open(voice, speed, text)
+            attributes["hit"] = cached_fp is not None
+        return cached_fp
+
+    def iter_mp3(self, chunk_size=64 * 1024):
+        """A generator that yields the spoken phrase in MP3 chunks as soon as they are downloaded.
+
+        Unlike mp3_data, the chunks are yielded before the whole phrase is downloaded, so it's suitable for proxying
+        or playing the audio before the download finishes. With an audio cache, the phrase is never kept in memory
+        as a whole: it's written to the cache file, and the next reads come from there. Without one, the chunks are
+        kept and, if the stream is read to the end, remembered as mp3_data (the same as mp3_data does), so that
+        the phrase isn't downloaded again.
+
+        Args:
+            chunk_size: The maximum size of a chunk in bytes.
+
+        Yields:
+            Chunks of the MP3 data (bytes).
+        """
+
+        if not self.__info_modified:
+            mp3_data = self.__mp3_data
+            yield from (mp3_data[i:i + chunk_size] for i in range(0, len(mp3_data), chunk_size))
+            return
+
+        phrase, received = (self.voice, self.speed, self.text), []
+
+        if len(self.chunks) > 1:
+            for mp3_data in self.__iter_chunks():
+                received.append(mp3_data)
+                yield from (mp3_data[i:i + chunk_size] for i in range(0, len(mp3_data), chunk_size))
+            self.__remember(phrase, received)
+            return
+
+        cached_fp = self.__open_cached()
+        if cached_fp is not None:
+            with cached_fp:
+                yield from iter(lambda: cached_fp.read(chunk_size), b"")
+            return
+
+        voice, speed, text = self.voice, self.speed, self.text
+        with contextlib.ExitStack() as stack:
+            response = stack.enter_context(contextlib.closing(
+                self.__transport.get(_get_voice_stream_url(voice, speed, text), stream=True)))
+            cache_fp = (stack.enter_context(self.__audio_cache.writer(voice, speed, text))
+                        if self.__audio_cache is not None else None)
+
+            for chunk in response.iter_content(chunk_size):
+                if cache_fp is not None:
+                    cache_fp.write(chunk)
+                else:
+                    received.append(chunk)
+                yield chunk
+
+        if cache_fp is None:
+            self.__remember(phrase, received)
+
+    def __remember(self, phrase, received) -> None:
+        """Keeps the completely received MP3 data as mp3_data, unless the phrase has been changed meanwhile."""
+
+        if phrase == (self.voice, self.speed, self.text):
+            self.__mp3_data = b"".join(received)
+            self.__info_modified = False
+
     @property
     def voices(self):
         return self.__voices
 
+    @property
+    def voice_index(self):
+        return self.__voice_index
+
+    @property
+    def transport(self):
+        return self.__transport
+
+    @property
+    def audio_cache(self):
+        return self.__audio_cache
+
     @text.setter
     def text(self, value):
         assert isinstance(value, str), "text must be a string"
         self.__text = value
         self.__info_modified = True
+        self.__chunk_data.clear()
 
     @voice.setter
     def voice(self, value):
         if isinstance(value, Voice):
             value = value.name
-        assert value in self.__voice_names, "invalid voice"
+        assert value in self.__voice_index, "invalid voice"
         self.__voice = value
         self.__info_modified = True
+        self.__chunk_data.clear()
 
     @speed.setter
     def speed(self, value):
@@ -99,41 +444,53 @@ class ReversoVoiceAPI:
         assert 30 <= value <= 300, "speed must be 30 <= speed <= 300"
         self.__speed = value
         self.__info_modified = True
+        self.__chunk_data.clear()
 
     def write_to_file(self, file):
-        """Writes the spoken phrase to an MP3 file. You can specify either a filename-string or a file-like object.
-        If you are trying to pass another object as a file argument, TypeError is raised.
+        """Writes the spoken phrase to an MP3 file. You can specify either a filename-string, a file-like object or
+        a socket. If you are trying to pass another object as a file argument, TypeError is raised.
+
+        The phrase is streamed to the file chunk by chunk as it's being downloaded (unless it's already in memory),
+        so the memory usage is bounded even for long texts.
 
         Args:
-            file: The output file (both strings with filenames and file-like objects are supported)
+            file: The output file (strings with filenames, file-like objects and sockets are supported)
 
         Returns:
             none
 
         Raises:
-            TypeError: if not filename (string) or a file-like object is passed as a file argument.
+            TypeError: if not filename (string), a file-like object or a socket is passed as a file argument.
 
         """
 
         if isinstance(file, str):
             with open(file, "wb") as fp:
-                fp.write(self.mp3_data)
+                self.write_to_file(fp)
             return
-        if hasattr(file, "write"):
-            file.write(self.mp3_data)
-            return
-        raise TypeError("string or file-like object is required instead of {}".format(type(file)))
 
-    def say(self, wait=False):
+        write = getattr(file, "write", None) or getattr(file, "sendall", None)
+        if write is None:
+            raise TypeError("string, file-like object or socket is required instead of {}".format(type(file)))
+
+        for chunk in self.iter_mp3():
+            write(chunk)
+
+    def say(self, wait=False, sink=None):
         """Reads the given text aloud. The difference from other methods is that this one PLAYS
         the sound (you can hear it if sound is enabled in your OS and pygame is installed).
 
+        To say many phrases one after another, use reverso_api.playback.PlaybackQueue, which downloads
+        the next phrases while the current one is being played.
+
         Note:
             Pygame is necessary for this method to work! You should install it before calling this
             method, otherwise ImportError will be raised.
 
         Args:
             wait: Tells whether it's necessary to wait until the text is fully spoken
+            sink: The audio sink to play the text with (see reverso_api.playback), a PygameSink if not specified.
+                Its play() is called with the filename of the phrase if it's in the audio cache, or with the MP3 data.
 
         Returns:
             none
@@ -143,18 +500,94 @@ class ReversoVoiceAPI:
 
         """
 
+        from .playback import PygameSink  # playback depends on this module
+
+        if sink is None:
+            sink = PygameSink()  # the mixer is initialized only once
+        cached_path = self.__get_cached_path()
+        sink.play(cached_path if cached_path is not None else self.mp3_data)
+        if wait:
+            sink.wait()
+
+
+def _write_output(api, output) -> None:
+    if callable(output):
+        output(api.mp3_data)
+    else:
+        api.write_to_file(output)
+
+
+def _synthesize(jobs, transport, catalog, audio_cache) -> list:
+    """Fetches the phrase shared by the identical jobs once and writes it to the output of every job."""
+
+    started_at = time.perf_counter()
+    results = []
+
+    try:
+        text, voice, speed, _ = jobs[0]
+        api = ReversoVoiceAPI(text, voice, speed, transport=transport, catalog=catalog, audio_cache=audio_cache)
+        if len(jobs) > 1:
+            api.mp3_data  # keep the phrase in memory instead of streaming it again for every output
+    except Exception as e:
+        latency = time.perf_counter() - started_at
+        return [SynthesisResult(job, latency, e) for job in jobs]
+
+    for job in jobs:
+        error = None
+        try:
+            _write_output(api, job.output)
+        except Exception as e:
+            error = e
+        results.append(SynthesisResult(job, time.perf_counter() - started_at, error))
+
+    return results
+
+
+def synthesize_many(jobs, max_workers=8, transport=None, catalog=None, audio_cache=None):
+    """A generator that speaks many phrases concurrently and yields the results as soon as they are ready.
+
+    The identical jobs (the same text, voice and speed) are fetched only once, and the phrase is written
+    to the output of each of them. All the jobs share one transport (and so one connection pool),
+    one catalog and one audio cache.
+
+    A failed job doesn't affect the others: its exception is reported in its SynthesisResult.
+
+    Example:
+        jobs = [("Hello", "Heather22k", 100, "hello.mp3"), ("Bye", "Heather22k", 100, sock.sendall)]
+        for result in synthesize_many(jobs):
+            if result.error is not None:
+                ...
+
+    Args:
+        jobs: An iterable of SynthesisJob namedtuples (or plain (text, voice, speed, output) tuples). The output
+            is either anything accepted by ReversoVoiceAPI.write_to_file() or a callable, which is called with
+            the MP3 data (bytes).
+        max_workers: The maximum number of phrases fetched concurrently.
+        transport: The Transport to fetch the phrases with (the default one is used if not specified).
+        catalog: The CatalogCache to look the voices up in (the default one is used if not specified).
+        audio_cache: The AudioCache shared by all the jobs.
+
+    Yields:
+        SynthesisResult namedtuples (one per job) in the completion order. The latency is the number of seconds
+        passed since the phrase started being fetched until its output was written, and the error is
+        the exception raised by the job (None if it succeeded).
+    """
+
+    transport = transport if transport is not None else get_default_transport()
+    catalog = catalog if catalog is not None else get_default_catalog()
+
+    grouped_jobs = {}
+    for job in jobs:
+        job = SynthesisJob(*job)
+        grouped_jobs.setdefault((job.text, job.voice.name if isinstance(job.voice, Voice) else job.voice, job.speed),
+                                []).append(job)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_synthesize, jobs, transport, catalog, audio_cache)
+                   for jobs in grouped_jobs.values()]
         try:
-            with contextlib.redirect_stdout(None):  # to remove the "Hello from the pygame community..." message
-                import pygame
-        except ImportError:
-            raise ImportError("pygame is required for playing mp3 files, so you should install it first")
-
-        pygame.mixer.init()
-        with io.BytesIO() as fp:
-            self.write_to_file(fp)
-            fp.seek(0)
-            pygame.mixer.music.load(fp)
-            pygame.mixer.music.play()
-            if wait:
-                while pygame.mixer.music.get_busy():
-                    pygame.time.delay(100)
+            for future in as_completed(futures):
+                yield from future.result()
+        finally:
+            for future in futures:
+                future.cancel()
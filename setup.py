@@ -17,7 +17,7 @@ setuptools.setup(
     download_url="https://github.com/demian-wolf/ReversoAPI/archive/v0.0.1.beta.3.tar.gz",
     keywords=["REVERSO", "REVERSO-CONTEXT", "REVERSO CONTEXT", "CONTEXT", "REVERSO-VOICE", "REVERSO VOICE", "VOICE",
               "REVERSO-API", "API", "WRAPPER", "PYTHON"],
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(exclude=("tests", "tests.*", "benchmarks", "benchmarks.*")),
     install_requires=[
         "requests",
         "beautifulsoup4",
@@ -25,6 +25,9 @@ setuptools.setup(
     ],
     extras_require={
         "playing spoken text instead of just getting its MP3 data and/or saving it to file-like objects": ["pygame"],
+        "async": ["aiohttp"],
+        "columnar export": ["numpy", "pyarrow"],
+        "prometheus metrics": ["prometheus_client"],
     },
     classifiers=[
         "Programming Language :: Python :: 3",
@@ -2,6 +2,28 @@ import unittest
 
 from .test_voice import TestReversoVoiceAPI
 from .test_context import TestReversoContextAPI
+from .test_transport import TestTransport
+from .test_catalog import TestCatalogCache
+from .test_aio import TestAsyncReversoContextAPI
+from .test_examples import TestGetExamples
+from .test_highlight import TestParseContext
+from .test_cache import TestMemoryCache, TestSQLiteCache, TestAudioCache
+from .test_streaming import TestStreaming
+from .test_batch import TestTranslateMany
+from .test_synthesis import TestSynthesizeMany
+from .test_chunking import TestChunking
+from .test_columnar import TestColumnar
+from .test_crawler import TestCrawler
+from .test_mock_server import TestMockServer
+from .test_instrumentation import TestInstrumentation
+from .test_imports import TestImports
+from .test_singleflight import TestSingleFlight, TestAsyncSingleFlight
+from .test_index import TestLanguageIndex, TestVoiceIndex
+from .test_client import TestContextClient
+from .test_view import TestExampleView
+from .test_json_stream import TestJSONStream
+from .test_pipeline import TestParsePool
+from .test_playback import TestPlaybackQueue
 
 
 if __name__ == "__main__":
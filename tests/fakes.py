@@ -0,0 +1,76 @@
+"""Offline stand-ins for the transports, serving the recorded pages from tests/data"""
+
+import json
+import os
+import threading
+
+from reverso_api.catalog import CatalogCache
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+CATALOG = CatalogCache(snapshot={
+    "supported_langs": {"source_lang": ["en", "ru"], "target_lang": ["en", "ru"]},
+    "voices": [{"Name": "Heather22k", "Language": "US English", "LangCode": "1033", "Gender": "F"},
+               {"Name": "Mark22k", "Language": "US English", "LangCode": "1033", "Gender": "M"}],
+})
+
+
+def read_page(npage):
+    with open(os.path.join(DATA_DIR, "context", "github_en_ru_{}.json".format(npage)), "rb") as fp:
+        return fp.read()
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode()
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size=1):
+        return (self.content[i:i + chunk_size] for i in range(0, len(self.content), chunk_size))
+
+    def close(self):
+        pass
+
+
+class FakeTransport:
+    """Serves the recorded pages for bst-query-service and mp3_data for any GET request."""
+
+    def __init__(self, mp3_data=b"mp3"):
+        self.mp3_data = mp3_data
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        with self.lock:
+            self.requests.append(url)
+        return FakeResponse(self.mp3_data)
+
+    def post(self, url, data, **kwargs):
+        with self.lock:
+            self.requests.append(url)
+        return FakeResponse(read_page(json.loads(data).get("npage", 1)))
+
+
+class FakeAsyncTransport:
+    """The same as FakeTransport, but for the asyncio API."""
+
+    def __init__(self):
+        self.requests = []
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+    async def get(self, url, **kwargs):
+        self.requests.append(url)
+        return b"mp3"
+
+    async def post(self, url, data, **kwargs):
+        self.requests.append(url)
+        return read_page(json.loads(data).get("npage", 1))
@@ -0,0 +1,150 @@
+"""Local stand-in for context.reverso.net and voice.reverso.net, which replays the responses recorded in tests/data
+
+Usage:
+    with MockReversoServer(latency=0.05, npages=20) as server:
+        api = ReversoContextAPI("GitHub", "", "en", "ru", transport=server.transport(), catalog=CatalogCache())
+"""
+
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from reverso_api.context import BASE_URL as CONTEXT_BASE_URL
+from reverso_api.transport import Transport
+from reverso_api.voice import BASE_URL as VOICE_BASE_URL
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+VOICES = {"Voices": [{"Name": "Heather22k", "Language": "US English", "LangCode": "1033", "Gender": "F"},
+                     {"Name": "Mark22k", "Language": "US English", "LangCode": "1033", "Gender": "M"}]}
+
+
+def _read(*path):
+    with open(os.path.join(DATA_DIR, *path), "rb") as fp:
+        return fp.read()
+
+
+class MockReversoServer(object):
+    """HTTP server on localhost, which serves the recorded bst-query-service pages (cycling them for any number
+    of pages), the /translation/ page, and the voices list and the MP3 of the Voice API, each after a delay.
+
+    Attributes:
+        latency
+        npages
+        url
+        requests
+    """
+
+    def __init__(self, latency=0.0, npages=2) -> None:
+        """
+        Args:
+            latency: How many seconds the server waits before every response.
+            npages: How many pages of examples every query has.
+        """
+
+        self.latency = latency
+        self.npages = npages
+        self.requests = 0
+
+        self.__pages = [json.loads(_read("context", "github_en_ru_{}.json".format(npage))) for npage in (1, 2)]
+        self.__translation_page = _read("context", "translation.html")
+        self.__mp3_data = _read("voice", "hello_world_us.mp3")
+        self.__lock = threading.Lock()
+
+        self.__server = ThreadingHTTPServer(("127.0.0.1", 0), self.__make_handler())
+        self.__server.daemon_threads = True
+        self.__thread = None
+
+    def __repr__(self) -> str:
+        return "{}(latency={!r}, npages={!r})".format(type(self).__name__, self.latency, self.npages)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        return "http://{}:{}/".format(*self.__server.server_address)
+
+    def start(self) -> None:
+        self.__thread = threading.Thread(target=self.__server.serve_forever, daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        self.__server.shutdown()
+        self.__server.server_close()
+        self.__thread.join()
+
+    def transport(self, **kwargs) -> Transport:
+        """Returns a Transport, which sends the requests for the Reverso services to this server instead."""
+
+        return LocalTransport(self.url, **kwargs)
+
+    def respond(self, method, path, body) -> tuple:
+        """Returns the (content type, content) tuple of the response to the request (or None for 404)."""
+
+        with self.__lock:
+            self.requests += 1
+        time.sleep(self.latency)
+
+        if method == "POST" and path.startswith("/context/bst-query-service"):
+            npage = json.loads(body).get("npage", 1)
+            page = dict(self.__pages[(npage - 1) % len(self.__pages)], npages=self.npages)
+            return "application/json", json.dumps(page).encode()
+        if method == "GET" and path.startswith("/context/translation/"):
+            return "text/html", self.__translation_page
+        if method == "GET" and "/GetAvailableVoices" in path:
+            return "application/json", json.dumps(VOICES).encode()
+        if method == "GET" and "/GetVoiceStream/" in path:
+            return "audio/mpeg", self.__mp3_data
+        return None
+
+    def __make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, the same as the real services
+            disable_nagle_algorithm = True  # the headers and the body are written separately
+
+            def do_GET(self):
+                self.__respond(server.respond("GET", self.path, None))
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                self.__respond(server.respond("POST", self.path, body))
+
+            def __respond(self, response):
+                if response is None:
+                    self.send_error(404)
+                    return
+                content_type, content = response
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+class LocalTransport(Transport):
+    """Transport, which redirects the requests for context.reverso.net and voice.reverso.net to a local server."""
+
+    def __init__(self, url, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.__prefixes = ((CONTEXT_BASE_URL, url + "context/"), (VOICE_BASE_URL, url + "voice/"))
+
+    def request(self, method, url, **kwargs):
+        for prefix, local_prefix in self.__prefixes:
+            if url.startswith(prefix):
+                url = local_prefix + url[len(prefix):]
+                break
+        return super().request(method, url, **kwargs)
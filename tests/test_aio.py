@@ -0,0 +1,72 @@
+import asyncio
+import unittest
+
+try:
+    from reverso_api.aio import AsyncReversoContextAPI, AsyncReversoVoiceAPI
+except ImportError:
+    AsyncReversoContextAPI = AsyncReversoVoiceAPI = None
+from reverso_api.context import WordUsageContext, Translation
+
+from .fakes import CATALOG, FakeAsyncTransport
+
+
+@unittest.skipIf(AsyncReversoContextAPI is None, "aiohttp is not installed")
+class TestAsyncReversoContextAPI(unittest.IsolatedAsyncioTestCase):
+    async def test__get_examples(self):
+        transport = FakeAsyncTransport()
+        api = await AsyncReversoContextAPI.create("GitHub", "", "en", "ru", transport=transport, catalog=CATALOG)
+
+        examples = [example async for example in api.get_examples()]
+        self.assertEqual(len(examples), 8)
+        self.assertEqual(examples[0][0], WordUsageContext("I found it on GitHub.", ((14, 20),)))
+        self.assertEqual(len(transport.requests), 2)
+
+    async def test__get_translations(self):
+        api = await AsyncReversoContextAPI.create("GitHub", "", "en", "ru",
+                                                  transport=FakeAsyncTransport(), catalog=CATALOG)
+
+        translations = [translation async for translation in api.get_translations()]
+        self.assertTrue(all(isinstance(translation, Translation) for translation in translations))
+        self.assertEqual(translations[1].inflected_forms[0].translation, "Гитхабе")
+
+    async def test__mp3_data(self):
+        transport = FakeAsyncTransport()
+        api = await AsyncReversoVoiceAPI.create("Hello, World!", "Heather22k", transport=transport, catalog=CATALOG)
+
+        self.assertEqual(await api.mp3_data(), b"mp3")
+        self.assertEqual(await api.mp3_data(), b"mp3")
+        self.assertEqual(len(transport.requests), 1)
+
+    async def test__phrase_changed_while_fetching(self):
+        class EchoTransport(FakeAsyncTransport):
+            async def get(self, url, **kwargs):
+                await asyncio.sleep(0)
+                await super().get(url, **kwargs)
+                return url.encode()
+
+        transport = EchoTransport()
+        api = await AsyncReversoVoiceAPI.create("first", "Heather22k", transport=transport, catalog=CATALOG)
+        fetching = asyncio.ensure_future(api.mp3_data())
+        await asyncio.sleep(0)
+        api.text = "second"
+        first = await fetching
+
+        second = await api.mp3_data()
+        self.assertNotEqual(second, first)
+        self.assertEqual(await api.mp3_data(), second)
+        self.assertEqual(len(transport.requests), 2)
+
+    async def test__owned_transport(self):
+        for create in (lambda transport: AsyncReversoContextAPI.create("GitHub", "", "en", "ru",
+                                                                       transport=transport, catalog=CATALOG),
+                       lambda transport: AsyncReversoVoiceAPI.create("Hello", "Heather22k",
+                                                                     transport=transport, catalog=CATALOG)):
+            async with await create(None) as api:
+                session = api.transport.session
+            self.assertTrue(session.closed)
+
+            transport = FakeAsyncTransport()
+            async with await create(transport):
+                pass
+            self.assertFalse(transport.closed)
+
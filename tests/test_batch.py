@@ -0,0 +1,27 @@
+import unittest
+
+from reverso_api.context import translate_many
+
+from .fakes import CATALOG, FakeTransport
+
+
+class TestTranslateMany(unittest.TestCase):
+    """Offline tests of translate_many() on the recorded pages"""
+
+    def setUp(self):
+        self.transport = FakeTransport()
+
+    def test__translate_many(self):
+        words = ["GitHub", "Git", ("GitLab", "ru", "en")] + ["word{}".format(i) for i in range(20)]
+        results = dict(translate_many(words, "en", "ru", max_workers=4, transport=self.transport, catalog=CATALOG))
+        self.assertEqual(set(results), set(words))
+        self.assertEqual(len(self.transport.requests), len(words))
+        self.assertEqual([translation.source_word for translation in results["Git"]], ["Git", "Git"])
+        self.assertEqual(results[("GitLab", "ru", "en")][0].source_word, "GitLab")
+
+    def test__errors_are_isolated(self):
+        words = ["GitHub", ("GitHub", "xx", "ru"), "Git"]
+        results = dict(translate_many(words, "en", "ru", transport=self.transport, catalog=CATALOG))
+        self.assertIsInstance(results[("GitHub", "xx", "ru")], ValueError)
+        self.assertEqual(len(results["GitHub"]), 2)
+        self.assertEqual(len(results["Git"]), 2)
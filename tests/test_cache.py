@@ -0,0 +1,85 @@
+import io
+import os
+import tempfile
+import unittest
+
+from reverso_api.cache import MemoryCache, SQLiteCache, AudioCache, CacheStats
+from reverso_api.context import ReversoContextAPI
+from reverso_api.voice import ReversoVoiceAPI
+
+from .fakes import CATALOG, FakeTransport
+
+
+class TestMemoryCache(unittest.TestCase):
+    def test__lru(self):
+        cache = MemoryCache(maxsize=2)
+        cache.set(("a",), "1")
+        cache.set(("b",), "2")
+        cache.get(("a",))
+        cache.set(("c",), "3")
+        self.assertIsNone(cache.get(("b",)))
+        self.assertEqual(cache.get(("a",)), "1")
+        self.assertEqual(cache.stats, CacheStats(hits=2, misses=1, size=2))
+
+    def test__ttl(self):
+        cache = MemoryCache(ttl=0)
+        cache.set(("a",), "1")
+        self.assertIsNone(cache.get(("a",)))
+
+    def test__warm_queries(self):
+        cache = MemoryCache()
+        for _ in range(2):
+            transport = FakeTransport()
+            api = ReversoContextAPI("GitHub", "", "en", "ru", transport=transport, catalog=CATALOG, cache=cache)
+            self.assertEqual(len(list(api.get_examples())), 8)
+        self.assertEqual(len(transport.requests), 0)
+        self.assertEqual(cache.stats, CacheStats(hits=2, misses=2, size=2))
+
+
+class TestSQLiteCache(unittest.TestCase):
+    def test__persistence_and_eviction(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "cache.sqlite")
+
+            cache = SQLiteCache(path, maxsize=2)
+            for key in ("a", "b", "c"):
+                cache.set(("word", key, 1), key)
+            cache.close()
+
+            cache = SQLiteCache(path, maxsize=2)
+            self.assertEqual(len(cache), 2)
+            self.assertIsNone(cache.get(("word", "a", 1)))
+            self.assertEqual(cache.get(("word", "c", 1)), "c")
+            self.assertEqual(cache.stats, CacheStats(hits=1, misses=1, size=2, bytes=2))
+            cache.close()
+
+
+class TestAudioCache(unittest.TestCase):
+    def test__voice_api(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            audio_cache = AudioCache(tmpdir)
+            for _ in range(2):
+                transport = FakeTransport()
+                api = ReversoVoiceAPI("Hello, World!", "Heather22k",
+                                      transport=transport, catalog=CATALOG, audio_cache=audio_cache)
+                with io.BytesIO() as fp:
+                    api.write_to_file(fp)
+                    self.assertEqual(fp.getvalue(), b"mp3")
+            self.assertEqual(len(transport.requests), 0)
+            self.assertEqual(api.mp3_data, b"mp3")
+            self.assertEqual(audio_cache.stats, CacheStats(hits=2, misses=1, size=1, bytes=3))
+
+    def test__eviction(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            audio_cache = AudioCache(tmpdir, maxsize=10)
+            audio_cache.set("Heather22k", 100, "first", b"12345")
+            os.utime(audio_cache.get_path("Heather22k", 100, "first"), (0, 0))
+            audio_cache.set("Heather22k", 100, "second", b"12345")
+            audio_cache.set("Heather22k", 100, "third", b"12345")
+
+            self.assertIsNone(audio_cache.get_path("Heather22k", 100, "first"))
+            with audio_cache.open("Heather22k", 100, "third") as fp:
+                self.assertEqual(fp.read(), b"12345")
+            self.assertEqual(len(audio_cache), 2)
+            self.assertEqual(audio_cache.stats[2:], (2, 10))
+            self.assertEqual(AudioCache(tmpdir).stats[2:], (2, 10))
@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+
+from reverso_api.catalog import CatalogCache
+from reverso_api.context import ReversoContextAPI
+from reverso_api.voice import ReversoVoiceAPI, Voice
+
+SNAPSHOT = {
+    "supported_langs": {"source_lang": ["en", "ru", "uk"],
+                        "target_lang": ["en", "ru", "uk"]},
+    "voices": [{"Name": "Heather22k", "Language": "US English", "LangCode": "1033", "Gender": "F"}],
+}
+
+
+def fail():
+    raise AssertionError("the catalog must not be fetched")
+
+
+class TestCatalogCache(unittest.TestCase):
+    def test__memoization(self):
+        calls = []
+        catalog = CatalogCache()
+        for _ in range(3):
+            self.assertEqual(catalog.get("voices", lambda: calls.append(1) or ["voice"]), ["voice"])
+        self.assertEqual(len(calls), 1)
+
+    def test__ttl(self):
+        calls = []
+        catalog = CatalogCache(ttl=0)
+        for _ in range(2):
+            catalog.get("voices", lambda: calls.append(1) or ["voice"])
+        self.assertEqual(len(calls), 2)
+
+    def test__disk(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "catalog.json")
+            CatalogCache(path=path).get("voices", lambda: ["voice"])
+            self.assertEqual(CatalogCache(path=path).get("voices", fail), ["voice"])
+
+    def test__snapshot(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "snapshot.json")
+            CatalogCache(snapshot=SNAPSHOT).save_snapshot(path)
+            catalog = CatalogCache(snapshot=path)
+            self.assertEqual(catalog.get("voices", fail), SNAPSHOT["voices"])
+
+    def test__offline_construction(self):
+        catalog = CatalogCache(snapshot=SNAPSHOT)
+
+        api = ReversoContextAPI("hello", "", "en", "ru", catalog=catalog)
+        self.assertEqual(api.supported_langs["source_lang"], ("en", "ru", "uk"))
+
+        api = ReversoVoiceAPI("Hello, World!", "Heather22k", catalog=catalog)
+        self.assertEqual(api.voices, {"US English": [Voice("Heather22k", (1033, "US English"), "F")]})
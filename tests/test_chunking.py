@@ -0,0 +1,64 @@
+import tempfile
+import unittest
+
+from reverso_api.cache import AudioCache
+from reverso_api.voice import ReversoVoiceAPI, _get_voice_stream_url, _split_text, _strip_id3
+
+from .fakes import CATALOG, FakeTransport
+
+TEXT = ("Reverso Voice reads the text aloud. It supports plenty of languages, voices and speeds; "
+        "however, the text is passed in the URL, so it cannot be arbitrarily long!")
+
+
+class TestChunking(unittest.TestCase):
+    def test__split_text(self):
+        self.assertEqual(_split_text("Hello, World! How are you?", 15), ["Hello, World!", "How are you?"])
+        self.assertEqual(_split_text("Hello, World! How are you?", 100), ["Hello, World! How are you?"])
+        self.assertEqual(_split_text("Hello, World!", 8), ["Hello,", "World!"])
+        self.assertEqual(_split_text("abcdefghij", 4), ["abcd", "efgh", "ij"])
+
+        chunks = _split_text(TEXT, 40)
+        self.assertTrue(all(len(chunk) <= 40 for chunk in chunks))
+        self.assertEqual(" ".join(chunks), TEXT)
+
+    def test__strip_id3(self):
+        self.assertEqual(_strip_id3(b"ID3\x04\x00\x00\x00\x00\x00\x02ab\xff\xfb"), b"\xff\xfb")
+        self.assertEqual(_strip_id3(b"\xff\xfb"), b"\xff\xfb")
+
+    def test__chunked_mp3_data(self):
+        transport = FakeTransport()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            audio_cache = AudioCache(tmpdir)
+            api = ReversoVoiceAPI(TEXT, "Heather22k", transport=transport, catalog=CATALOG,
+                                  audio_cache=audio_cache, chunk_length=40)
+
+            nchunks = len(api.chunks)
+            self.assertGreater(nchunks, 1)
+            self.assertEqual(api.mp3_data, b"mp3" * nchunks)
+            self.assertEqual(len(transport.requests), nchunks)
+            self.assertEqual(len(audio_cache), nchunks)
+
+            api.speed = 100  # the chunks are served from the audio cache now
+            self.assertEqual(b"".join(api.iter_mp3(chunk_size=2)), b"mp3" * nchunks)
+            self.assertEqual(len(transport.requests), nchunks)
+
+    def test__retry_failed_chunk(self):
+        class FailingOnceTransport(FakeTransport):
+            def get(self, url, **kwargs):
+                response = super().get(url, **kwargs)
+                if url == failing_url and not failed:
+                    failed.append(url)
+                    raise OSError("connection reset")
+                return response
+
+        transport, failed = FailingOnceTransport(), []
+        chunks = _split_text(TEXT, 40)
+        failing_url = _get_voice_stream_url("Heather22k", 100, chunks[-1])
+        api = ReversoVoiceAPI(TEXT, "Heather22k", transport=transport, catalog=CATALOG, chunk_length=40,
+                              max_workers=len(chunks))  # all the chunks are fetched before the failure is seen
+
+        with self.assertRaises(OSError):
+            api.mp3_data
+        self.assertEqual(len(transport.requests), len(chunks))
+        self.assertEqual(api.mp3_data, b"mp3" * len(chunks))  # without an audio cache too
+        self.assertEqual(transport.requests[len(chunks):], [failing_url])
@@ -0,0 +1,83 @@
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from reverso_api.cache import MemoryCache
+from reverso_api.context import ReversoContextAPI, ContextClient, Query
+
+from .fakes import CATALOG, FakeTransport
+
+
+class TestContextClient(unittest.TestCase):
+    """Offline tests of the stateless ContextClient on the recorded pages"""
+
+    def setUp(self):
+        self.transport = FakeTransport()
+        self.client = ContextClient(self.transport, CATALOG)
+
+    def test__query(self):
+        query = Query("GitHub", "", "en", "ru")
+        self.assertEqual(hash(query), hash(Query("GitHub", "", "en", "ru")))
+        self.assertEqual(len({query: 1, Query("GitHub", "", "en", "ru"): 2}), 1)
+        with self.assertRaises(AttributeError):
+            query.source_lang = "ru"
+
+    def test__same_results_as_api(self):
+        api = ReversoContextAPI("GitHub", "", "en", "ru", transport=FakeTransport(), catalog=CATALOG)
+        query = api.query
+        self.assertEqual(query, Query("GitHub", "", "en", "ru"))
+        self.assertEqual(self.client.total_pages(query), api.total_pages)
+        self.assertEqual(list(self.client.get_translations(query)), list(api.get_translations()))
+        self.assertEqual(list(self.client.get_examples(tuple(query))), list(api.get_examples()))
+        self.assertEqual([list(batch) for batch in self.client.get_example_batches(query, start_page=2)],
+                         [list(batch) for batch in api.get_example_batches(start_page=2)])
+
+    def test__first_page(self):
+        query = Query("GitHub", "", "en", "ru")
+        first_page = self.client.get_page(query, 1)
+        total_pages = self.client.total_pages(query, first_page=first_page)
+        del self.transport.requests[:]
+
+        self.assertEqual(self.client.total_pages(query, first_page), total_pages)
+        self.assertTrue(list(self.client.get_translations(query, first_page=first_page)))
+        self.client.get_example_view(query, first_page=first_page).page(1)
+        self.assertEqual(self.transport.requests, [])
+
+        expected = list(self.client.get_examples(query))
+        for stream in (False, True):
+            del self.transport.requests[:]
+            self.assertEqual(list(self.client.get_examples(query, stream=stream, first_page=first_page)), expected)
+            self.assertEqual(len(self.transport.requests), total_pages - 1)
+        self.assertEqual(list(self.client.get_examples(query, stream=True, max_examples=1, first_page=first_page)),
+                         expected[:1])
+        self.assertEqual(list(self.client.get_examples(query, stream=True, max_pages=0, first_page=first_page)), [])
+
+    def test__first_page_of_changed_query(self):
+        class RecordingTransport(FakeTransport):
+            def post(self, url, data, **kwargs):
+                posted.append((json.loads(data)["source_text"], json.loads(data)["npage"]))
+                return super().post(url, data, **kwargs)
+
+        posted = []
+        api = ReversoContextAPI("GitHub", "", "en", "ru", transport=RecordingTransport(), catalog=CATALOG)
+        list(api.get_translations())
+        api.source_text = "hello"
+        list(api.get_examples(stream=True, max_pages=2))
+        self.assertEqual(posted, [("GitHub", 1), ("hello", 1), ("hello", 2)])
+
+    def test__validate(self):
+        for query in (("GitHub", "", "en", "en"), ("GitHub", "", "xx", "ru")):
+            with self.assertRaises(ValueError):
+                self.client.validate(query)
+            with self.assertRaises(ValueError):
+                list(self.client.get_examples(query))
+        self.assertEqual(self.transport.requests, [])
+
+    def test__shared_between_threads(self):
+        client = ContextClient(self.transport, CATALOG, cache=MemoryCache())
+        queries = [Query("word{}".format(i), "", *langs) for i in range(20) for langs in (("en", "ru"), ("ru", "en"))]
+        expected = list(client.get_examples(queries[0], max_examples=30))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda query: list(client.get_examples(query, prefetch=2)), queries))
+        self.assertTrue(all(result[:30] == expected for result in results))
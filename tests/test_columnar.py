@@ -0,0 +1,56 @@
+import unittest
+
+from reverso_api.columnar import ExampleBatch, TranslationBatch
+from reverso_api.context import ReversoContextAPI
+
+from .fakes import CATALOG, FakeTransport
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+class TestColumnar(unittest.TestCase):
+    def setUp(self):
+        self.api = ReversoContextAPI("GitHub", "", "en", "ru", transport=FakeTransport(), catalog=CATALOG)
+        self.examples = list(self.api.get_examples())
+        self.translations = list(self.api.get_translations())
+
+    def test__example_batch(self):
+        batch = ExampleBatch(self.examples)
+        self.assertEqual(len(batch), len(self.examples))
+        self.assertEqual(list(batch), self.examples)
+        self.assertEqual(batch[-1], self.examples[-1])
+
+    def test__example_batches(self):
+        batches = list(self.api.get_example_batches(prefetch=2))
+        self.assertEqual([len(batch) for batch in batches], [5, 3])
+        self.assertEqual([example for batch in batches for example in batch], self.examples)
+
+    def test__translation_batch(self):
+        batch = TranslationBatch(self.translations)
+        self.assertEqual(list(batch), self.translations)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test__to_numpy(self):
+        columns = ExampleBatch(self.examples).to_numpy()
+        self.assertEqual(list(columns["source_text"]), [source.text for source, _ in self.examples])
+        self.assertEqual(int(columns["target_highlight_offsets"][-1]),
+                         sum(len(target.highlighted) for _, target in self.examples))
+        self.assertEqual(list(TranslationBatch(self.translations).to_numpy()["translation"]),
+                         [translation.translation for translation in self.translations])
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test__to_arrow(self):
+        record_batch = ExampleBatch(self.examples).to_arrow()
+        self.assertEqual(record_batch.num_rows, len(self.examples))
+        self.assertEqual([tuple((h["start"], h["end"]) for h in row)
+                          for row in record_batch.column("target_highlighted").to_pylist()],
+                         [target.highlighted for _, target in self.examples])
+        self.assertEqual(TranslationBatch(self.translations).to_arrow().num_rows, len(self.translations))
@@ -0,0 +1,95 @@
+import json
+import os
+import tempfile
+import unittest
+
+from reverso_api.context import Query
+from reverso_api.crawler import CrawlQuery, CrawlCheckpoint, JSONLWriter, ParquetWriter, Crawler
+
+from .fakes import CATALOG, FakeTransport
+
+try:
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+QUERIES = [("GitHub", "en", "ru"), ("Git", "en", "ru"), ("GitLab", "ru", "en")]
+
+
+class FailingWriter:
+    def __init__(self, writer, npages):
+        self.writer, self.npages = writer, npages
+
+    def write(self, query, npage, batch):
+        if self.npages == 0:
+            raise OSError("disk is full")
+        self.npages -= 1
+        self.writer.write(query, npage, batch)
+
+
+class TestCrawler(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.transport = FakeTransport()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+    def crawl(self, writer, checkpoint, queries=QUERIES):
+        return Crawler(queries, writer, checkpoint, max_workers=2, transport=self.transport, catalog=CATALOG).run()
+
+    def test__crawl_and_resume(self):
+        with CrawlCheckpoint(self.path("checkpoint")) as checkpoint:
+            with JSONLWriter(self.path("examples.jsonl")) as writer:
+                with self.assertRaises(OSError):
+                    self.crawl(FailingWriter(writer, 3), checkpoint)
+
+            with JSONLWriter(self.path("examples.jsonl")) as writer:
+                stats = self.crawl(writer, checkpoint)
+            self.assertLessEqual(stats.queries, 2)
+            self.assertEqual(stats.errors, 0)
+            self.assertTrue(all(checkpoint.is_done(query) for query in QUERIES))
+
+            with JSONLWriter(self.path("examples.jsonl")) as writer:
+                self.assertEqual(self.crawl(writer, checkpoint).queries, 0)
+
+        with open(self.path("examples.jsonl"), encoding="utf-8") as fp:
+            records = [json.loads(line) for line in fp]
+        pages = {(record["source_text"], record["page"]) for record in records}
+        self.assertEqual(len(pages), 6)
+        self.assertEqual(len(records), 24)
+        self.assertEqual(records[0]["target_text"], "")
+
+    def test__context_queries(self):
+        queries = [Query("GitHub", "", "en", "ru"), CrawlQuery("GitLab", "ru", "en")]
+        with CrawlCheckpoint(self.path("checkpoint")) as checkpoint:
+            with JSONLWriter(self.path("examples.jsonl")) as writer:
+                stats = self.crawl(writer, checkpoint, queries)
+            self.assertEqual(stats.errors, 0)
+            self.assertTrue(checkpoint.is_done(Query("GitHub", "", "en", "ru")))
+            self.assertTrue(checkpoint.is_done(("GitHub", "en", "ru")))
+
+        with open(self.path("examples.jsonl"), encoding="utf-8") as fp:
+            langs = {(record["source_text"], record["source_lang"], record["target_lang"], record["target_text"])
+                     for record in map(json.loads, fp)}
+        self.assertEqual(langs, {("GitHub", "en", "ru", ""), ("GitLab", "ru", "en", "")})
+
+    def test__errors(self):
+        queries = QUERIES + [CrawlQuery("GitHub", "xx", "ru")]
+        with CrawlCheckpoint(self.path("checkpoint")) as checkpoint:
+            with JSONLWriter(self.path("examples.jsonl")) as writer:
+                stats = self.crawl(writer, checkpoint, queries)
+            self.assertEqual(stats.errors, 1)
+            self.assertEqual(list(checkpoint.errors()), [queries[-1]])
+            self.assertFalse(checkpoint.is_done(queries[-1]))
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test__parquet(self):
+        with CrawlCheckpoint(self.path("checkpoint")) as checkpoint, ParquetWriter(self.path("parquet")) as writer:
+            self.crawl(writer, checkpoint)
+        table = pyarrow.parquet.read_table(writer.path)
+        self.assertEqual(table.num_rows, 24)
+        self.assertEqual(set(table.column("query_source_text").to_pylist()), {"GitHub", "Git", "GitLab"})
@@ -0,0 +1,36 @@
+import unittest
+
+from reverso_api.context import ReversoContextAPI, WordUsageContext
+
+from .fakes import CATALOG, FakeTransport
+
+
+class TestGetExamples(unittest.TestCase):
+    """Offline tests of ReversoContextAPI.get_examples() on the recorded pages"""
+
+    def setUp(self):
+        self.transport = FakeTransport()
+        self.api = ReversoContextAPI("GitHub", "", "en", "ru", transport=self.transport, catalog=CATALOG)
+
+    def test__sequential(self):
+        examples = list(self.api.get_examples())
+        self.assertEqual(len(examples), 8)
+        self.assertEqual(examples[0][0], WordUsageContext("I found it on GitHub.", ((14, 20),)))
+        self.assertEqual(examples[6][1].highlighted, ((2, 8), (35, 38)))
+
+    def test__prefetch(self):
+        self.assertEqual(list(self.api.get_examples(prefetch=4)), list(self.api.get_examples()))
+
+    def test__limits(self):
+        self.assertEqual(len(list(self.api.get_examples(max_pages=1))), 5)
+        self.assertEqual(len(list(self.api.get_examples(prefetch=2, max_examples=6))), 6)
+
+    def test__first_page_is_requested_once(self):
+        self.assertEqual(self.api.total_pages, 2)
+        list(self.api.get_translations())
+        list(self.api.get_examples(max_pages=1))
+        self.assertEqual(len(self.transport.requests), 1)
+
+        self.api.source_text = "Git"
+        list(self.api.get_translations())
+        self.assertEqual(len(self.transport.requests), 2)
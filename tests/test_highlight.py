@@ -0,0 +1,38 @@
+import json
+import unittest
+
+from reverso_api.context import WordUsageContext, _parse_context, _parse_context_soup
+
+from .fakes import read_page
+
+SAMPLES = [
+    "<em>This</em> is <em>a sample</em> string",
+    "  leading whitespace <em>is</em> dropped",
+    "<em>a</em> <em>b</em>",
+    "a &amp; <em>b&nbsp;c</em> &foo; &#0; &#150;",
+    "<em></em>empty",
+    "a < b <em>c</em>",
+    "<em>a<em>b</em>c</em>",
+    "<EM>upper</EM> <b>bold</b>",
+    "<em>  </em>&#9;<em>a</em>",
+    "﻿bom <em>x</em>",
+    "carriage\r\nreturn <em>x</em>",
+    "trailing <em>x</em>  ",
+    "",
+]
+
+
+class TestParseContext(unittest.TestCase):
+    def test__docstring_example(self):
+        self.assertEqual(_parse_context("<em>This</em> is <em>a sample</em> string"),
+                         WordUsageContext("This is a sample string", ((0, 4), (8, 16))))
+
+    def test__same_as_beautifulsoup(self):
+        markups = list(SAMPLES)
+        for npage in (1, 2):
+            for example in json.loads(read_page(npage))["list"]:
+                markups.extend((example["s_text"], example["t_text"]))
+
+        for markup in markups:
+            with self.subTest(markup=markup):
+                self.assertEqual(_parse_context(markup), _parse_context_soup(markup))
@@ -0,0 +1,66 @@
+import importlib
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import reverso_api
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# the budget is generous, so that the test isn't flaky on slow machines, but it still catches eager imports
+# of requests, BeautifulSoup or lxml, which take several times longer
+IMPORT_BUDGET = 0.05
+
+
+def run_isolated(code):
+    """Runs the code in a fresh interpreter and returns the JSON it prints."""
+
+    output = subprocess.check_output([sys.executable, "-c", code], cwd=PACKAGE_DIR)
+    return json.loads(output)
+
+
+class TestImports(unittest.TestCase):
+    def test__all(self):
+        for name, submodule in reverso_api._NAMES.items():
+            module = importlib.import_module("reverso_api." + submodule)
+            self.assertIn(name, module.__all__)
+            self.assertIs(getattr(reverso_api, name), getattr(module, name))
+        with self.assertRaises(AttributeError):
+            reverso_api.NoSuchName
+
+    def test__submodules(self):
+        modules = run_isolated("import json, sys\n"
+                               "import reverso_api\n"
+                               "api = reverso_api.voice.ReversoVoiceAPI\n"
+                               "print(json.dumps([reverso_api.voice.__name__, reverso_api.context.__name__,\n"
+                               "                  api is reverso_api.ReversoVoiceAPI]))")
+        self.assertEqual(modules, ["reverso_api.voice", "reverso_api.context", True])
+        for submodule in reverso_api._SUBMODULES:
+            self.assertIs(getattr(reverso_api, submodule), importlib.import_module("reverso_api." + submodule))
+            self.assertIn(submodule, dir(reverso_api))
+
+    def test__lazy_imports(self):
+        modules = run_isolated("import json, sys\n"
+                               "import reverso_api\n"
+                               "bare = sorted(sys.modules)\n"
+                               "from reverso_api import ReversoVoiceAPI\n"
+                               "print(json.dumps([bare, sorted(sys.modules)]))")
+        bare, voice = map(set, modules)
+        self.assertFalse({"requests", "bs4", "lxml", "reverso_api.context", "reverso_api.voice"} & bare)
+        self.assertFalse({"bs4", "lxml", "reverso_api.context"} & voice)
+
+    def test__no_asyncio(self):
+        modules = run_isolated("import json, sys\n"
+                               "from reverso_api.voice import ReversoVoiceAPI\n"
+                               "from reverso_api.context import ReversoContextAPI\n"
+                               "print(json.dumps(sorted(sys.modules)))")
+        self.assertNotIn("asyncio", modules)
+
+    def test__import_time(self):
+        seconds = run_isolated("import json, time\n"
+                               "started_at = time.perf_counter()\n"
+                               "import reverso_api\n"
+                               "print(json.dumps(time.perf_counter() - started_at))")
+        self.assertLess(seconds, IMPORT_BUDGET)
@@ -0,0 +1,59 @@
+import unittest
+
+from reverso_api.catalog import CatalogCache
+from reverso_api.context import ReversoContextAPI, LanguageIndex, get_language_index
+from reverso_api.voice import ReversoVoiceAPI, Voice, get_voice_index, get_voices
+
+from .fakes import CATALOG, FakeTransport
+
+
+class TestLanguageIndex(unittest.TestCase):
+    def test__index(self):
+        index = LanguageIndex({"source_lang": ["en", "ru", "fr"], "target_lang": ["en", "ru"]})
+        self.assertIn(("fr", "ru"), index)
+        self.assertNotIn(("en", "en"), index)
+        self.assertNotIn(("ru", "fr"), index)
+        index.validate("en", "ru")
+        for pair in (("en", "en"), ("xx", "en"), ("en", "xx")):
+            with self.assertRaises(ValueError):
+                index.validate(*pair)
+
+    def test__shared_and_offline(self):
+        transport = FakeTransport()
+        self.assertIs(get_language_index(transport, CATALOG), get_language_index(transport, CATALOG))
+        self.assertEqual(transport.requests, [])
+
+    def test__setters(self):
+        api = ReversoContextAPI("GitHub", "", "en", "ru", transport=FakeTransport(), catalog=CATALOG)
+        api.source_lang = "en"  # setting the same language again is fine
+        with self.assertRaises(ValueError):
+            api.source_lang = "ru"
+        with self.assertRaises(ValueError):
+            api.target_lang = "en"
+        api.swap_langs()
+        self.assertEqual((api.source_lang, api.target_lang), ("ru", "en"))
+
+
+class TestVoiceIndex(unittest.TestCase):
+    def test__index(self):
+        index = get_voice_index(FakeTransport(), CATALOG)
+        self.assertIs(index, get_voice_index(FakeTransport(), CATALOG))
+        self.assertEqual(index.by_name["Mark22k"], Voice("Mark22k", (1033, "US English"), "M"))
+        self.assertEqual([voice.name for voice in index.find("US English", "F")], ["Heather22k"])
+        self.assertEqual([voice.name for voice in index.find(gender="M")], ["Mark22k"])
+        self.assertEqual(len(index.find("US English")), 2)
+        self.assertEqual(index.find("Klingon"), ())
+        self.assertEqual(get_voices(FakeTransport(), CATALOG), {"US English": list(index.by_language["US English"])})
+
+    def test__setter(self):
+        api = ReversoVoiceAPI("Hello", "Heather22k", transport=FakeTransport(), catalog=CATALOG)
+        api.voice = api.voice_index.find(gender="M")[0]
+        self.assertEqual(api.voice, "Mark22k")
+        with self.assertRaises(AssertionError):
+            api.voice = "NoSuchVoice"
+
+    def test__new_catalog(self):
+        catalog = CatalogCache(snapshot={"voices": [{"Name": "Tyler22k", "Language": "Australian English",
+                                                     "LangCode": "3081", "Gender": "M"}]})
+        self.assertIn("Tyler22k", get_voice_index(FakeTransport(), catalog))
+        self.assertNotIn("Tyler22k", get_voice_index(FakeTransport(), CATALOG))
@@ -0,0 +1,64 @@
+import unittest
+
+from .mock_server import MockReversoServer
+from reverso_api import instrumentation
+from reverso_api.cache import MemoryCache
+from reverso_api.catalog import CatalogCache
+from reverso_api.context import ReversoContextAPI
+
+try:
+    import prometheus_client
+except ImportError:
+    prometheus_client = None
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.events = []
+        instrumentation.add_hook(self.events.append)
+
+    def tearDown(self):
+        instrumentation.remove_hook(self.events.append)
+
+    def test__events(self):
+        with MockReversoServer(npages=2) as server:
+            api = ReversoContextAPI("GitHub", "", "en", "ru", transport=server.transport(), catalog=CatalogCache(),
+                                    cache=MemoryCache())
+            list(api.get_examples())
+            api.source_text = "GitHub"
+            list(api.get_translations())
+
+        names = [event.name for event in self.events]
+        self.assertEqual(names.count("http.request"), 3)
+        self.assertEqual(names.count("parse.langs"), 1)
+        self.assertEqual(names.count("parse.examples"), 2)
+        self.assertEqual(names.count("parse.json"), 3)
+
+        request = next(event for event in self.events if event.name == "http.request")
+        self.assertEqual((request.attributes["method"], request.attributes["status_code"]), ("GET", 200))
+        self.assertGreater(request.attributes["bytes"], 0)
+        self.assertEqual([event.attributes["hit"] for event in self.events if event.name == "cache.get"],
+                         [False, False, True])
+
+    def test__broken_hook(self):
+        def broken_hook(event):
+            raise ZeroDivisionError
+
+        instrumentation.add_hook(broken_hook)
+        try:
+            with instrumentation.timer("test") as attributes:
+                attributes["value"] = 42
+        finally:
+            instrumentation.remove_hook(broken_hook)
+        self.assertEqual(self.events[-1].attributes, {"value": 42})
+
+    @unittest.skipIf(prometheus_client is None, "prometheus_client is not installed")
+    def test__prometheus(self):
+        registry = prometheus_client.CollectorRegistry()
+        hook = instrumentation.PrometheusHook(registry)
+        hook(instrumentation.Event("http.request", 0.1, {"method": "GET", "bytes": 100, "retries": 1}))
+        hook(instrumentation.Event("cache.get", 0.0, {"cache": "MemoryCache", "hit": True}))
+        self.assertEqual(registry.get_sample_value("reverso_http_bytes_total", {"method": "GET"}), 100)
+        self.assertEqual(registry.get_sample_value("reverso_cache_lookups_total",
+                                                   {"cache": "MemoryCache", "result": "hit"}), 1)
+        self.assertEqual(registry.get_sample_value("reverso_operation_seconds_count", {"operation": "http.request"}), 1)
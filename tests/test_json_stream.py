@@ -0,0 +1,87 @@
+import json
+import unittest
+
+from reverso_api import context, instrumentation
+from reverso_api.cache import MemoryCache
+from reverso_api.context import ContextClient, Query, _iter_json_array
+
+from .fakes import CATALOG, FakeTransport, read_page
+
+
+def split(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestJSONStream(unittest.TestCase):
+    """Offline tests of the incremental decoding of the bst-query-service pages"""
+
+    def decode(self, data, size):
+        members = {}
+        items = list(_iter_json_array(split(data, size), "list", members))
+        return items, members
+
+    def test__page(self):
+        data = read_page(1)
+        page = json.loads(data)
+        expected = page.pop("list")
+        for size in (1, 7, len(data)):
+            self.assertEqual(self.decode(data, size), (expected, page))
+
+    def test__values(self):
+        data = b' { "a" : 12345 , "list" : [ 1 , 22.5e1 , {"x": [true, null]} ] , "b": -1.5 , "c": "\\u0442\xd1\x82"}'
+        for size in (1, 2, 3, len(data)):
+            self.assertEqual(self.decode(data, size), ([1, 225.0, {"x": [True, None]}], {"a": 12345, "b": -1.5,
+                                                                                           "c": "\u0442\u0442"}))
+        self.assertEqual(self.decode(b"{}", 1), ([], {}))
+        self.assertEqual(self.decode(b'{"list": [], "npages": 0}', 1), ([], {"npages": 0}))
+
+    def test__invalid(self):
+        for data in (b'{"list": [1, 2', b'[1, 2]', b'{"list": [1 2]}', b""):
+            with self.assertRaises(ValueError):
+                self.decode(data, 3)
+
+    def test__get_examples(self):
+        query = Query("GitHub", "", "en", "ru")
+        client = ContextClient(FakeTransport(), CATALOG, cache=MemoryCache())
+        expected = list(ContextClient(FakeTransport(), CATALOG).get_examples(query))
+
+        chunk_size, context.STREAM_CHUNK_SIZE = context.STREAM_CHUNK_SIZE, 5
+        try:
+            self.assertEqual(list(client.get_examples(query, stream=True)), expected)
+            self.assertEqual(list(client.get_examples(query, max_examples=6, stream=True)), expected[:6])
+            self.assertEqual(list(client.get_examples(query, max_pages=1, stream=True)), expected[:5])
+        finally:
+            context.STREAM_CHUNK_SIZE = chunk_size
+
+        transport = client.transport
+        nrequests = len(transport.requests)
+        self.assertEqual(list(client.get_examples(query, stream=True)), expected)  # from the cache
+        self.assertEqual(len(transport.requests), nrequests)
+
+        with self.assertRaises(ValueError):
+            next(client.get_examples(query, prefetch=2, stream=True))
+
+    def test__max_pages(self):
+        query = Query("GitHub", "", "en", "ru")
+        client = ContextClient(FakeTransport(), CATALOG)
+        for max_pages in (0, 1, 2, 3):
+            self.assertEqual(list(client.get_examples(query, max_pages=max_pages, stream=True)),
+                             list(client.get_examples(query, max_pages=max_pages)))
+        self.assertEqual(list(client.get_examples(query, max_pages=0, stream=True)), [])
+
+    def test__instrumentation(self):
+        query, events = Query("GitHub", "", "en", "ru"), []
+        client = ContextClient(FakeTransport(), CATALOG, cache=MemoryCache())
+        instrumentation.add_hook(events.append)
+        try:
+            for _ in range(2):  # downloaded, then cached
+                list(client.get_examples(query, stream=True))
+        finally:
+            instrumentation.remove_hook(events.append)
+
+        parsed = [event for event in events if event.name == "parse.examples"]
+        self.assertEqual([event.attributes["examples"] for event in parsed], [5, 3, 5, 3])
+        self.assertTrue(all(event.seconds >= 0 for event in parsed))
+        self.assertEqual([event.attributes["hit"] for event in events if event.name == "cache.get"],
+                         [False, False, True, True])
+
@@ -0,0 +1,31 @@
+import os
+import unittest
+
+from .mock_server import MockReversoServer
+from reverso_api.catalog import CatalogCache
+from reverso_api.context import ReversoContextAPI
+from reverso_api.voice import ReversoVoiceAPI
+
+
+class TestMockServer(unittest.TestCase):
+    """End-to-end tests of the APIs over real HTTP, against the local mock server of the benchmarks"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockReversoServer(npages=3)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def test__context(self):
+        api = ReversoContextAPI("GitHub", "", "en", "ru", transport=self.server.transport(), catalog=CatalogCache())
+        self.assertIn("fr", api.supported_langs["target_lang"])
+        self.assertEqual(api.total_pages, 3)
+        self.assertEqual(len(list(api.get_examples(prefetch=2))), 13)
+
+    def test__voice(self):
+        api = ReversoVoiceAPI("Hello, World!", "Heather22k", transport=self.server.transport(), catalog=CatalogCache())
+        with open(os.path.join(os.path.dirname(__file__), "data", "voice", "hello_world_us.mp3"), "rb") as fp:
+            self.assertEqual(api.mp3_data, fp.read())
@@ -0,0 +1,63 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+from reverso_api.context import ReversoContextAPI, ContextClient, Query
+from reverso_api.crawler import CrawlCheckpoint, Crawler, JSONLWriter
+from reverso_api.pipeline import ParsePool
+
+from .fakes import CATALOG, FakeTransport, read_page
+
+
+class TestParsePool(unittest.TestCase):
+    """Offline tests of the process-pool parsing on the recorded pages"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = ParsePool(max_workers=2, batch_size=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.close()
+
+    def setUp(self):
+        self.query = Query("GitHub", "", "en", "ru")
+        self.expected = [list(batch) for batch in
+                         ContextClient(FakeTransport(), CATALOG).get_example_batches(self.query)]
+
+    def test__start_method(self):
+        self.assertNotEqual(self.pool.mp_context.get_start_method(), "fork")
+
+    def test__map(self):
+        raw_pages = [read_page(npage % 2 + 1).decode() for npage in range(9)]
+        batches = list(self.pool.map(iter(raw_pages)))
+        self.assertEqual([list(batch) for batch in batches], [self.expected[npage % 2] for npage in range(9)])
+        self.assertEqual(list(self.pool.map([])), [])
+        self.assertEqual([list(batch) for batch in self.pool.parse(raw_pages[:1]).result()], self.expected[:1])
+
+    def test__get_example_batches(self):
+        client = ContextClient(FakeTransport(), CATALOG)
+        for prefetch in (0, 2):
+            batches = client.get_example_batches(self.query, prefetch, parse_pool=self.pool)
+            self.assertEqual([list(batch) for batch in batches], self.expected)
+        batches = client.get_example_batches(self.query, start_page=2, parse_pool=self.pool)
+        self.assertEqual([list(batch) for batch in batches], self.expected[1:])
+
+        api = ReversoContextAPI("GitHub", "", "en", "ru", transport=FakeTransport(), catalog=CATALOG)
+        self.assertEqual([list(batch) for batch in api.get_example_batches(parse_pool=self.pool)], self.expected)
+
+    def test__pickled_compactly(self):
+        batch = next(ContextClient(FakeTransport(), CATALOG).get_example_batches(self.query))
+        copy = pickle.loads(pickle.dumps(batch))
+        self.assertEqual(list(copy), list(batch))
+        self.assertEqual(copy.source.text, batch.source.text)
+
+    def test__crawler(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "examples.jsonl")
+            with JSONLWriter(path) as writer, CrawlCheckpoint(os.path.join(directory, "checkpoint")) as checkpoint:
+                stats = Crawler([("GitHub", "en", "ru"), ("Git", "ru", "en")], writer, checkpoint,
+                                transport=FakeTransport(), catalog=CATALOG, parse_pool=self.pool).run()
+            self.assertEqual(stats.pages, 4)
+            self.assertEqual(stats.examples, 2 * sum(map(len, self.expected)))
@@ -0,0 +1,127 @@
+import tempfile
+import time
+import unittest
+from concurrent.futures import CancelledError
+
+from reverso_api.cache import AudioCache
+from reverso_api.playback import NullSink, PlaybackQueue
+from reverso_api.voice import ReversoVoiceAPI
+
+from .fakes import CATALOG, FakeTransport
+
+
+class SlowTransport(FakeTransport):
+    """Responds with the text of the phrase as its MP3 data after a delay."""
+
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+
+    def get(self, url, **kwargs):
+        time.sleep(self.delay)
+        response = super().get(url, **kwargs)
+        response.content = url.encode()
+        return response
+
+
+class TestPlaybackQueue(unittest.TestCase):
+    """Offline tests of PlaybackQueue with a NullSink"""
+
+    def test__order(self):
+        sink = NullSink()
+        phrases = [("phrase {}".format(i), "Heather22k" if i % 2 else "Mark22k") for i in range(6)]
+        with PlaybackQueue(sink, prefetch=4, transport=SlowTransport(0.01), catalog=CATALOG) as playback:
+            futures = playback.extend(phrases)
+        self.assertTrue(all(future.done() for future in futures))
+        expected = [ReversoVoiceAPI(text, voice, transport=SlowTransport(0), catalog=CATALOG).mp3_data
+                    for text, voice in phrases]
+        self.assertEqual(sink.played, expected)
+
+    def test__back_to_back(self):
+        # every phrase takes 0.1 s to download and 0.1 s to play, so it's 0.8 s without prefetching
+        sink = NullSink(duration=0.1)
+        started_at = time.monotonic()
+        with PlaybackQueue(sink, prefetch=4, transport=SlowTransport(0.1), catalog=CATALOG) as playback:
+            playback.extend(("phrase {}".format(i), "Heather22k") for i in range(4))
+            self.assertLess(time.monotonic() - started_at, 0.05)  # put() doesn't block
+            playback.join()
+        self.assertLess(time.monotonic() - started_at, 0.7)
+        self.assertEqual(len(sink.played), 4)
+
+    def test__cold_catalog(self):
+        class SlowCatalog(object):
+            def get(self, name, fetch):
+                time.sleep(0.2)
+                return CATALOG.get(name, fetch)
+
+        sink = NullSink()
+        started_at = time.monotonic()
+        with PlaybackQueue(sink, transport=SlowTransport(0), catalog=SlowCatalog()) as playback:
+            future = playback.put("Hello", "Heather22k")
+            self.assertLess(time.monotonic() - started_at, 0.1)  # put() doesn't wait for the voices
+        self.assertIsNone(future.result())
+        self.assertEqual(len(sink.played), 1)
+
+    def test__errors(self):
+        sink = NullSink()
+        playback = PlaybackQueue(sink, transport=SlowTransport(0), catalog=CATALOG)
+        self.assertIsInstance(playback.put("Hello", "NoSuchVoice").exception(), AssertionError)
+
+        class BrokenSink(NullSink):
+            def play(self, source):
+                if source == broken:
+                    raise OSError("cannot play")
+                super().play(source)
+
+        broken = ReversoVoiceAPI("broken", "Mark22k", transport=SlowTransport(0), catalog=CATALOG).mp3_data
+
+        playback.sink = BrokenSink()
+        futures = playback.extend([("broken", "Mark22k"), ("fine", "Mark22k")])
+        playback.join()
+        self.assertIsInstance(futures[0].exception(), OSError)
+        self.assertIsNone(futures[1].result())
+        self.assertEqual(len(playback.sink.played), 1)
+
+        playback.close()
+        with self.assertRaises(RuntimeError):
+            playback.put("Hello", "Mark22k")
+
+    def test__cancel(self):
+        sink = NullSink(duration=0.1)
+        with PlaybackQueue(sink, transport=SlowTransport(0), catalog=CATALOG) as playback:
+            first, second = playback.extend([("first", "Mark22k"), ("second", "Mark22k")])
+            self.assertTrue(second.cancel())
+        self.assertIsNone(first.result())
+        with self.assertRaises(CancelledError):
+            second.result()
+        self.assertEqual(len(sink.played), 1)
+
+    def test__say(self):
+        sink = NullSink()
+        ReversoVoiceAPI("Hello", "Heather22k", transport=FakeTransport(), catalog=CATALOG).say(wait=True, sink=sink)
+        self.assertEqual(sink.played, [b"mp3"])
+
+    def test__say_sources(self):
+        class ReadingSink(NullSink):
+            """Reads the source the way a third-party sink would: bytes as they are, or a filename."""
+
+            def play(self, source):
+                types.append(type(source))
+                if isinstance(source, str):
+                    with open(source, "rb") as fp:
+                        source = fp.read()
+                super().play(source)
+
+        types = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            audio_cache = AudioCache(tmpdir)
+            sink = ReadingSink()
+            for _ in range(2):  # downloaded (bytes), then cached (a filename)
+                api = ReversoVoiceAPI("Hello", "Heather22k", transport=FakeTransport(), catalog=CATALOG,
+                                      audio_cache=audio_cache)
+                api.say(wait=True, sink=sink)
+        self.assertEqual(types, [bytes, str])
+        self.assertEqual(sink.played, [b"mp3", b"mp3"])
+
+    def test__close_unused(self):
+        PlaybackQueue(NullSink(), transport=FakeTransport(), catalog=CATALOG).close()
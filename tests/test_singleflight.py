@@ -0,0 +1,92 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from reverso_api.context import ReversoContextAPI
+from reverso_api.singleflight import SingleFlight, AsyncSingleFlight
+from reverso_api.voice import ReversoVoiceAPI
+
+from .fakes import CATALOG, FakeTransport, FakeAsyncTransport
+
+try:
+    from reverso_api.aio import AsyncReversoVoiceAPI
+except ImportError:
+    AsyncReversoVoiceAPI = None
+
+
+class SlowTransport(FakeTransport):
+    def get(self, url, **kwargs):
+        time.sleep(0.05)
+        return super().get(url, **kwargs)
+
+    def post(self, url, data, **kwargs):
+        time.sleep(0.05)
+        return super().post(url, data, **kwargs)
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test__do(self):
+        flights, calls = SingleFlight(), []
+
+        def fn():
+            calls.append(None)
+            time.sleep(0.05)
+            return object()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: flights.do("key", fn), range(8)))
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(len(flights), 0)
+
+    def test__errors(self):
+        flights = SingleFlight()
+        with self.assertRaises(ZeroDivisionError):
+            flights.do("key", lambda: 1 / 0)
+        self.assertEqual(flights.do("key", lambda: 42), 42)
+
+    def test__context(self):
+        transport = SlowTransport()
+
+        def get_translations(_):
+            api = ReversoContextAPI("GitHub", "", "en", "ru", transport=transport, catalog=CATALOG)
+            return list(api.get_translations())
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(get_translations, range(8)))
+        self.assertEqual(len(transport.requests), 1)
+        self.assertTrue(all(result == results[0] for result in results))
+
+    def test__voice(self):
+        transport = SlowTransport()
+        apis = [ReversoVoiceAPI("Hello", "Heather22k", transport=transport, catalog=CATALOG) for _ in range(8)]
+        threads = [threading.Thread(target=lambda api=api: api.mp3_data) for api in apis]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(transport.requests), 1)
+
+
+class TestAsyncSingleFlight(unittest.IsolatedAsyncioTestCase):
+    async def test__do(self):
+        flights, calls = AsyncSingleFlight(), []
+
+        async def fn():
+            calls.append(None)
+            await asyncio.sleep(0.01)
+            return 42
+
+        self.assertEqual(await asyncio.gather(*(flights.do("key", fn) for _ in range(8))), [42] * 8)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(flights), 0)
+
+    @unittest.skipIf(AsyncReversoVoiceAPI is None, "aiohttp is not installed")
+    async def test__voice(self):
+        transport = FakeAsyncTransport()
+        apis = [await AsyncReversoVoiceAPI.create("Hello", "Heather22k", transport=transport, catalog=CATALOG)
+                for _ in range(8)]
+        self.assertEqual(await asyncio.gather(*(api.mp3_data() for api in apis)), [b"mp3"] * 8)
+        self.assertEqual(len(transport.requests), 1)
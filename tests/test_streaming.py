@@ -0,0 +1,69 @@
+import io
+import socket
+import tempfile
+import threading
+import unittest
+
+from reverso_api.cache import AudioCache
+from reverso_api.voice import ReversoVoiceAPI
+
+from .fakes import CATALOG, FakeTransport
+
+MP3_DATA = bytes(range(256)) * 1024
+
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        self.transport = FakeTransport(MP3_DATA)
+        self.api = ReversoVoiceAPI("Hello, World!", "Heather22k", transport=self.transport, catalog=CATALOG)
+
+    def test__iter_mp3(self):
+        chunks = list(self.api.iter_mp3(chunk_size=1000))
+        self.assertTrue(all(len(chunk) <= 1000 for chunk in chunks))
+        self.assertEqual(b"".join(chunks), MP3_DATA)
+
+    def test__downloaded_once(self):
+        for _ in range(2):
+            self.api.write_to_file(io.BytesIO())
+            self.assertEqual(self.api.mp3_data, MP3_DATA)
+        self.assertEqual(len(self.transport.requests), 1)
+
+        next(self.api.iter_mp3())  # the phrase is in memory now, so it's not downloaded again
+        self.api.text = "Bye!"
+        stream = self.api.iter_mp3()
+        next(stream)
+        stream.close()  # an interrupted stream is not remembered
+        self.assertEqual(b"".join(self.api.iter_mp3()), MP3_DATA)
+        self.assertEqual(len(self.transport.requests), 3)
+
+    def test__write_to_socket(self):
+        sender, receiver = socket.socketpair()
+        received = []
+        with receiver, receiver.makefile("rb") as fp:
+            reader = threading.Thread(target=lambda: received.append(fp.read()))
+            reader.start()
+            with sender:
+                self.api.write_to_file(sender)
+            reader.join()
+        self.assertEqual(received, [MP3_DATA])
+
+    def test__write_to_file(self):
+        with io.BytesIO() as fp:
+            self.api.write_to_file(fp)
+            self.assertEqual(fp.getvalue(), MP3_DATA)
+        with self.assertRaises(TypeError):
+            self.api.write_to_file(42)
+
+    def test__interrupted_download_is_not_cached(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            audio_cache = AudioCache(tmpdir)
+            api = ReversoVoiceAPI("Hello, World!", "Heather22k",
+                                  transport=self.transport, catalog=CATALOG, audio_cache=audio_cache)
+
+            chunks = api.iter_mp3(chunk_size=1000)
+            next(chunks)
+            chunks.close()
+            self.assertEqual(len(audio_cache), 0)
+
+            self.assertEqual(b"".join(api.iter_mp3()), MP3_DATA)
+            self.assertEqual(len(audio_cache), 1)
@@ -0,0 +1,42 @@
+import io
+import os
+import tempfile
+import unittest
+
+from reverso_api.voice import SynthesisJob, synthesize_many
+
+from .fakes import CATALOG, FakeTransport
+
+
+class TestSynthesizeMany(unittest.TestCase):
+    def setUp(self):
+        self.transport = FakeTransport()
+
+    def test__synthesize_many(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "hello.mp3")
+            fp, received = io.BytesIO(), []
+            jobs = [SynthesisJob("Hello", "Heather22k", 100, filename),
+                    ("Hello", "Heather22k", 100, fp),
+                    ("Bye", "Mark22k", 150, received.append)]
+
+            results = list(synthesize_many(jobs, max_workers=2, transport=self.transport, catalog=CATALOG))
+            self.assertEqual(sorted(result.job.text for result in results), ["Bye", "Hello", "Hello"])
+            self.assertTrue(all(result.error is None and result.latency >= 0 for result in results))
+            self.assertEqual(len(self.transport.requests), 2)
+
+            with open(filename, "rb") as file:
+                self.assertEqual(file.read(), b"mp3")
+            self.assertEqual(fp.getvalue(), b"mp3")
+            self.assertEqual(received, [b"mp3"])
+
+    def test__errors_are_isolated(self):
+        jobs = [("Hello", "NoSuchVoice", 100, io.BytesIO()),
+                ("Hello", "Heather22k", 100, 42),
+                ("Hello", "Heather22k", 100, io.BytesIO())]
+        results = {result.job: result for result in synthesize_many(jobs, transport=self.transport, catalog=CATALOG)}
+        self.assertEqual(len(self.transport.requests), 1)
+        self.assertIsInstance(results[jobs[0]].error, AssertionError)
+        self.assertIsInstance(results[jobs[1]].error, TypeError)
+        self.assertIsNone(results[jobs[2]].error)
+        self.assertEqual(jobs[2][3].getvalue(), b"mp3")
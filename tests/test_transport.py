@@ -0,0 +1,83 @@
+import gc
+import io
+import unittest
+import threading
+import time
+
+import requests
+
+from reverso_api.transport import Transport, RateLimiter, AdaptiveConcurrency, get_default_transport, set_default_transport
+
+
+class FakeSession:
+    def __init__(self, status_codes):
+        self.status_codes = iter(status_codes)
+
+    def request(self, method, url, **kwargs):
+        response = requests.Response()
+        response.status_code = next(self.status_codes)
+        response.raw = io.BytesIO(b"body")
+        return response
+
+
+class TestTransport(unittest.TestCase):
+    def test__session_per_thread(self):
+        transport = Transport(pool_size=2)
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(transport.session))
+        thread.start()
+        thread.join()
+        self.assertIs(transport.session, transport.session)
+        self.assertIsNot(transport.session, sessions[0])
+
+    def test__default_transport(self):
+        self.assertIs(get_default_transport(), get_default_transport())
+        transport = Transport()
+        set_default_transport(transport)
+        self.assertIs(get_default_transport(), transport)
+        with self.assertRaises(TypeError):
+            set_default_transport(object())
+
+    def test__rate_limiter(self):
+        rate_limiter = RateLimiter(100, burst=5)
+        started_at = time.monotonic()
+        for _ in range(15):
+            rate_limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.09)
+
+    def test__adaptive_concurrency(self):
+        concurrency = AdaptiveConcurrency(initial=4, maximum=5, latency_target=1)
+        transport = Transport(session=FakeSession([200] * 8 + [429, 200, 503]), concurrency=concurrency)
+
+        for _ in range(8):
+            transport.get("https://example.com/")
+        self.assertEqual(concurrency.limit, 5)
+
+        with self.assertRaises(requests.HTTPError):
+            transport.get("https://example.com/")
+        self.assertEqual(concurrency.limit, 2)
+        self.assertEqual(concurrency.in_flight, 0)
+
+        concurrency.acquire()
+        concurrency.release(200, 2)  # too slow
+        self.assertEqual(concurrency.limit, 1)
+
+    def test__streamed_requests_hold_the_slot(self):
+        concurrency = AdaptiveConcurrency(initial=4, latency_target=0.05)
+        transport = Transport(session=FakeSession([200, 200, 503]), concurrency=concurrency)
+
+        with transport.get("https://example.com/", stream=True) as response:
+            self.assertEqual(concurrency.in_flight, 1)
+            time.sleep(0.1)  # reading the body takes longer than the latency target
+        self.assertEqual(concurrency.in_flight, 0)
+        self.assertLess(concurrency.limit, 4)
+        response.close()  # the slot is released only once
+        self.assertEqual(concurrency.in_flight, 0)
+
+        transport.get("https://example.com/", stream=True)  # not closed, but garbage collected
+        gc.collect()
+        self.assertEqual(concurrency.in_flight, 0)
+
+        with self.assertRaises(requests.HTTPError):
+            transport.get("https://example.com/", stream=True)
+        self.assertEqual(concurrency.in_flight, 0)
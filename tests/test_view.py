@@ -0,0 +1,72 @@
+import json
+import unittest
+
+from reverso_api.context import ReversoContextAPI, ContextClient, Query
+
+from .fakes import CATALOG, FakeTransport
+
+
+class RecordingTransport(FakeTransport):
+    """Also records the numbers of the requested pages."""
+
+    def __init__(self):
+        super().__init__()
+        self.npages = []
+
+    def post(self, url, data, **kwargs):
+        self.npages.append(json.loads(data).get("npage", 1))
+        return super().post(url, data, **kwargs)
+
+
+class TestExampleView(unittest.TestCase):
+    """Offline tests of ExampleView on the recorded pages (8 examples, 5 per page)"""
+
+    def setUp(self):
+        self.transport = RecordingTransport()
+        self.view = ContextClient(self.transport, CATALOG).get_example_view(Query("GitHub", "", "en", "ru"))
+        self.examples = list(ReversoContextAPI("GitHub", "", "en", "ru", transport=FakeTransport(),
+                                               catalog=CATALOG).get_examples())
+
+    def test__lazy(self):
+        self.assertEqual(self.transport.npages, [])
+        self.assertEqual((len(self.view), self.view.total_pages, self.view.page_size), (8, 2, 5))
+        self.assertEqual(self.transport.npages, [1])
+        self.assertEqual(self.view.cached_pages(), [])
+
+    def test__indexing(self):
+        self.assertEqual(self.view[6], self.examples[6])
+        self.assertEqual(self.view[-1], self.examples[-1])
+        self.assertEqual(self.view.cached_pages(), [2])
+        self.assertEqual(self.view[0], self.examples[0])
+        for i in (8, -9):
+            with self.assertRaises(IndexError):
+                self.view[i]
+        self.assertEqual(self.transport.npages, [1, 2])
+
+    def test__slicing(self):
+        self.assertEqual(self.view[6:8], self.examples[6:8])
+        self.assertEqual(self.view.cached_pages(), [2])
+        self.assertEqual(self.view[3:100], self.examples[3:100])
+        self.assertEqual(self.view[::-3], self.examples[::-3])
+        self.assertEqual(self.view[5:5], [])
+        self.assertEqual(list(self.view), self.examples)
+        self.assertEqual(self.transport.npages, [1, 2])
+
+    def test__pages(self):
+        self.assertEqual(self.view.page(2), tuple(self.examples[5:]))
+        self.assertIs(self.view.page(2), self.view.page(2))
+        with self.assertRaises(IndexError):
+            self.view.page(3)
+
+    def test__prefetch(self):
+        view = ContextClient(self.transport, CATALOG).get_example_view(("GitHub", "", "en", "ru"), prefetch=2)
+        self.assertEqual(view[:], self.examples)
+        self.assertEqual(sorted(self.transport.npages), [1, 2])
+
+    def test__api_view(self):
+        transport = RecordingTransport()
+        api = ReversoContextAPI("GitHub", "", "en", "ru", transport=transport, catalog=CATALOG)
+        self.assertEqual(api.total_pages, 2)
+        view = api.get_example_view()
+        self.assertEqual(view[0], self.examples[0])
+        self.assertEqual(transport.npages, [1])  # the first page of the API is reused